@@ -0,0 +1,131 @@
+"""Benchmark of MCP tool discovery at startup.
+
+Simulates MCP servers connecting and answering list_tools with a fixed
+latency and measures startup in the order of the app lifespan,
+MCP2ToolConverter.open() followed by build_tools_from_mcp(). Servers
+listed one after another (as the single client did before) are compared
+with concurrent discovery without cache, a warm start from the tool
+catalog cache, and both with one server that never finishes connecting.
+Tool models are built with the real jambo SchemaConverter.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from types import SimpleNamespace
+
+from sgr_deep_research.services import mcp_service
+from sgr_deep_research.services.mcp_service import MCP2ToolConverter
+from sgr_deep_research.settings import MCPConfig
+
+
+class SlowServerClient:
+    """MCP client stand-in listing tools after a delay."""
+
+    def __init__(self, tools: list, latency: float, connect_latency: float):
+        self.tools = tools
+        self.latency = latency
+        self.connect_latency = connect_latency
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.connect_latency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def list_tools(self):
+        await asyncio.sleep(self.latency)
+        return self.tools
+
+
+def make_tools(server: str, count: int) -> list:
+    schema = {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "Search query"},
+            "limit": {"type": "integer", "description": "Maximum results"},
+            "filters": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["query"],
+    }
+    return [
+        SimpleNamespace(name=f"{server}_tool_{i}", description=f"Tool {i} of {server}", inputSchema=dict(schema))
+        for i in range(count)
+    ]
+
+
+def make_converter(
+    servers: int, tools: int, latency: float, cache_path: str, timeout: float, hanging: bool = False
+) -> MCP2ToolConverter:
+    names = [f"server{i}" for i in range(servers)]
+    mcp_config = MCPConfig(
+        transport_config={"mcpServers": {name: {"url": f"https://mcp.example/{name}"} for name in names}},
+        health_check_interval=0,
+        discovery_timeout=timeout,
+        tool_cache_path=cache_path,
+        tool_refresh_interval=0,
+    )
+    clients = {name: SlowServerClient(make_tools(name, tools), latency, latency) for name in names}
+    if hanging:
+        clients[names[-1]].connect_latency = 3600
+    mcp_service.get_config = lambda: SimpleNamespace(mcp=mcp_config)
+    mcp_service.Client = lambda server: clients[next(iter(server["mcpServers"]))]
+    MCP2ToolConverter._instances.pop(MCP2ToolConverter, None)
+    return MCP2ToolConverter()
+
+
+async def sequential_build(mcp: MCP2ToolConverter):
+    for server in mcp.sessions:
+        await mcp._refresh_server(server)
+    mcp._update_toolkit()
+
+
+async def lifespan_startup(mcp: MCP2ToolConverter):
+    await mcp.open()
+    await mcp.build_tools_from_mcp()
+
+
+async def timed(build, mcp: MCP2ToolConverter) -> tuple[float, int]:
+    """Seconds of startup and number of tools built."""
+    started = time.perf_counter()
+    await build(mcp)
+    elapsed = time.perf_counter() - started
+    await mcp.close()
+    return elapsed, len(mcp.toolkit)
+
+
+async def main(servers: int, tools: int, latency: float, timeout: float):
+    results = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = f"{cache_dir}/mcp_tools.sqlite"
+        cases = {
+            "sequential, no cache": (sequential_build, "", False),
+            "concurrent, no cache": (lifespan_startup, cache_path, False),
+            "warm catalog cache": (lifespan_startup, cache_path, False),
+            "no cache, 1 hanging": (lifespan_startup, "", True),
+            "warm cache, 1 hanging": (lifespan_startup, cache_path, True),
+        }
+        for case, (build, path, hanging) in cases.items():
+            mcp = make_converter(servers, tools, latency, path, timeout, hanging)
+            results[case] = await timed(build, mcp)
+
+    print(f"{servers} servers, {tools} tools each, {latency * 1000:.0f} ms per connect and list_tools")
+    print(f"discovery timeout {timeout:.1f} s")
+    print(f"{'startup':<24}{'seconds':>10}{'tools':>8}")
+    for case, (elapsed, built) in results.items():
+        print(f"{case:<24}{elapsed:>10.3f}{built:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark MCP tool discovery")
+    parser.add_argument("--servers", type=int, default=5, help="Number of MCP servers")
+    parser.add_argument("--tools", type=int, default=20, help="Tools per server")
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds per server request")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Discovery timeout in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.servers, args.tools, args.latency, args.timeout))
@@ -0,0 +1,116 @@
+"""Micro-benchmark of SSE chunk serialization.
+
+Compares building a full chunk dict and encoding it with json.dumps for
+every event, as OpenAIStreamingGenerator did before, with encoding only
+the delta payload into the cached chunk envelope. With orjson installed
+the envelope path is also measured with orjson as payload encoder.
+"""
+
+import argparse
+import json
+import time
+
+from sgr_deep_research.core import stream
+from sgr_deep_research.core.stream import OpenAIStreamingGenerator
+
+CONTENT = "Найдено 3 источника по запросу, сводка ниже.\n"
+ARGUMENTS = json.dumps({"reasoning": "Need fresh data", "query": "sgr agents benchmark 2025", "max_results": 5})
+
+
+def legacy_content(generator: OpenAIStreamingGenerator, content: str):
+    response = {
+        "id": generator.id,
+        "object": "chat.completion.chunk",
+        "created": generator.created,
+        "model": generator.model,
+        "system_fingerprint": generator.fingerprint,
+        "choices": [
+            {
+                "delta": {"content": content, "role": "assistant", "tool_calls": None},
+                "index": generator.choice_index,
+                "finish_reason": None,
+                "logprobs": None,
+            }
+        ],
+        "usage": None,
+    }
+    generator.add(f"data: {json.dumps(response)}\n\n")
+
+
+def legacy_tool_call(generator: OpenAIStreamingGenerator, tool_call_id: str, function_name: str, arguments: str):
+    response = {
+        "id": generator.id,
+        "object": "chat.completion.chunk",
+        "created": generator.created,
+        "model": generator.model,
+        "system_fingerprint": f"fp_{hex(hash(generator.model))[-8:]}",
+        "choices": [
+            {
+                "delta": {
+                    "tool_calls": [
+                        {
+                            "index": 0,
+                            "id": tool_call_id,
+                            "type": "function",
+                            "function": {"name": function_name, "arguments": arguments},
+                        }
+                    ]
+                },
+                "index": generator.choice_index,
+                "logprobs": None,
+                "finish_reason": None,
+            }
+        ],
+        "usage": None,
+    }
+    generator.add(f"data: {json.dumps(response)}\n\n")
+
+
+def chunks_per_second(add, chunks: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        generator = OpenAIStreamingGenerator(model="sgr_agent_0f6e4f0a-bench")
+        started = time.perf_counter()
+        for _ in range(chunks):
+            add(generator)
+        best = min(best, time.perf_counter() - started)
+    return chunks / best
+
+
+def main(chunks: int, repeat: int):
+    cases = {
+        "content": (
+            lambda generator: legacy_content(generator, CONTENT),
+            lambda generator: generator.add_chunk_from_str(CONTENT),
+        ),
+        "tool call": (
+            lambda generator: legacy_tool_call(generator, "1-action", "websearchtool", ARGUMENTS),
+            lambda generator: generator.add_tool_call("1-action", "websearchtool", ARGUMENTS),
+        ),
+    }
+    fast_dumps = stream._dumps
+    encoders = {"stdlib": fast_dumps}
+    try:
+        import orjson
+
+        encoders["orjson"] = lambda obj: orjson.dumps(obj).decode()
+    except ImportError:
+        pass
+
+    print(f"{chunks} chunks, best of {repeat}, chunks/s")
+    print(f"{'chunk':<12}{'legacy':>12}" + "".join(f"{'envelope ' + name:>18}" for name in encoders))
+    for case, (legacy, fast) in cases.items():
+        row = f"{case:<12}{chunks_per_second(legacy, chunks, repeat):>12.0f}"
+        for encoder in encoders.values():
+            stream._dumps = encoder
+            row += f"{chunks_per_second(fast, chunks, repeat):>18.0f}"
+        stream._dumps = fast_dumps
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SSE chunk serialization")
+    parser.add_argument("--chunks", type=int, default=100_000, help="Chunks per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements, the best one is reported")
+    args = parser.parse_args()
+    main(args.chunks, args.repeat)
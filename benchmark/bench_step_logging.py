@@ -0,0 +1,118 @@
+"""Micro-benchmark of agent step logging.
+
+Compares the old _log_tool_execution, which built the debug f-string
+with model_dump_json(indent=2) on every step and kept full model_dump()
+copies and page texts in agent.log, with the level-gated lazy logging
+and truncated payloads. Each step logs a tool execution with a large
+extracted page as result. Both a logger disabled for INFO and an INFO
+logger whose only handler discards the records are measured.
+"""
+
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+from datetime import datetime
+
+from sgr_deep_research.core.agents import SGRAgent
+from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.tools import FinalAnswerTool
+
+
+def legacy_log_tool_execution(agent: SGRAgent, tool, result: str):
+    agent.logger.info(
+        f"""
+###############################################
+🛠️ TOOL EXECUTION DEBUG:
+    🔧 Tool Name: {tool.tool_name}
+    📋 Tool Model: {tool.model_dump_json(indent=2)}
+    🔍 Result: '{result[:400]}...'
+###############################################"""
+    )
+    agent.log.append(
+        {
+            "step_number": agent._context.iteration,
+            "timestamp": datetime.now().isoformat(),
+            "step_type": "tool_execution",
+            "tool_name": tool.tool_name,
+            "agent_tool_context": tool.model_dump(),
+            "agent_tool_execution_result": result,
+        }
+    )
+
+
+def make_agent(logger_level: int, handler_level: int) -> SGRAgent:
+    agent = SGRAgent(task="Benchmark")
+    agent.logger.handlers.clear()
+    agent.logger.propagate = False
+    agent.logger.setLevel(logger_level)
+    agent.logger.addHandler(logging.NullHandler(handler_level))
+    return agent
+
+
+def make_inputs(steps: int, page_kb: int):
+    answer = "Summary of the extracted page. " * 100
+    tool = FinalAnswerTool(
+        reasoning="r", completed_steps=["Read page"], answer=answer, status=AgentStatesEnum.COMPLETED
+    )
+    # every step gets its own page text, as each extraction returns a new string
+    pages = [f"{i:08d}" + "x" * (page_kb * 1024) for i in range(steps)]
+    return tool, pages
+
+
+def time_per_step(log_step, steps: int, page_kb: int, levels: tuple[int, int], repeat: int) -> float:
+    """Best microseconds per logged step."""
+    best = float("inf")
+    for _ in range(repeat):
+        agent = make_agent(*levels)
+        tool, pages = make_inputs(steps, page_kb)
+        started = time.perf_counter()
+        for page in pages:
+            log_step(agent, tool, page)
+        best = min(best, time.perf_counter() - started)
+    return best / steps * 1e6
+
+
+def kept_per_step(log_step, steps: int, page_kb: int, levels: tuple[int, int]) -> float:
+    """KB still allocated per step once the caller dropped its page texts."""
+    agent = make_agent(*levels)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tool, pages = make_inputs(steps, page_kb)
+    for page in pages:
+        log_step(agent, tool, page)
+    del tool, pages, page
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return kept / steps / 1024
+
+
+def main(steps: int, page_kb: int, repeat: int):
+    cases = {
+        "logger WARNING": (logging.WARNING, logging.NOTSET),
+        "handler WARNING": (logging.INFO, logging.WARNING),
+    }
+    implementations = {
+        "legacy": legacy_log_tool_execution,
+        "lazy": lambda agent, tool, page: agent._log_tool_execution(tool, page),
+    }
+
+    print(f"{steps} steps, {page_kb} KB page per step, best of {repeat}")
+    print(f"{'case':<18}{'impl':<8}{'us/step':>10}{'KB kept/step':>14}")
+    for case, levels in cases.items():
+        for name, log_step in implementations.items():
+            per_step = time_per_step(log_step, steps, page_kb, levels, repeat)
+            kept = kept_per_step(log_step, steps, page_kb, levels)
+            print(f"{case:<18}{name:<8}{per_step:>10.1f}{kept:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark agent step logging")
+    parser.add_argument("--steps", type=int, default=2000, help="Logged steps per measurement")
+    parser.add_argument("--page-kb", type=int, default=50, help="Size of the tool result of each step")
+    parser.add_argument("--repeat", type=int, default=5, help="Timings, the best one is reported")
+    args = parser.parse_args()
+    main(args.steps, args.page_kb, args.repeat)
@@ -0,0 +1,85 @@
+"""Benchmark of SSE event coalescing with many concurrent clients.
+
+Streams LLM token deltas to concurrent clients through
+OpenAIStreamingGenerator with and without delta coalescing and reports
+events per second and CPU time per stream.
+"""
+
+import argparse
+import asyncio
+import time
+
+from openai.types.chat import ChatCompletionChunk
+
+from sgr_deep_research.core.stream import OpenAIStreamingGenerator
+
+
+def token_chunk(index: int) -> ChatCompletionChunk:
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": f" token{index}"}, "finish_reason": None}],
+        }
+    )
+
+
+async def produce(generator: OpenAIStreamingGenerator, chunks: list[ChatCompletionChunk], interval: float):
+    for chunk in chunks:
+        generator.add_chunk(chunk)
+        await generator.drain()
+        await asyncio.sleep(interval)
+    generator.finish()
+
+
+async def consume(generator: OpenAIStreamingGenerator) -> tuple[int, int]:
+    events = size = 0
+    async for data in generator.stream():
+        events += data.count("data: ")
+        size += len(data)
+    return events, size
+
+
+async def run(clients: int, tokens: int, interval: float, window: float) -> dict:
+    # chunks parsed by the OpenAI client are shared, only streaming is measured
+    chunks = [token_chunk(i) for i in range(tokens)]
+    generators = [OpenAIStreamingGenerator(model="bench", coalesce_window=window) for _ in range(clients)]
+    cpu_started, started = time.process_time(), time.perf_counter()
+    consumers = [asyncio.create_task(consume(generator)) for generator in generators]
+    await asyncio.gather(*(produce(generator, chunks, interval) for generator in generators))
+    results = await asyncio.gather(*consumers)
+    elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+    events = sum(result[0] for result in results)
+    return {
+        "mode": f"window {window * 1000:.0f}ms" if window else "off",
+        "events": events,
+        "events_per_second": events / elapsed,
+        "cpu_ms_per_stream": cpu / clients * 1000,
+        "kb_per_stream": sum(result[1] for result in results) / clients / 1024,
+    }
+
+
+async def main(clients: int, tokens: int, interval: float, windows: list[float]):
+    await run(10, 10, interval, 0)  # warm up
+    results = [await run(clients, tokens, interval, window) for window in [0, *windows]]
+    print(f"{clients} clients x {tokens} tokens, token every {interval * 1000:.0f}ms")
+    print(f"{'mode':<14}{'events':>10}{'events/s':>12}{'CPU ms/stream':>15}{'KB/stream':>11}")
+    for result in results:
+        print(
+            f"{result['mode']:<14}{result['events']:>10}{result['events_per_second']:>12.0f}"
+            f"{result['cpu_ms_per_stream']:>15.1f}{result['kb_per_stream']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SSE delta coalescing")
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent streams")
+    parser.add_argument("--tokens", type=int, default=300, help="Token deltas per stream")
+    parser.add_argument("--interval", type=float, default=0.005, help="Seconds between token deltas")
+    parser.add_argument(
+        "--windows", type=float, nargs="+", default=[0.02, 0.05], help="Coalescing windows in seconds to compare"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.tokens, args.interval, args.windows))
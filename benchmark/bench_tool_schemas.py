@@ -0,0 +1,46 @@
+"""Micro-benchmark of tool schema preparation per agent iteration.
+
+Compares building function tool params and NextStepTools models from
+scratch on every iteration with the memoized schema cache.
+"""
+
+import argparse
+import timeit
+
+from sgr_deep_research.core.tool_schemas import _build_function_tools, clear_schema_cache, function_tools
+from sgr_deep_research.core.tools import NextStepToolsBuilder, ReasoningTool, research_agent_tools, system_agent_tools
+
+TOOLS = [*system_agent_tools, *research_agent_tools]
+NEXT_STEP_TOOLS = [tool for tool in TOOLS if tool is not ReasoningTool]
+
+
+def uncached_iteration():
+    _build_function_tools.__wrapped__(tuple(TOOLS))
+    NextStepToolsBuilder._build_NextStepTools.__wrapped__(NextStepToolsBuilder, tuple(NEXT_STEP_TOOLS))
+
+
+def cached_iteration():
+    function_tools(TOOLS)
+    NextStepToolsBuilder.build_NextStepTools(NEXT_STEP_TOOLS)
+
+
+def measure(func, iterations: int, repeat: int) -> float:
+    """Best per-iteration time in microseconds."""
+    return min(timeit.repeat(func, number=iterations, repeat=repeat)) / iterations * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark tool schema preparation")
+    parser.add_argument("--iterations", type=int, default=200, help="Agent iterations per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements, the best one is reported")
+    args = parser.parse_args()
+
+    clear_schema_cache()
+    uncached = measure(uncached_iteration, args.iterations, args.repeat)
+    cached = measure(cached_iteration, args.iterations, args.repeat)
+
+    print(f"Tools per iteration: {len(TOOLS)} function tools, {len(NEXT_STEP_TOOLS)} NextStepTools union members")
+    print(f"{'mode':<10}{'us/iteration':>15}")
+    print(f"{'uncached':<10}{uncached:>15.1f}")
+    print(f"{'cached':<10}{cached:>15.1f}")
+    print(f"Speedup: {uncached / cached:.0f}x")
@@ -1,8 +1,8 @@
-from openai import pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core import FinalAnswerTool, ReasoningTool
 from sgr_deep_research.core.agents.sgr_tool_calling_agent import SGRToolCallingAgent
+from sgr_deep_research.core.tool_schemas import function_tools
 from sgr_deep_research.core.tools import ExtractPageContentTool, WebSearchTool
 
 
@@ -37,7 +37,7 @@ class BenchmarkAgent(SGRToolCallingAgent):
                 WebSearchTool,
             }
 
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return function_tools(self._ordered_tools(tools))
 
     async def execute(
         self,
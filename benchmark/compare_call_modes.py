@@ -0,0 +1,89 @@
+"""Compare two-call and single-call iterations of BenchmarkAgent on
+SimpleQA.
+
+Runs the same questions in both modes and reports accuracy, latency,
+iterations and token usage per mode.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+
+import pandas as pd
+from run_simpleqa_bench import benchmark_agent
+
+logger = logging.getLogger(__name__)
+
+MODES = {"two_call": False, "single_call": True}
+
+
+async def run_mode(problems, answers, judge_model_config, single_call: bool, batch_size: int) -> pd.DataFrame:
+    results = []
+    for i in range(0, len(problems), batch_size):
+        results.extend(
+            await asyncio.gather(
+                *[
+                    benchmark_agent(question, answer, judge_model_config, single_call)
+                    for question, answer in zip(problems[i : i + batch_size], answers[i : i + batch_size])
+                ]
+            )
+        )
+    return pd.DataFrame(results)
+
+
+def summarize(mode: str, df: pd.DataFrame) -> dict:
+    finished = df[~df["fail_search"]]
+    return {
+        "mode": mode,
+        "samples": len(df),
+        "accuracy": df["is_correct"].sum() / len(df) if len(df) else 0.0,
+        "failed": int(df["fail_search"].sum()),
+        "mean_seconds": finished["elapsed_seconds"].mean(),
+        "p90_seconds": finished["elapsed_seconds"].quantile(0.9),
+        "mean_iterations": finished["iterations"].mean(),
+        "mean_prompt_tokens": finished["prompt_tokens"].mean(),
+        "mean_completion_tokens": finished["completion_tokens"].mean(),
+    }
+
+
+async def main(problems, answers, judge_model_config, output_path: str, batch_size: int):
+    summaries = []
+    for mode, single_call in MODES.items():
+        logger.info(f"Running {mode} mode on {len(problems)} questions")
+        df = await run_mode(problems, answers, judge_model_config, single_call, batch_size)
+        df.to_excel(output_path.replace(".md", f"_{mode}.xlsx"), index=False)
+        summaries.append(summarize(mode, df))
+
+    report = pd.DataFrame(summaries).set_index("mode").T
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("# Two-call vs single-call iterations on SimpleQA\n\n")
+        f.write(report.to_markdown(floatfmt=".3f"))
+        f.write("\n")
+    logger.info(f"\n{report}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare agent call modes on SimpleQA")
+    parser.add_argument("--path_to_simpleqa", type=str, required=True, help="Path to simpleqa_verified on csv")
+    parser.add_argument("--output_path", type=str, default="call_modes_comparison.md", help="Markdown report path")
+    parser.add_argument("--n_samples", type=int, default=50, help="Number of samples to process from simpleqa")
+    parser.add_argument("--batch_size", type=int, default=10, help="Questions processed concurrently")
+    args = parser.parse_args()
+
+    judge_model_config = {
+        "base_url": os.getenv("JUDGE_BASE_URL"),
+        "api_key": os.getenv("JUDGE_API_KEY"),
+        "model": os.getenv("JUDGE_MODEL_NAME"),
+    }
+    df = pd.read_csv(args.path_to_simpleqa).head(args.n_samples)
+
+    asyncio.run(
+        main(
+            problems=df["problem"].to_list(),
+            answers=df["answer"].to_list(),
+            judge_model_config=judge_model_config,
+            output_path=args.output_path,
+            batch_size=args.batch_size,
+        )
+    )
@@ -2,6 +2,7 @@ import argparse
 import asyncio
 import logging
 import os
+import time
 from typing import Any, Dict, List
 
 import pandas as pd
@@ -28,12 +29,14 @@ logger = logging.getLogger(__name__)
 logger.info(f"Using config file: {config_path}")
 
 
-async def benchmark_agent(question, answer, model_config) -> Dict[str, Any]:
+async def benchmark_agent(question, answer, model_config, single_call: bool = False) -> Dict[str, Any]:
     system_conf = get_config()
-    agent = BenchmarkAgent(task=question, max_iterations=system_conf.execution.max_steps)
+    agent = BenchmarkAgent(task=question, max_iterations=system_conf.execution.max_steps, single_call=single_call)
 
+    started_at = time.perf_counter()
     try:
         await agent.execute()
+        elapsed_seconds = time.perf_counter() - started_at
 
         predicted_answer = agent._context.execution_result
 
@@ -57,6 +60,11 @@ async def benchmark_agent(question, answer, model_config) -> Dict[str, Any]:
             "grade_answer_report": "None",
             "Error text": str(ex),
             "agent_id": getattr(agent, "id", "N/A"),
+            "single_call": single_call,
+            "elapsed_seconds": None,
+            "iterations": None,
+            "prompt_tokens": None,
+            "completion_tokens": None,
         }
 
     return {
@@ -71,6 +79,11 @@ async def benchmark_agent(question, answer, model_config) -> Dict[str, Any]:
         "grade_answer_report": grade_answer_report,
         "Error text": "None",
         "agent_id": agent.id,
+        "single_call": single_call,
+        "elapsed_seconds": elapsed_seconds,
+        "iterations": agent._context.iteration,
+        "prompt_tokens": agent._context.usage.prompt_tokens,
+        "completion_tokens": agent._context.usage.completion_tokens,
     }
 
 
@@ -82,6 +95,7 @@ async def main(
     results_task: List[Dict[str, Any]] = None,
     batch_size: int = 3,
     start_idx: int = 0,
+    single_call: bool = False,
 ):
     results = results_task if results_task else []
 
@@ -97,7 +111,10 @@ async def main(
         logger.debug(f"Batch tasks: {batch_tasks}")
 
         batch_results = await asyncio.gather(
-            *[benchmark_agent(question, answer, judge_model_config) for question, answer in zip(*batch_tasks)]
+            *[
+                benchmark_agent(question, answer, judge_model_config, single_call)
+                for question, answer in zip(*batch_tasks)
+            ]
         )
 
         results.extend(batch_results)
@@ -172,6 +189,12 @@ if __name__ == "__main__":
         help="Number of samples to process from simpleqa",
     )
 
+    parser.add_argument(
+        "--single_call",
+        action="store_true",
+        help="Request reasoning and action in one LLM call per iteration",
+    )
+
     args = parser.parse_args()
 
     judge_model_config = {
@@ -216,5 +239,6 @@ if __name__ == "__main__":
             results_task=results_tasks,
             batch_size=batch_size,
             start_idx=start_idx,
+            single_call=args.single_call,
         )
     )
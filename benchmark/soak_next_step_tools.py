@@ -0,0 +1,92 @@
+"""Soak test of NextStepTools models built by many SGR agents.
+
+Runs _prepare_tools of many SGRAgent instances through several
+iterations with varying tool subsets and reports memory held by dynamic
+pydantic models with the shared model registry and without it.
+"""
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from pydantic import BaseModel
+
+from sgr_deep_research.core.agents import SGRAgent
+from sgr_deep_research.core.tools import NextStepToolsBuilder
+
+
+def count_dynamic_models() -> int:
+    gc.collect()
+    return sum(
+        1
+        for model in _all_subclasses(BaseModel)
+        if model.__name__.startswith("D_") or model.__name__ == "NextStepTools"
+    )
+
+
+def _all_subclasses(cls: type) -> set[type]:
+    subclasses = set()
+    stack = [cls]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            if subclass not in subclasses:
+                subclasses.add(subclass)
+                stack.append(subclass)
+    return subclasses
+
+
+async def run_agents(agents: int, iterations: int, use_registry: bool) -> dict:
+    NextStepToolsBuilder.clear_registry()
+    gc.collect()
+    models_before = count_dynamic_models()
+    tracemalloc.start()
+    started_at = time.perf_counter()
+
+    for i in range(agents):
+        agent = SGRAgent(task=f"Soak task {i}", max_iterations=iterations, max_searches=2)
+        for iteration in range(1, iterations + 1):
+            agent._context.iteration = iteration
+            agent._context.searches_used = iteration - 1
+            if not use_registry:
+                # every call builds fresh models, as before the registry
+                NextStepToolsBuilder.clear_registry()
+            await agent._prepare_tools()
+        agent.streaming_generator.finish()
+
+    elapsed = time.perf_counter() - started_at
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": "registry" if use_registry else "no registry",
+        "seconds": elapsed,
+        "current_mb": current / 1024**2,
+        "peak_mb": peak / 1024**2,
+        "dynamic_models": count_dynamic_models() - models_before,
+    }
+
+
+async def main(agents: int, iterations: int):
+    # warm up imports and pydantic internals so they are not measured
+    await run_agents(10, iterations, use_registry=True)
+    results = [
+        await run_agents(agents, iterations, use_registry=True),
+        await run_agents(agents, iterations, use_registry=False),
+    ]
+    print(f"{agents} agents x {iterations} iterations")
+    print(f"{'mode':<14}{'seconds':>10}{'current MB':>12}{'peak MB':>10}{'live models':>13}")
+    for result in results:
+        print(
+            f"{result['mode']:<14}{result['seconds']:>10.2f}{result['current_mb']:>12.2f}"
+            f"{result['peak_mb']:>10.2f}{result['dynamic_models']:>13}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak test of NextStepTools model registry")
+    parser.add_argument("--agents", type=int, default=1000, help="Number of agents")
+    parser.add_argument("--iterations", type=int, default=3, help="Iterations per agent")
+    args = parser.parse_args()
+    asyncio.run(main(args.agents, args.iterations))
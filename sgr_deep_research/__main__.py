@@ -10,7 +10,8 @@ from fastapi import FastAPI
 
 from sgr_deep_research import __version__
 from sgr_deep_research.api.endpoints import router
-from sgr_deep_research.services import MCP2ToolConverter
+from sgr_deep_research.services import LLMClientPool, MCP2ToolConverter
+from sgr_deep_research.services.base import HTTPClient
 from sgr_deep_research.settings import setup_logging
 
 setup_logging()
@@ -19,8 +20,14 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await MCP2ToolConverter().build_tools_from_mcp()
+    mcp = MCP2ToolConverter()
+    await mcp.open()
+    await mcp.build_tools_from_mcp()
+    LLMClientPool.get_client()
     yield
+    await mcp.close()
+    await LLMClientPool.close()
+    await HTTPClient.close_all()
 
 
 app = FastAPI(title="SGR Agent Core API", version=__version__, lifespan=lifespan)
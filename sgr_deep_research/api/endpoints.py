@@ -1,8 +1,9 @@
 import asyncio
+import functools
 import logging
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from sgr_deep_research.api.models import (
     AGENT_MODEL_MAPPING,
@@ -16,13 +17,43 @@ from sgr_deep_research.api.models import (
 )
 from sgr_deep_research.core.agents import BaseAgent
 from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.stream import StreamingGenerator
+from sgr_deep_research.services.agent_log import AgentLogWriter
+from sgr_deep_research.services.agent_scheduler import (
+    AgentScheduler,
+    SchedulerFullError,
+    SchedulerMetrics,
+)
+from sgr_deep_research.services.agent_store import AgentStore, build_agent_store
+from sgr_deep_research.services.mcp_service import MCP2ToolConverter
+from sgr_deep_research.services.metrics import MetricsRegistry
+from sgr_deep_research.services.rate_limiter import RateLimiter
+from sgr_deep_research.services.tavily_search import TavilySearchService
+from sgr_deep_research.settings import get_config
 
 logger = logging.getLogger(__name__)
+config = get_config()
 
 router = APIRouter()
 
-# ToDo: better to move to a separate service
-agents_storage: dict[str, BaseAgent] = {}
+agents_storage: AgentStore = build_agent_store(
+    backend=config.agent_store.backend,
+    max_finished_agents=config.agent_store.max_finished_agents,
+    finished_ttl=config.agent_store.finished_ttl,
+    path=config.agent_store.path,
+)
+agent_scheduler = AgentScheduler(
+    max_concurrent=config.scheduler.max_concurrent_agents,
+    max_queued=config.scheduler.max_queued_agents,
+    retry_after=config.scheduler.retry_after,
+    priorities=config.scheduler.model_priorities,
+)
+MetricsRegistry.register_collector(agent_scheduler.collect_metrics)
+MetricsRegistry.register_collector(RateLimiter.collect_metrics)
+MetricsRegistry.register_collector(StreamingGenerator.collect_metrics)
+MetricsRegistry.register_collector(AgentLogWriter.collect_metrics)
+MetricsRegistry.register_collector(MCP2ToolConverter.collect_metrics)
+MetricsRegistry.register_collector(TavilySearchService.collect_metrics)
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -30,31 +61,38 @@ async def health_check():
     return HealthResponse()
 
 
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus text exposition of agent timings and service gauges."""
+    return PlainTextResponse(
+        MetricsRegistry.render(), media_type="text/plain; version=0.0.4"
+    )
+
+
+@router.get("/scheduler/metrics", response_model=SchedulerMetrics)
+async def get_scheduler_metrics():
+    return agent_scheduler.metrics
+
+
 @router.get("/agents/{agent_id}/state", response_model=AgentStateResponse)
 async def get_agent_state(agent_id: str):
-    if agent_id not in agents_storage:
+    snapshot = await agents_storage.get_snapshot(agent_id)
+    if snapshot is None:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    agent = agents_storage[agent_id]
-
     return AgentStateResponse(
-        agent_id=agent.id,
-        task=agent.task,
-        sources_count=len(agent._context.sources),
-        **agent._context.model_dump(),
+        agent_id=snapshot.agent_id,
+        task=snapshot.task,
+        sources_count=snapshot.sources_count,
+        **snapshot.context,
     )
 
 
 @router.get("/agents", response_model=AgentListResponse)
 async def get_agents_list():
     agents_list = [
-        AgentListItem(
-            agent_id=agent.id,
-            task=agent.task,
-            state=agent._context.state,
-            creation_time=agent.creation_time,
-        )
-        for agent in agents_storage.values()
+        AgentListItem(**summary.model_dump())
+        for summary in await agents_storage.list_summaries()
     ]
 
     return AgentListResponse(agents=agents_list, total=len(agents_list))
@@ -95,10 +133,13 @@ async def provide_clarification(agent_id: str, request: ClarificationRequest):
             f"Providing clarification to agent {agent.id}: {request.clarifications[:100]}..."
         )
 
+        # the first client may still read the agent stream, so events after
+        # the clarification are streamed to a subscriber of its own
+        last_event_id = agent.streaming_generator.last_event_id
         await agent.provide_clarification(request.clarifications)
         return StreamingResponse(
-            agent.streaming_generator.stream(),
-            media_type="text/plain",
+            agent.streaming_generator.subscribe(last_event_id),
+            media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
@@ -111,12 +152,52 @@ async def provide_clarification(agent_id: str, request: ClarificationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/agents/{agent_id}/stream")
+async def stream_agent(
+    agent_id: str,
+    last_event_id: int | None = Header(default=None, alias="Last-Event-ID"),
+):
+    """Observe agent stream, replaying buffered events after Last-Event-ID."""
+    agent = agents_storage.get(agent_id)
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    return StreamingResponse(
+        agent.streaming_generator.subscribe(last_event_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Agent-ID": str(agent.id),
+        },
+    )
+
+
 def _is_agent_id(model_str: str) -> bool:
     """Check if model string is an agent ID (contains underscore and UUID-like
     format)."""
     return "_" in model_str and len(model_str) > 20
 
 
+def _cancel_agent(agent: BaseAgent, task: asyncio.Task):
+    """Cancel agent whose client went away, unless it waits for the user
+    or is observed by subscribers."""
+    if (
+        agent._context.state == AgentStatesEnum.WAITING_FOR_CLARIFICATION
+        or agent.streaming_generator.subscribers
+    ):
+        return
+    logger.info(f"Client of agent {agent.id} disconnected, cancelling agent")
+    task.cancel()
+
+
+async def _execute_agent(agent: BaseAgent):
+    try:
+        await agent.execute()
+    finally:
+        await agents_storage.finalize(agent.id)
+
+
 @router.post("/v1/chat/completions")
 async def create_chat_completion(request: ChatCompletionRequest):
     if not request.stream:
@@ -155,12 +236,26 @@ async def create_chat_completion(request: ChatCompletionRequest):
 
         agent_class = AGENT_MODEL_MAPPING[agent_model]
         agent = agent_class(task=task)
+        try:
+            agent_task = agent_scheduler.submit(
+                _execute_agent(agent), model=agent_model.value
+            )
+        except SchedulerFullError as e:
+            logger.warning(f"Agent {agent.id} rejected: {e}")
+            raise HTTPException(
+                status_code=429,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after)},
+            )
+        if config.streaming.on_disconnect == "cancel":
+            agent.streaming_generator.on_disconnect(
+                functools.partial(_cancel_agent, agent, agent_task)
+            )
         agents_storage[agent.id] = agent
         logger.info(
             f"Agent {agent.id} ({agent_model.value}) created and stored for task: {task[:100]}..."
         )
 
-        _ = asyncio.create_task(agent.execute())
         return StreamingResponse(
             agent.streaming_generator.stream(),
             media_type="text/plain",
@@ -94,6 +94,12 @@ class AgentStateResponse(BaseModel):
         default=None, description="Current agent step"
     )
     execution_result: str | None = Field(default=None, description="Execution result")
+    usage: Dict[str, int] | None = Field(
+        default=None, description="Cumulative token usage"
+    )
+    usage_by_phase: Dict[str, Dict[str, int]] = Field(
+        default_factory=dict, description="Token usage per agent phase"
+    )
 
 
 class AgentListItem(BaseModel):
@@ -1,11 +1,14 @@
 from typing import Type
 
+from openai import AsyncOpenAI
+
 from sgr_deep_research.core.base_agent import BaseAgent
 from sgr_deep_research.core.tools import (
     BaseTool,
     ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
+    MultiWebSearchTool,
     NextStepToolsBuilder,
     NextStepToolStub,
     ReasoningTool,
@@ -31,12 +34,14 @@ class SGRAgent(BaseAgent):
         max_clarifications: int = 3,
         max_iterations: int = 10,
         max_searches: int = 4,
+        openai_client: AsyncOpenAI | None = None,
     ):
         super().__init__(
             task=task,
             toolkit=toolkit,
             max_clarifications=max_clarifications,
             max_iterations=max_iterations,
+            openai_client=openai_client,
         )
 
         self.toolkit = [
@@ -63,11 +68,12 @@ class SGRAgent(BaseAgent):
         if self._context.searches_used >= self.max_searches:
             tools -= {
                 WebSearchTool,
+                MultiWebSearchTool,
             }
-        return NextStepToolsBuilder.build_NextStepTools(list(tools))
+        return NextStepToolsBuilder.build_NextStepTools(self._ordered_tools(tools))
 
     async def _reasoning_phase(self) -> NextStepToolStub:
-        async with self.openai_client.chat.completions.stream(
+        async with self._stream_completion(
             model=config.openai.model,
             response_format=await self._prepare_tools(),
             messages=await self._prepare_context(),
@@ -88,6 +94,7 @@ class SGRAgent(BaseAgent):
         tool = reasoning.function
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool = self._select_parallel_batch([tool])[0]
         self.conversation.append(
             {
                 "role": "assistant",
@@ -1,5 +1,7 @@
 from typing import Literal, Type
 
+from openai import AsyncOpenAI
+
 from sgr_deep_research.core.agents.sgr_tool_calling_agent import SGRToolCallingAgent
 from sgr_deep_research.core.tools import BaseTool
 
@@ -17,8 +19,14 @@ class SGRAutoToolCallingAgent(SGRToolCallingAgent):
         max_clarifications: int = 3,
         max_searches: int = 4,
         max_iterations: int = 10,
+        openai_client: AsyncOpenAI | None = None,
     ):
         super().__init__(
-            task, toolkit, max_clarifications, max_searches, max_iterations
+            task,
+            toolkit,
+            max_clarifications,
+            max_searches,
+            max_iterations,
+            openai_client,
         )
         self.tool_choice: Literal["auto"] = "auto"
@@ -12,7 +12,7 @@ class SGRSOToolCallingAgent(SGRToolCallingAgent):
     name: str = "sgr_so_tool_calling_agent"
 
     async def _reasoning_phase(self) -> ReasoningTool:
-        async with self.openai_client.chat.completions.stream(
+        async with self._stream_completion(
             model=config.openai.model,
             messages=await self._prepare_context(),
             max_tokens=config.openai.max_tokens,
@@ -32,7 +32,7 @@ class SGRSOToolCallingAgent(SGRToolCallingAgent):
                 .message.tool_calls[0]
                 .function.parsed_arguments  #
             )
-        async with self.openai_client.chat.completions.stream(
+        async with self._stream_completion(
             model=config.openai.model,
             response_format=ReasoningTool,
             messages=await self._prepare_context(),
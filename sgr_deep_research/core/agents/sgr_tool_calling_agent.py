@@ -1,15 +1,18 @@
 from typing import Literal, Type
 
-from openai import pydantic_function_tool
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agents.sgr_agent import SGRAgent
 from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.prompts import PromptLoader
+from sgr_deep_research.core.tool_schemas import function_tools
 from sgr_deep_research.core.tools import (
     BaseTool,
     ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
+    MultiWebSearchTool,
     ReasoningTool,
     WebSearchTool,
     research_agent_tools,
@@ -34,6 +37,8 @@ class SGRToolCallingAgent(SGRAgent):
         max_clarifications: int = 3,
         max_searches: int = 4,
         max_iterations: int = 10,
+        openai_client: AsyncOpenAI | None = None,
+        single_call: bool | None = None,
     ):
         super().__init__(
             task=task,
@@ -41,6 +46,7 @@ class SGRToolCallingAgent(SGRAgent):
             max_clarifications=max_clarifications,
             max_iterations=max_iterations,
             max_searches=max_searches,
+            openai_client=openai_client,
         )
         self.toolkit = [
             *system_agent_tools,
@@ -49,6 +55,13 @@ class SGRToolCallingAgent(SGRAgent):
             *(toolkit if toolkit else []),
         ]
         self.tool_choice: Literal["required"] = "required"
+        # request reasoning and action as parallel tool calls of one completion
+        self.single_call = (
+            config.execution.single_call_reasoning
+            if single_call is None
+            else single_call
+        )
+        self._pending_actions: list[BaseTool] = []
 
     async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
         """Prepare available tools for current agent state and progress."""
@@ -66,14 +79,92 @@ class SGRToolCallingAgent(SGRAgent):
         if self._context.searches_used >= self.max_searches:
             tools -= {
                 WebSearchTool,
+                MultiWebSearchTool,
             }
-        return [
-            pydantic_function_tool(tool, name=tool.tool_name, description="")
-            for tool in tools
+        return function_tools(self._ordered_tools(tools))
+
+    async def _single_call_phase(self) -> ReasoningTool | None:
+        """Request ReasoningTool and the next action tool in one completion.
+
+        The action is kept for _select_action_phase. Returns None when
+        the response has no valid reasoning, so the iteration falls back
+        to separate reasoning and selection calls.
+        """
+        async with self._stream_completion(
+            model=config.openai.model,
+            messages=[
+                *await self._prepare_context(),
+                {"role": "system", "content": PromptLoader.get_single_call_request()},
+            ],
+            max_tokens=config.openai.max_tokens,
+            temperature=config.openai.temperature,
+            tools=await self._prepare_tools(),
+            tool_choice="required",
+            parallel_tool_calls=True,
+        ) as stream:
+            async for event in stream:
+                if event.type == "chunk":
+                    self.streaming_generator.add_chunk(event.chunk)
+        completion = await stream.get_final_completion()
+
+        tools = [
+            tool_call.function.parsed_arguments
+            for tool_call in completion.choices[0].message.tool_calls or []
+        ]
+        reasoning = next((t for t in tools if isinstance(t, ReasoningTool)), None)
+        actions = [
+            t
+            for t in tools
+            if isinstance(t, BaseTool) and not isinstance(t, ReasoningTool)
         ]
+        if reasoning is None:
+            self.logger.warning(
+                "Single call returned no reasoning, falling back to two calls"
+            )
+            return None
+        self._pending_actions = self._select_parallel_batch(actions) if actions else []
+
+        tool_calls = [
+            {
+                "type": "function",
+                "id": f"{self._context.iteration}-reasoning",
+                "function": {
+                    "name": reasoning.tool_name,
+                    "arguments": reasoning.model_dump_json(),
+                },
+            },
+            *(
+                {
+                    "type": "function",
+                    "id": self._action_call_id(index),
+                    "function": {
+                        "name": action.tool_name,
+                        "arguments": action.model_dump_json(),
+                    },
+                }
+                for index, action in enumerate(self._pending_actions)
+            ),
+        ]
+        self.conversation.append(
+            {"role": "assistant", "content": None, "tool_calls": tool_calls}
+        )
+        tool_call_result = await reasoning(self._context)
+        self.conversation.append(
+            {
+                "role": "tool",
+                "content": tool_call_result,
+                "tool_call_id": f"{self._context.iteration}-reasoning",
+            }
+        )
+        self._log_reasoning(reasoning)
+        return reasoning
 
     async def _reasoning_phase(self) -> ReasoningTool:
-        async with self.openai_client.chat.completions.stream(
+        if self.single_call:
+            reasoning = await self._single_call_phase()
+            if reasoning is not None:
+                return reasoning
+        async with self._stream_completion(
             model=config.openai.model,
             messages=await self._prepare_context(),
             max_tokens=config.openai.max_tokens,
@@ -120,8 +211,19 @@ class SGRToolCallingAgent(SGRAgent):
         self._log_reasoning(reasoning)
         return reasoning
 
-    async def _select_action_phase(self, reasoning: ReasoningTool) -> BaseTool:
-        async with self.openai_client.chat.completions.stream(
+    async def _select_action_phase(
+        self, reasoning: ReasoningTool
+    ) -> BaseTool | list[BaseTool]:
+        if self._pending_actions:
+            # already selected and added to conversation by the single call
+            tools, self._pending_actions = self._pending_actions, []
+            for index, tool in enumerate(tools):
+                self.streaming_generator.add_tool_call(
+                    self._action_call_id(index), tool.tool_name, tool.model_dump_json()
+                )
+            return tools if len(tools) > 1 else tools[0]
+
+        async with self._stream_completion(
             model=config.openai.model,
             messages=await self._prepare_context(),
             max_tokens=config.openai.max_tokens,
@@ -136,40 +238,33 @@ class SGRToolCallingAgent(SGRAgent):
         completion = await stream.get_final_completion()
 
         try:
-            tool = completion.choices[0].message.tool_calls[0].function.parsed_arguments
+            tools = [
+                tool_call.function.parsed_arguments
+                for tool_call in completion.choices[0].message.tool_calls
+            ]
+            if not tools:
+                raise IndexError("No tool calls in completion")
         except (IndexError, AttributeError, TypeError):
             # LLM returned a text response instead of a tool call - treat as completion
             final_content = (
                 completion.choices[0].message.content or "Task completed successfully"
             )
-            tool = FinalAnswerTool(
-                reasoning="Agent decided to complete the task",
-                completed_steps=[final_content],
-                status=AgentStatesEnum.COMPLETED,
-            )
-        if not isinstance(tool, BaseTool):
+            tools = [
+                FinalAnswerTool(
+                    reasoning="Agent decided to complete the task",
+                    completed_steps=[final_content],
+                    status=AgentStatesEnum.COMPLETED,
+                )
+            ]
+        if not all(isinstance(tool, BaseTool) for tool in tools):
             raise ValueError("Selected tool is not a valid BaseTool instance")
-        self.conversation.append(
-            {
-                "role": "assistant",
-                "content": (
-                    reasoning.remaining_steps[0]
-                    if reasoning.remaining_steps
-                    else "Completing"
-                ),
-                "tool_calls": [
-                    {
-                        "type": "function",
-                        "id": f"{self._context.iteration}-action",
-                        "function": {
-                            "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
-                        },
-                    }
-                ],
-            }
-        )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
+        tools = self._select_parallel_batch(tools)
+        self._add_action_calls(
+            tools,
+            content=(
+                reasoning.remaining_steps[0]
+                if reasoning.remaining_steps
+                else "Completing"
+            ),
         )
-        return tool
+        return tools if len(tools) > 1 else tools[0]
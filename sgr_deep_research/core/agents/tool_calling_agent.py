@@ -1,14 +1,16 @@
 from typing import Literal, Type
 
-from openai import pydantic_function_tool
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.tool_schemas import function_tools
 from sgr_deep_research.core.tools import (
     BaseTool,
     ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
+    MultiWebSearchTool,
     ReasoningTool,
     WebSearchTool,
     research_agent_tools,
@@ -33,12 +35,14 @@ class ToolCallingAgent(BaseAgent):
         max_clarifications: int = 3,
         max_searches: int = 4,
         max_iterations: int = 10,
+        openai_client: AsyncOpenAI | None = None,
     ):
         super().__init__(
             task=task,
             toolkit=toolkit,
             max_clarifications=max_clarifications,
             max_iterations=max_iterations,
+            openai_client=openai_client,
         )
 
         self.toolkit = [
@@ -67,18 +71,16 @@ class ToolCallingAgent(BaseAgent):
         if self._context.searches_used >= self.max_searches:
             tools -= {
                 WebSearchTool,
+                MultiWebSearchTool,
             }
-        return [
-            pydantic_function_tool(tool, name=tool.tool_name, description="")
-            for tool in tools
-        ]
+        return function_tools(self._ordered_tools(tools))
 
     async def _reasoning_phase(self) -> None:
         """No explicit reasoning phase, reasoning is done internally by LLM."""
         return None
 
-    async def _select_action_phase(self, reasoning=None) -> BaseTool:
-        async with self.openai_client.chat.completions.stream(
+    async def _select_action_phase(self, reasoning=None) -> BaseTool | list[BaseTool]:
+        async with self._stream_completion(
             model=config.openai.model,
             messages=await self._prepare_context(),
             max_tokens=config.openai.max_tokens,
@@ -89,35 +91,17 @@ class ToolCallingAgent(BaseAgent):
             async for event in stream:
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event)
-        tool = (
-            (await stream.get_final_completion())
-            .choices[0]
-            .message.tool_calls[0]
-            .function.parsed_arguments
-        )
+        completion = await stream.get_final_completion()
+        tools = [
+            tool_call.function.parsed_arguments
+            for tool_call in completion.choices[0].message.tool_calls
+        ]
 
-        if not isinstance(tool, BaseTool):
+        if not tools or not all(isinstance(tool, BaseTool) for tool in tools):
             raise ValueError("Selected tool is not a valid BaseTool instance")
-        self.conversation.append(
-            {
-                "role": "assistant",
-                "content": None,
-                "tool_calls": [
-                    {
-                        "type": "function",
-                        "id": f"{self._context.iteration}-action",
-                        "function": {
-                            "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
-                        },
-                    }
-                ],
-            }
-        )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
-        return tool
+        tools = self._select_parallel_batch(tools)
+        self._add_action_calls(tools)
+        return tools if len(tools) > 1 else tools[0]
 
     async def _action_phase(self, tool: BaseTool) -> str:
         result = await tool(self._context)
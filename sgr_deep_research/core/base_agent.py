@@ -1,18 +1,28 @@
+import asyncio
+import functools
 import json
 import logging
 import os
+import time
 import traceback
 import uuid
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
-from typing import Type
+from typing import Awaitable, Callable, Type
 
-import httpx
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionFunctionToolParam
 
-from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
+from sgr_deep_research.core.context_compaction import ContextCompactor
+from sgr_deep_research.core.models import (
+    AgentStatesEnum,
+    ResearchContext,
+    TokenUsage,
+)
 from sgr_deep_research.core.prompts import PromptLoader
+from sgr_deep_research.core.step_logging import LazyMessage, truncate
 from sgr_deep_research.core.stream import OpenAIStreamingGenerator
+from sgr_deep_research.core.timing import notify as notify_timing_hooks
 from sgr_deep_research.core.tools import (
     # Base
     BaseTool,
@@ -20,11 +30,50 @@ from sgr_deep_research.core.tools import (
     ReasoningTool,
     system_agent_tools,
 )
+from sgr_deep_research.services.agent_log import AgentLogWriter
+from sgr_deep_research.services.llm_client import LLMClientPool
+from sgr_deep_research.services.rate_limiter import RateLimiter, estimate_tokens
 from sgr_deep_research.settings import get_config
 
 config = get_config()
 
 
+class _FirstEventTimer:
+    """Completion stream proxy that reports arrival of the first event."""
+
+    def __init__(self, stream, on_first_event: Callable[[], None]):
+        self._stream = stream
+        self._on_first_event = on_first_event
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    async def __aiter__(self):
+        first = True
+        async for event in self._stream:
+            if first:
+                first = False
+                self._on_first_event()
+            yield event
+
+
+class _BackpressureStream:
+    """Completion stream proxy that stops reading events while the client
+    stream queue is full."""
+
+    def __init__(self, stream, drain: Callable[[], Awaitable[None]]):
+        self._stream = stream
+        self._drain = drain
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    async def __aiter__(self):
+        async for event in self._stream:
+            yield event
+            await self._drain()
+
+
 class BaseAgent:
     """Base class for agents."""
 
@@ -36,6 +85,7 @@ class BaseAgent:
         toolkit: list[Type[BaseTool]] | None = None,
         max_iterations: int = 20,
         max_clarifications: int = 3,
+        openai_client: AsyncOpenAI | None = None,
     ):
         self.id = f"{self.name}_{uuid.uuid4()}"
         self.logger = logging.getLogger(f"sgr_deep_research.agents.{self.id}")
@@ -46,18 +96,91 @@ class BaseAgent:
         self._context = ResearchContext()
         self.conversation = []
         self.log = []
+        # JSONL file steps are appended to while the agent executes
+        self._log_path: str | None = None
+        self.log_field_max_chars = config.logging.step_field_max_chars
+        # per-iteration phase timings, saved with the agent log
+        self.timings: list[dict] = []
+        self._iteration_timings: dict = {"ttft": {}}
         self.max_iterations = max_iterations
         self.max_clarifications = max_clarifications
+        self.max_parallel_tool_calls = config.execution.max_parallel_tool_calls
+        self._compactor = ContextCompactor.from_config(
+            summarizer=self._summarize_tool_result
+        )
+
+        self._openai_client = openai_client
+        # phase of the current iteration, LLM usage is accounted to it
+        self._phase = "reasoning"
+        self.streaming_generator = OpenAIStreamingGenerator(
+            model=self.id,
+            max_queue_size=config.streaming.max_queue_size,
+            policy=config.streaming.queue_policy,
+            coalesce_window=config.streaming.coalesce_window,
+            coalesce_max_bytes=config.streaming.coalesce_max_bytes,
+            replay_buffer_size=config.streaming.replay_buffer_size,
+        )
 
-        client_kwargs = {"api_key": config.openai.api_key}
-        base_url = config.openai.base_url.strip()
-        if base_url:
-            client_kwargs["base_url"] = base_url
-        if config.openai.proxy.strip():
-            client_kwargs["http_client"] = httpx.AsyncClient(proxy=config.openai.proxy)
+    @property
+    def max_searches(self) -> int | None:
+        """Search limit, kept in the context so search tools can respect it."""
+        return self._context.max_searches
 
-        self.openai_client = AsyncOpenAI(**client_kwargs)
-        self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
+    @max_searches.setter
+    def max_searches(self, value: int | None):
+        self._context.max_searches = value
+
+    @property
+    def openai_client(self) -> AsyncOpenAI:
+        """Injected client or the process-wide pooled one."""
+        return self._openai_client or LLMClientPool.get_client()
+
+    @asynccontextmanager
+    async def _stream_completion(self, **kwargs):
+        """Open chat completion stream within the provider rate limits.
+
+        Estimated tokens are reserved before the call and corrected by
+        real usage when the completion reports it. Reported usage is
+        added to the current phase totals in the context.
+        """
+        if config.openai.stream_usage:
+            kwargs.setdefault("stream_options", {"include_usage": True})
+        rate_limiter = RateLimiter.for_provider("openai")
+        estimated_tokens = 0
+        if rate_limiter is not None:
+            estimated_tokens = estimate_tokens(
+                kwargs.get("messages", []), kwargs.get("max_tokens") or 0
+            )
+            await rate_limiter.acquire(estimated_tokens)
+
+        phase = self._phase
+        started_at = time.perf_counter()
+
+        def on_first_event():
+            seconds = time.perf_counter() - started_at
+            self._iteration_timings["ttft"].setdefault(phase, []).append(seconds)
+            notify_timing_hooks("on_first_token", self, phase, seconds)
+
+        async with self.openai_client.chat.completions.stream(**kwargs) as stream:
+            timed_stream = _FirstEventTimer(stream, on_first_event)
+            if self.streaming_generator is None:
+                yield timed_stream
+            else:
+                yield _BackpressureStream(timed_stream, self.streaming_generator.drain)
+
+        usage = (await stream.get_final_completion()).usage
+        if usage is None:
+            return
+        self._context.add_usage(
+            self._phase,
+            TokenUsage(
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                total_tokens=usage.total_tokens,
+            ),
+        )
+        if rate_limiter is not None:
+            rate_limiter.reconcile(estimated_tokens, usage.total_tokens)
 
     async def provide_clarification(self, clarifications: str):
         """Receive clarification from external source (e.g. user input)"""
@@ -73,11 +196,26 @@ class BaseAgent:
         self.logger.info(f"✅ Clarification received: {clarifications[:2000]}...")
 
     def _log_reasoning(self, result: ReasoningTool) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "%s", LazyMessage(functools.partial(self._format_reasoning, result))
+            )
+        self._log_step(
+            {
+                "step_number": self._context.iteration,
+                "timestamp": datetime.now().isoformat(),
+                "step_type": "reasoning",
+                "agent_reasoning": truncate(
+                    result.model_dump(), self.log_field_max_chars
+                ),
+            }
+        )
+
+    def _format_reasoning(self, result: ReasoningTool) -> str:
         next_step = (
             result.remaining_steps[0] if result.remaining_steps else "Completing"
         )
-        self.logger.info(
-            f"""
+        return f"""
     ###############################################
     🤖 LLM RESPONSE DEBUG:
        🧠 Reasoning Steps: {result.reasoning_steps}
@@ -90,69 +228,176 @@ class BaseAgent:
        🏁 Task Completed: {result.task_completed}
        ➡️ Next Step: {next_step}
     ###############################################"""
-        )
-        self.log.append(
+
+    def _log_tool_execution(self, tool: BaseTool, result: str):
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "%s",
+                LazyMessage(
+                    functools.partial(self._format_tool_execution, tool, result)
+                ),
+            )
+        self._log_step(
             {
                 "step_number": self._context.iteration,
                 "timestamp": datetime.now().isoformat(),
-                "step_type": "reasoning",
-                "agent_reasoning": result.model_dump(),
+                "step_type": "tool_execution",
+                "tool_name": tool.tool_name,
+                "agent_tool_context": truncate(
+                    tool.model_dump(), self.log_field_max_chars
+                ),
+                "agent_tool_execution_result": truncate(
+                    result, self.log_field_max_chars
+                ),
             }
         )
 
-    def _log_tool_execution(self, tool: BaseTool, result: str):
-        self.logger.info(
-            f"""
+    def _format_tool_execution(self, tool: BaseTool, result: str) -> str:
+        tool_model = truncate(tool.model_dump(), self.log_field_max_chars)
+        return f"""
 ###############################################
 🛠️ TOOL EXECUTION DEBUG:
     🔧 Tool Name: {tool.tool_name}
-    📋 Tool Model: {tool.model_dump_json(indent=2)}
+    📋 Tool Model: {json.dumps(tool_model, indent=2, ensure_ascii=False, default=str)}
     🔍 Result: '{result[:400]}...'
 ###############################################"""
+
+    def _log_step(self, entry: dict):
+        """Keep step in the agent log and append it to the log file."""
+        self.log.append(entry)
+        if self._log_path is not None:
+            AgentLogWriter.get().write(
+                self._log_path,
+                json.dumps(entry, ensure_ascii=False, default=str) + "\n",
+            )
+
+    def _open_agent_log(self):
+        self._log_path = os.path.join(
+            config.execution.logs_dir,
+            f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{self.id}-log.jsonl",
         )
-        self.log.append(
+        self._log_step(
             {
-                "step_number": self._context.iteration,
                 "timestamp": datetime.now().isoformat(),
-                "step_type": "tool_execution",
-                "tool_name": tool.tool_name,
-                "agent_tool_context": tool.model_dump(),
-                "agent_tool_execution_result": result,
+                "step_type": "agent",
+                "id": self.id,
+                "model_config": config.openai.model_dump(exclude={"api_key", "proxy"}),
+                "task": self.task,
+                "toolkit": [tool.tool_name for tool in self.toolkit],
             }
         )
 
-    def _save_agent_log(self):
-        logs_dir = config.execution.logs_dir
-        os.makedirs(logs_dir, exist_ok=True)
-        filepath = os.path.join(
-            logs_dir, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{self.id}-log.json"
+    async def _close_agent_log(self):
+        """Append run summary and wait until the log file is written."""
+        if self._log_path is None:
+            return
+        self._log_step(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "step_type": "summary",
+                "state": self._context.state.value,
+                "usage": self._context.usage.model_dump(),
+                "usage_by_phase": {
+                    phase: usage.model_dump()
+                    for phase, usage in self._context.usage_by_phase.items()
+                },
+                "timings": self.timings,
+            }
         )
-        agent_log = {
-            "id": self.id,
-            "model_config": config.openai.model_dump(exclude={"api_key", "proxy"}),
-            "task": self.task,
-            "toolkit": [tool.tool_name for tool in self.toolkit],
-            "log": self.log,
-        }
+        log_path, self._log_path = self._log_path, None
+        await AgentLogWriter.get().close(log_path)
 
-        json.dump(
-            agent_log,
-            open(filepath, "w", encoding="utf-8"),
-            indent=2,
-            ensure_ascii=False,
-        )
+    @contextmanager
+    def _timed_phase(self, phase: str, tool_name: str | None = None):
+        """Measure phase wall time and account LLM usage to the phase."""
+        self._phase = phase
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started_at
+            self._iteration_timings[phase] = seconds
+            if tool_name is not None:
+                self._iteration_timings["tool_name"] = tool_name
+            notify_timing_hooks("on_phase", self, phase, seconds, tool_name=tool_name)
+
+    @contextmanager
+    def _timed_tool(self, tool: BaseTool):
+        """Measure execution time of a single tool."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started_at
+            notify_timing_hooks("on_tool", self, tool.tool_name, seconds)
+
+    async def _summarize_tool_result(self, content: str) -> str:
+        """Summarize older tool result for context compaction."""
+        previous_phase, self._phase = self._phase, "compaction"
+        try:
+            async with self._stream_completion(
+                model=config.openai.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": PromptLoader.get_compaction_summary_prompt(),
+                    },
+                    {"role": "user", "content": content},
+                ],
+                max_tokens=config.compaction.summary_max_tokens,
+                temperature=0,
+            ) as stream:
+                async for _ in stream:
+                    pass
+            completion = await stream.get_final_completion()
+            return completion.choices[0].message.content or ""
+        finally:
+            self._phase = previous_phase
 
     async def _prepare_context(self) -> list[dict]:
-        """Prepare conversation context with system prompt."""
-        return [
+        """Prepare conversation context with system prompt.
+
+        Older tool results are compacted when the context exceeds the
+        configured token budget.
+        """
+        messages = [
             {"role": "system", "content": PromptLoader.get_system_prompt(self.toolkit)},
             *self.conversation,
         ]
+        if self._compactor is None:
+            return messages
+        messages, tokens_before, tokens_after = await self._compactor.compact(messages)
+        if tokens_after < tokens_before:
+            self.logger.info(
+                f"🗜️ Context compacted: {tokens_before} -> {tokens_after} tokens"
+            )
+            self._log_step(
+                {
+                    "step_number": self._context.iteration,
+                    "timestamp": datetime.now().isoformat(),
+                    "step_type": "context_compaction",
+                    "tokens_before": tokens_before,
+                    "tokens_after": tokens_after,
+                }
+            )
+        return messages
 
     async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
         """Prepare available tools for current agent state and progress."""
         raise NotImplementedError("_prepare_tools must be implemented by subclass")
 
+    def _ordered_tools(self, tools: set[Type[BaseTool]]) -> list[Type[BaseTool]]:
+        """Order tools as in toolkit, tools missing there go last by name.
+
+        Stable order keeps request prefix identical between calls, so
+        provider side prompt caching can reuse it.
+        """
+        positions = {tool: i for i, tool in reversed(list(enumerate(self.toolkit)))}
+        return sorted(
+            tools,
+            key=lambda tool: (positions.get(tool, len(positions)), tool.tool_name),
+        )
+
     async def _reasoning_phase(self) -> ReasoningTool:
         # """Call LLM to decide next action based on current context."""
         # raise NotImplementedError("_reasoning_phase must be implemented by subclass")
@@ -163,10 +408,13 @@ class BaseAgent:
             temperature=0,
         )
 
-    async def _select_action_phase(self, reasoning: ReasoningTool) -> BaseTool:
+    async def _select_action_phase(
+        self, reasoning: ReasoningTool
+    ) -> BaseTool | list[BaseTool]:
         """Select most suitable tool for the action decided in reasoning phase.
 
-        Returns the tool suitable for the action.
+        Returns the tool suitable for the action, or several independent
+        tools to be executed concurrently.
         """
         raise NotImplementedError(
             "_select_action_phase must be implemented by subclass"
@@ -179,10 +427,105 @@ class BaseAgent:
         """
         raise NotImplementedError("_action_phase must be implemented by subclass")
 
+    def _action_call_id(self, index: int = 0) -> str:
+        """Tool call id of the index-th action of the current iteration."""
+        suffix = f"-{index}" if index else ""
+        return f"{self._context.iteration}-action{suffix}"
+
+    def _select_parallel_batch(self, tools: list[BaseTool]) -> list[BaseTool]:
+        """Choose tool calls of one completion to execute in this iteration.
+
+        A tool that is not parallel_safe (clarification, final answer,
+        report, planning) runs alone. Otherwise parallel_safe calls are
+        kept in their original order and the rest are dropped. Searches
+        of kept calls are reserved from the remaining search limit here,
+        so a search call is kept only if it fits in what the calls before
+        it left. The first call always runs.
+        """
+        if not tools[0].parallel_safe:
+            batch, skipped = tools[:1], tools[1:]
+        else:
+            batch, skipped = [], []
+            searches_left = self._context.searches_left
+            for tool in tools:
+                if not tool.parallel_safe:
+                    skipped.append(tool)
+                    continue
+                if tool.search_cost() and searches_left is not None:
+                    if not tool.fit_searches(searches_left) and batch:
+                        skipped.append(tool)
+                        continue
+                    searches_left = max(searches_left - tool.search_cost(), 0)
+                batch.append(tool)
+        if skipped:
+            self.logger.warning(
+                f"Skipping tool calls: {[tool.tool_name for tool in skipped]}"
+            )
+        return batch
+
+    def _add_action_calls(self, tools: list[BaseTool], content: str | None = None):
+        """Add assistant message with the action tool calls to conversation."""
+        tool_calls = [
+            {
+                "type": "function",
+                "id": self._action_call_id(index),
+                "function": {
+                    "name": tool.tool_name,
+                    "arguments": tool.model_dump_json(),
+                },
+            }
+            for index, tool in enumerate(tools)
+        ]
+        self.conversation.append(
+            {"role": "assistant", "content": content, "tool_calls": tool_calls}
+        )
+        for tool_call in tool_calls:
+            self.streaming_generator.add_tool_call(
+                tool_call["id"],
+                tool_call["function"]["name"],
+                tool_call["function"]["arguments"],
+            )
+
+    async def _parallel_action_phase(self, tools: list[BaseTool]) -> list[str]:
+        """Execute independent tools concurrently.
+
+        At most max_parallel_tool_calls tools run at once. Results are
+        added to conversation in the order of the tool calls, whatever
+        order the tools finish in. A failing tool does not stop the
+        others, its call gets the error as result.
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel_tool_calls)
+
+        async def run(tool: BaseTool) -> str:
+            async with semaphore:
+                with self._timed_tool(tool):
+                    return await tool(self._context)
+
+        results = await asyncio.gather(
+            *(run(tool) for tool in tools), return_exceptions=True
+        )
+        for index, (tool, result) in enumerate(zip(tools, results)):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                self.logger.error(f"Error executing tool {tool.tool_name}: {result}")
+                result = results[index] = f"Error: {result}"
+            self.conversation.append(
+                {
+                    "role": "tool",
+                    "content": result,
+                    "tool_call_id": self._action_call_id(index),
+                }
+            )
+            self.streaming_generator.add_chunk_from_str(f"{result}\n")
+            self._log_tool_execution(tool, result)
+        return results
+
     async def execute(
         self,
     ):
         self.logger.info(f"🚀 Starting for task: '{self.task}'")
+        self._open_agent_log()
         self.conversation.extend(
             [
                 {
@@ -196,10 +539,35 @@ class BaseAgent:
                 self._context.iteration += 1
                 self.logger.info(f"Step {self._context.iteration} started")
 
-                reasoning = await self._reasoning_phase()
+                self._iteration_timings = {
+                    "iteration": self._context.iteration,
+                    "ttft": {},
+                }
+                iteration_started_at = time.perf_counter()
+
+                with self._timed_phase("reasoning"):
+                    reasoning = await self._reasoning_phase()
                 self._context.current_step_reasoning = reasoning
-                action_tool = await self._select_action_phase(reasoning)
-                await self._action_phase(action_tool)
+                with self._timed_phase("select_action"):
+                    action = await self._select_action_phase(reasoning)
+                # several independent tool calls may be selected at once
+                action_tools = action if isinstance(action, list) else [action]
+                action_tool = action_tools[0]
+                parallel = len(action_tools) > 1
+                # tools of a batch are timed one by one, the phase as a whole
+                tool_name = "parallel" if parallel else action_tool.tool_name
+                with self._timed_phase("tool", tool_name=tool_name):
+                    if parallel:
+                        await self._parallel_action_phase(action_tools)
+                    else:
+                        with self._timed_tool(action_tool):
+                            await self._action_phase(action_tool)
+
+                self._iteration_timings["total"] = (
+                    time.perf_counter() - iteration_started_at
+                )
+                self.timings.append(self._iteration_timings)
+                notify_timing_hooks("on_iteration", self, self._iteration_timings)
 
                 if isinstance(action_tool, ClarificationTool):
                     self.logger.info("\n⏸️  Research paused - please answer questions")
@@ -208,11 +576,15 @@ class BaseAgent:
                     await self._context.clarification_received.wait()
                     continue
 
+        except asyncio.CancelledError:
+            self.logger.warning("⏹️ Agent execution cancelled")
+            self._context.state = AgentStatesEnum.FAILED
+            raise
         except Exception as e:
             self.logger.error(f"❌ Agent execution error: {str(e)}")
             self._context.state = AgentStatesEnum.FAILED
             traceback.print_exc()
         finally:
             if self.streaming_generator is not None:
-                self.streaming_generator.finish()
-            self._save_agent_log()
+                self.streaming_generator.finish(usage=self._context.usage.model_dump())
+            await self._close_agent_log()
@@ -12,6 +12,7 @@ from sgr_deep_research.settings import get_config
 
 if TYPE_CHECKING:
     from sgr_deep_research.core.models import ResearchContext
+    from sgr_deep_research.services.mcp_service import MCPServerSession
 
 config = get_config()
 logger = logging.getLogger(__name__)
@@ -22,11 +23,21 @@ class BaseTool(BaseModel):
 
     tool_name: ClassVar[str] = None
     description: ClassVar[str] = None
+    # independent tools may run concurrently with other calls of one completion
+    parallel_safe: ClassVar[bool] = False
 
     async def __call__(self, context: ResearchContext) -> str:
         """Result should be a string or dumped json."""
         raise NotImplementedError("Execute method must be implemented by subclass")
 
+    def search_cost(self) -> int:
+        """Searches this call counts against the agent's search limit."""
+        return 0
+
+    def fit_searches(self, searches_left: int) -> bool:
+        """Whether this call can run within searches_left searches."""
+        return self.search_cost() <= searches_left
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         cls.tool_name = cls.tool_name or cls.__name__.lower()
@@ -37,15 +48,24 @@ class MCPBaseTool(BaseTool):
     """Base model for MCP Tool schema."""
 
     _client: ClassVar[Client | None] = None
+    # shared server session, without it every call opens _client itself
+    _session: ClassVar[MCPServerSession | None] = None
+    # name on the server when tool_name is prefixed with the server name
+    mcp_tool_name: ClassVar[str | None] = None
+    parallel_safe: ClassVar[bool] = True
 
     async def __call__(self, _context) -> str:
         payload = self.model_dump()
+        name = self.mcp_tool_name or self.tool_name
         try:
-            async with self._client:
-                result = await self._client.call_tool(self.tool_name, payload)
-                return json.dumps(
-                    [m.model_dump_json() for m in result.content], ensure_ascii=False
-                )[: config.mcp.context_limit]
+            if self._session is not None:
+                result = await self._session.call_tool(name, payload)
+            else:
+                async with self._client:
+                    result = await self._client.call_tool(name, payload)
+            return json.dumps(
+                [m.model_dump_json() for m in result.content], ensure_ascii=False
+            )[: config.mcp.context_limit]
         except Exception as e:
             logger.error(f"Error processing MCP tool {self.tool_name}: {e}")
             return f"Error: {e}"
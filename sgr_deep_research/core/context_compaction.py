@@ -0,0 +1,147 @@
+"""Agent conversation compaction.
+
+Once the prompt exceeds the token budget, tool results older than the
+latest steps are truncated or summarized, oldest first, until the prompt
+fits. The agent conversation itself is never modified, compaction is
+applied to the messages sent to the LLM.
+"""
+
+import logging
+import re
+from typing import Awaitable, Callable, Literal
+
+from sgr_deep_research.services.rate_limiter import estimate_tokens
+from sgr_deep_research.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+# source citations as rendered by SourceData.__str__
+CITATION_PATTERN = re.compile(r"^\[\d+\] .* - \S+$", re.MULTILINE)
+
+
+class ContextCompactor:
+    """Shortens older tool results of a conversation to fit a token
+    budget."""
+
+    def __init__(
+        self,
+        max_tokens: int,
+        keep_last_steps: int = 2,
+        strategy: Literal["truncate", "summarize"] = "truncate",
+        truncate_chars: int = 500,
+        summarizer: Callable[[str], Awaitable[str]] | None = None,
+    ):
+        self.max_tokens = max_tokens
+        self.keep_last_steps = keep_last_steps
+        self.strategy = strategy
+        self.truncate_chars = truncate_chars
+        self._summarizer = summarizer
+        # tool_call_id -> compacted content, each result is compacted once
+        self._compacted: dict[str, str] = {}
+
+    @classmethod
+    def from_config(
+        cls, summarizer: Callable[[str], Awaitable[str]] | None = None
+    ) -> "ContextCompactor | None":
+        """Compactor built from compaction settings, None if disabled."""
+        compaction_config = get_config().compaction
+        if not compaction_config.enabled:
+            return None
+        return cls(
+            max_tokens=compaction_config.max_context_tokens,
+            keep_last_steps=compaction_config.keep_last_steps,
+            strategy=compaction_config.strategy,
+            truncate_chars=compaction_config.truncate_chars,
+            summarizer=summarizer,
+        )
+
+    @staticmethod
+    def _step(message: dict) -> int | None:
+        """Agent iteration of a tool result from its '<iteration>-...'
+        id."""
+        step, _, _ = str(message.get("tool_call_id", "")).partition("-")
+        return int(step) if step.isdigit() else None
+
+    def _compactable_indexes(self, messages: list[dict]) -> list[int]:
+        """Indexes of tool results older than the latest steps, oldest
+        first."""
+        steps = {
+            i: self._step(message)
+            for i, message in enumerate(messages)
+            if message.get("role") == "tool" and isinstance(message.get("content"), str)
+        }
+        known_steps = [step for step in steps.values() if step is not None]
+        if not known_steps:
+            return []
+        first_kept_step = max(known_steps) - self.keep_last_steps + 1
+        return [
+            i
+            for i, step in steps.items()
+            if step is not None and step < first_kept_step
+        ]
+
+    def _truncate(self, content: str) -> str:
+        if len(content) <= self.truncate_chars:
+            return content
+        head = content[: self.truncate_chars]
+        citations = [
+            citation
+            for citation in dict.fromkeys(
+                CITATION_PATTERN.findall(content[self.truncate_chars :])
+            )
+            if citation not in head
+        ]
+        compacted = (
+            f"{head}\n\n[... {len(content) - len(head)} characters compacted ...]"
+        )
+        if citations:
+            compacted += "\n\nSources:\n" + "\n".join(citations)
+        return compacted
+
+    async def _summarize(self, content: str) -> str:
+        try:
+            summary = await self._summarizer(content)
+        except Exception as e:
+            logger.warning(f"Tool result summarization failed, truncating: {e}")
+            return self._truncate(content)
+        citations = [
+            citation
+            for citation in dict.fromkeys(CITATION_PATTERN.findall(content))
+            if citation not in summary
+        ]
+        if citations:
+            summary += "\n\nSources:\n" + "\n".join(citations)
+        return summary
+
+    async def _compact_content(self, content: str) -> str:
+        if self.strategy == "summarize" and self._summarizer is not None:
+            return await self._summarize(content)
+        return self._truncate(content)
+
+    async def compact(self, messages: list[dict]) -> tuple[list[dict], int, int]:
+        """Compact messages to fit the budget.
+
+        Returns compacted messages with estimated prompt tokens before
+        and after compaction.
+        """
+        tokens_before = estimate_tokens(messages)
+        if tokens_before <= self.max_tokens:
+            return messages, tokens_before, tokens_before
+
+        messages = list(messages)
+        tokens = tokens_before
+        for i in self._compactable_indexes(messages):
+            if tokens <= self.max_tokens:
+                break
+            message = messages[i]
+            content = message["content"]
+            key = message["tool_call_id"]
+            if key not in self._compacted:
+                self._compacted[key] = await self._compact_content(content)
+            compacted = self._compacted[key]
+            if len(compacted) >= len(content):
+                continue
+            messages[i] = {**message, "content": compacted}
+            tokens -= (len(content) - len(compacted)) // 4
+
+        return messages, tokens_before, estimate_tokens(messages)
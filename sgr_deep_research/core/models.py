@@ -49,6 +49,19 @@ class AgentStatesEnum(str, Enum):
     FINISH_STATES = {COMPLETED, FAILED, ERROR}
 
 
+class TokenUsage(BaseModel):
+    """LLM token usage counters."""
+
+    prompt_tokens: int = Field(default=0, description="Prompt tokens")
+    completion_tokens: int = Field(default=0, description="Completion tokens")
+    total_tokens: int = Field(default=0, description="Total tokens")
+
+    def add(self, usage: "TokenUsage") -> None:
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+        self.total_tokens += usage.total_tokens
+
+
 class ResearchContext(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
@@ -68,15 +81,38 @@ class ResearchContext(BaseModel):
     )
 
     searches_used: int = Field(default=0, description="Number of searches performed")
+    max_searches: int | None = Field(
+        default=None, description="Search limit of the agent, None for no limit"
+    )
 
     clarifications_used: int = Field(
         default=0, description="Number of clarifications requested"
     )
+    usage: TokenUsage = Field(
+        default_factory=TokenUsage, description="Agent cumulative token usage"
+    )
+    usage_by_phase: dict[str, TokenUsage] = Field(
+        default_factory=dict,
+        description="Token usage per agent phase (reasoning, select_action, tool)",
+    )
+
     clarification_received: asyncio.Event = Field(
         default_factory=asyncio.Event,
         description="Event for clarification synchronization",
     )
 
+    @property
+    def searches_left(self) -> int | None:
+        """Searches allowed before max_searches is reached, None without a
+        limit."""
+        if self.max_searches is None:
+            return None
+        return max(self.max_searches - self.searches_used, 0)
+
+    def add_usage(self, phase: str, usage: TokenUsage) -> None:
+        self.usage.add(usage)
+        self.usage_by_phase.setdefault(phase, TokenUsage()).add(usage)
+
     # ToDO: rename, my creativity finished now
     def agent_state(self) -> dict:
         return self.model_dump(
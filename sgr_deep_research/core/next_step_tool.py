@@ -3,12 +3,13 @@ from __future__ import annotations
 import logging
 import operator
 from abc import ABC
-from functools import reduce
-from typing import Annotated, Literal, Type, TypeVar
+from functools import lru_cache, reduce
+from typing import Annotated, ClassVar, Literal, Type, TypeVar
 
 from pydantic import BaseModel, Field, create_model
 
 from sgr_deep_research.core.base_tool import BaseTool
+from sgr_deep_research.core.tool_schemas import SCHEMA_CACHE_SIZE
 from sgr_deep_research.core.tools.reasoning_tool import ReasoningTool
 
 # from sgr_deep_research.core.models import AgentStatesEnum
@@ -41,38 +42,64 @@ class NextStepToolsBuilder:
     """SGR Core - Builder for NextStepTool with dynamic union tool function type on
     pydantic models level."""
 
+    # dynamic models are shared by all agents, pydantic compiles each once
+    _discriminant_tools: ClassVar[dict[Type[BaseTool], Type[BaseModel]]] = {}
+    _tool_unions: ClassVar[dict[tuple[Type[BaseTool], ...], Type]] = {}
+
     @classmethod
     def _create_discriminant_tool(cls, tool_class: Type[T]) -> Type[BaseModel]:
         """Create discriminant version of tool with tool_name as instance
-        field."""
-
-        return create_model(  # noqa
-            f"D_{tool_class.__name__}",
-            __base__=(tool_class, DiscriminantToolMixin),  # the order matters here
-            tool_name_discriminator=(
-                Literal[tool_class.tool_name],
-                Field(..., description="Tool name discriminator"),
-            ),
-        )
+        field, once per tool class."""
+        if tool_class not in cls._discriminant_tools:
+            cls._discriminant_tools[tool_class] = create_model(  # noqa
+                f"D_{tool_class.__name__}",
+                __base__=(tool_class, DiscriminantToolMixin),  # the order matters here
+                tool_name_discriminator=(
+                    Literal[tool_class.tool_name],
+                    Field(..., description="Tool name discriminator"),
+                ),
+            )
+        return cls._discriminant_tools[tool_class]
 
     @classmethod
     def _create_tool_types_union(cls, tools_list: list[Type[T]]) -> Type:
-        """Create discriminated union of tools."""
+        """Create discriminated union of tools, once per tool subset."""
+        key = tuple(tools_list)
+        if key in cls._tool_unions:
+            return cls._tool_unions[key]
         if len(tools_list) == 1:
-            return cls._create_discriminant_tool(tools_list[0])
-        # SGR inference struggles with choosing right schema otherwise
-        discriminant_tools = [
-            cls._create_discriminant_tool(tool) for tool in tools_list
-        ]
-        union = reduce(operator.or_, discriminant_tools)
-        return Annotated[union, Field()]
+            union = cls._create_discriminant_tool(tools_list[0])
+        else:
+            # SGR inference struggles with choosing right schema otherwise
+            discriminant_tools = [
+                cls._create_discriminant_tool(tool) for tool in tools_list
+            ]
+            union = Annotated[reduce(operator.or_, discriminant_tools), Field()]
+        cls._tool_unions[key] = union
+        return union
+
+    @classmethod
+    def clear_registry(cls) -> None:
+        """Drop registered dynamic models, e.g. after tools were rebuilt."""
+        cls._discriminant_tools.clear()
+        cls._tool_unions.clear()
+        cls._build_NextStepTools.cache_clear()
 
     @classmethod
     def build_NextStepTools(
         cls, tools_list: list[Type[T]]
+    ) -> Type[NextStepToolStub]:  # noqa
+        """NextStepTools model for tools in the given order, built once per
+        tool combination."""
+        return cls._build_NextStepTools(tuple(tools_list))
+
+    @classmethod
+    @lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+    def _build_NextStepTools(
+        cls, tools: tuple[Type[T], ...]
     ) -> Type[NextStepToolStub]:  # noqa
         return create_model(
             "NextStepTools",
             __base__=NextStepToolStub,
-            function=(cls._create_tool_types_union(tools_list), Field()),
+            function=(cls._create_tool_types_union(list(tools)), Field()),
         )
@@ -1,6 +1,6 @@
 import os
 from datetime import datetime
-from functools import cache
+from functools import cache, lru_cache
 
 from sgr_deep_research.core.tools import BaseTool
 from sgr_deep_research.settings import get_config
@@ -32,6 +32,15 @@ class PromptLoader:
     @classmethod
     def get_system_prompt(cls, available_tools: list[BaseTool]) -> str:
         template = cls._load_prompt_file(config.prompts.system_prompt_file)
+        return cls._format_system_prompt(template, tuple(available_tools))
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _format_system_prompt(
+        cls, template: str, available_tools: tuple[BaseTool, ...]
+    ) -> str:
+        """System prompt is rendered once per template and toolkit, so every
+        request of an agent starts with the same bytes."""
         available_tools_str_list = [
             f"{i}. {tool.tool_name}: {tool.description}"
             for i, tool in enumerate(available_tools, start=1)
@@ -57,3 +66,11 @@ class PromptLoader:
             clarifications=clarifications,
             current_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         )
+
+    @classmethod
+    def get_single_call_request(cls) -> str:
+        return cls._load_prompt_file("single_call_request.txt")
+
+    @classmethod
+    def get_compaction_summary_prompt(cls) -> str:
+        return cls._load_prompt_file("compaction_summary.txt")
@@ -0,0 +1,35 @@
+"""Cheap logging of agent steps.
+
+Step messages are formatted only when a handler emits them, and payloads
+kept in the agent log are cut to a per-field size instead of holding
+whole page texts.
+"""
+
+from typing import Any, Callable
+
+
+class LazyMessage:
+    """Log argument formatted when a handler emits the record."""
+
+    __slots__ = ("_render",)
+
+    def __init__(self, render: Callable[[], str]):
+        self._render = render
+
+    def __str__(self) -> str:
+        return self._render()
+
+
+def truncate(value: Any, max_chars: int) -> Any:
+    """Value with strings longer than max_chars cut, 0 keeps them whole."""
+    if max_chars <= 0:
+        return value
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value
+        return f"{value[:max_chars]}... [+{len(value) - max_chars} chars]"
+    if isinstance(value, dict):
+        return {key: truncate(item, max_chars) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [truncate(item, max_chars) for item in value]
+    return value
@@ -1,114 +1,395 @@
 import asyncio
 import json
+import logging
 import time
+import weakref
+from collections import deque
+from typing import Callable, ClassVar, Literal
 
 from openai.types.chat import ChatCompletionChunk
 
+# compact encoder for SSE payload fields, json.dumps builds a new one per call
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+logger = logging.getLogger(__name__)
+
+QueuePolicy = Literal["block", "drop_intermediate", "coalesce"]
+
 
 class StreamingGenerator:
-    def __init__(self):
-        self.queue = asyncio.Queue()
+    """Chunk queue between an agent and its streaming HTTP response.
+
+    With max_queue_size set, a full queue with an attached client is
+    handled by policy: "block" makes the producer wait in drain(),
+    "drop_intermediate" drops droppable deltas and "coalesce" merges
+    chunks into one pending tail chunk, queued once the client makes
+    room. After client disconnect the generator is detached for good,
+    queued data is released and new chunks are only kept for observers.
+
+    Every chunk is also kept in a ring buffer of the last
+    replay_buffer_size events. Any number of observers read it through
+    subscribe() with own cursors and may resume after a given event id.
+    Observers are never waited for, one falling behind the buffer skips
+    the evicted events.
+    """
+
+    # live generators for queue metrics
+    _instances: ClassVar[weakref.WeakSet] = weakref.WeakSet()
+    _disconnects_total: ClassVar[int] = 0
+
+    def __init__(
+        self,
+        max_queue_size: int = 0,
+        policy: QueuePolicy = "block",
+        replay_buffer_size: int = 1000,
+    ):
+        self.queue: asyncio.Queue[str | None] = asyncio.Queue()
+        # chunks merged by coalesce policy while the queue is full
+        self._pending_tail = ""
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+        self.dropped = 0
+        self.max_depth = 0
+        self.detached = False
+        self._consumers = 0
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._disconnect_callbacks: list[Callable[[], None]] = []
+        self._history: deque[tuple[int, str | None]] = deque(maxlen=replay_buffer_size)
+        self._next_event_id = 0
+        self._history_changed = asyncio.Event()
+        self.subscribers = 0
+        StreamingGenerator._instances.add(self)
+
+    @property
+    def last_event_id(self) -> int | None:
+        """Id of the latest event, None before the first one."""
+        return self._next_event_id - 1 if self._next_event_id else None
+
+    def _record(self, data: str | None):
+        self._history.append((self._next_event_id, data))
+        self._next_event_id += 1
+        if self.subscribers:
+            # wake up every waiting subscriber, later ones wait on a new event
+            self._history_changed.set()
+            self._history_changed = asyncio.Event()
+
+    def _is_full(self) -> bool:
+        # bound applies only while a client is reading, before that the
+        # first chunks are buffered for the client about to attach
+        return (
+            self.max_queue_size > 0
+            and self._consumers > 0
+            and self.queue.qsize() >= self.max_queue_size
+        )
 
-    def add(self, data: str):
+    def add(self, data: str, droppable: bool = False):
+        """Queue chunk, droppable chunks are intermediate deltas that
+        drop_intermediate policy may discard."""
+        self._record(data)
+        if self.detached:
+            self.dropped += 1
+            return
+        if self._is_full():
+            if self.policy == "drop_intermediate" and droppable:
+                self.dropped += 1
+                return
+            if self.policy == "coalesce":
+                self._pending_tail += data
+                return
+        self._queue_pending_tail()
+        self._put(data)
+
+    def _put(self, data: str | None):
         self.queue.put_nowait(data)
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def _queue_pending_tail(self):
+        if self._pending_tail:
+            self._put(self._pending_tail)
+            self._pending_tail = ""
+
+    async def drain(self):
+        """Wait until the client catches up with a full queue."""
+        while self.policy == "block" and self._is_full() and not self.detached:
+            self._writable.clear()
+            await self._writable.wait()
+
+    def on_disconnect(self, callback: Callable[[], None]):
+        """Register callback called when the client stops reading before
+        the end of stream."""
+        self._disconnect_callbacks.append(callback)
+
+    def _detach(self):
+        self.detached = True
+        StreamingGenerator._disconnects_total += 1
+        self._pending_tail = ""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self._writable.set()
+        for callback in self._disconnect_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Stream disconnect callback failed: {e}")
 
     def finish(self):
+        self._record(None)
+        self._queue_pending_tail()
         self.queue.put_nowait(None)  # Завершающий сигнал
 
     async def stream(self):
-        while True:
-            data = await self.queue.get()
-            if data is None:  # Завершающий символ
-                break
-            yield data
+        self._consumers += 1
+        finished = False
+        try:
+            while True:
+                data = await self.queue.get()
+                if self._pending_tail and not self._is_full():
+                    self._queue_pending_tail()
+                if self.queue.qsize() < self.max_queue_size:
+                    self._writable.set()
+                if data is None:  # Завершающий символ
+                    finished = True
+                    break
+                yield data
+        finally:
+            self._consumers -= 1
+            if not finished and not self._consumers:
+                logger.info("Stream client disconnected, detaching generator")
+                self._detach()
+
+    async def subscribe(self, last_event_id: int | None = None):
+        """Stream buffered and live events as SSE events with ids, starting
+        after last_event_id or from the oldest buffered event."""
+        cursor = 0 if last_event_id is None else last_event_id + 1
+        # ids from another stream must not make the subscriber wait for them
+        cursor = min(cursor, self._next_event_id)
+        self.subscribers += 1
+        try:
+            while True:
+                if cursor >= self._next_event_id:
+                    if self._history and self._history[-1][1] is None:
+                        break  # stream finished before the subscriber came
+                    await self._history_changed.wait()
+                    continue
+                oldest_id = self._history[0][0]
+                if cursor < oldest_id:
+                    logger.warning(
+                        f"Stream subscriber skipped {oldest_id - cursor} evicted events"
+                    )
+                    cursor = oldest_id
+                event_id, data = self._history[cursor - oldest_id]
+                cursor += 1
+                if data is None:
+                    break
+                yield f"id: {event_id}\n{data}"
+        finally:
+            self.subscribers -= 1
+
+    @classmethod
+    def collect_metrics(cls) -> dict[str, tuple[str, float]]:
+        generators = list(cls._instances)
+        return {
+            "sgr_stream_queue_depth": (
+                "Chunks queued in all client streams",
+                sum(generator.queue.qsize() for generator in generators),
+            ),
+            "sgr_stream_queue_depth_max": (
+                "Deepest queue observed among live client streams",
+                max((generator.max_depth for generator in generators), default=0),
+            ),
+            "sgr_stream_dropped_chunks": (
+                "Chunks dropped by live client streams",
+                sum(generator.dropped for generator in generators),
+            ),
+            "sgr_stream_disconnects_total": (
+                "Client streams detached before the end of stream",
+                cls._disconnects_total,
+            ),
+            "sgr_stream_subscribers": (
+                "Observers subscribed to live client streams",
+                sum(generator.subscribers for generator in generators),
+            ),
+        }
+
+
+def _coalesce_key(chunk) -> tuple | None:
+    """Key of a text or tool call arguments delta that can be merged with
+    following deltas of the same key, None for other chunks."""
+    choices = getattr(chunk, "choices", None)
+    if not choices or len(choices) != 1 or choices[0].finish_reason is not None:
+        return None
+    choice = choices[0]
+    delta = choice.delta
+    if delta.content and not delta.tool_calls:
+        return ("content", choice.index)
+    if not delta.content and delta.tool_calls and len(delta.tool_calls) == 1:
+        tool_call = delta.tool_calls[0]
+        if tool_call.function is not None and tool_call.function.arguments:
+            return ("arguments", choice.index, tool_call.index)
+    return None
+
+
+def _is_continuation(chunk) -> bool:
+    """Whether a delta only extends the previous one, the first delta of a
+    tool call carries its id and name."""
+    delta = chunk.choices[0].delta
+    if not delta.tool_calls:
+        return True
+    tool_call = delta.tool_calls[0]
+    return tool_call.id is None and tool_call.function.name is None
 
 
 class OpenAIStreamingGenerator(StreamingGenerator):
-    def __init__(self, model="gpt-4o"):
-        super().__init__()
+    """Streams chunks in OpenAI chat completion format.
+
+    With coalesce_window set, consecutive LLM text or tool call arguments
+    deltas are merged into one SSE event, flushed when the window elapses,
+    when coalesce_max_bytes are collected or when any other chunk is
+    added.
+    """
+
+    def __init__(
+        self,
+        model="gpt-4o",
+        max_queue_size: int = 0,
+        policy: QueuePolicy = "block",
+        coalesce_window: float = 0.0,
+        coalesce_max_bytes: int = 2048,
+        replay_buffer_size: int = 1000,
+    ):
+        super().__init__(
+            max_queue_size=max_queue_size,
+            policy=policy,
+            replay_buffer_size=replay_buffer_size,
+        )
         self.model = model
-        self.fingerprint = f"fp_{hex(hash(model))[-8:]}"
         self.id = f"chatcmpl-{int(time.time())}{hash(str(time.time()))}"[:29]
         self.created = int(time.time())
         self.choice_index = 0
+        self._envelope_key: tuple | None = None
+        self._envelope_prefix = ""
+        self._envelope()
+        self.coalesce_window = coalesce_window
+        self.coalesce_max_bytes = coalesce_max_bytes
+        self._pending: ChatCompletionChunk | None = None
+        self._pending_key: tuple | None = None
+        self._pending_parts: list[str] = []
+        self._pending_bytes = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
 
     def add_chunk(self, chunk: ChatCompletionChunk):
+        # usage-only chunk of include_usage stream, totals go to the final chunk
+        if getattr(chunk, "choices", None) == [] and chunk.usage is not None:
+            return
         chunk.model = self.model
-        super().add(f"data: {chunk.model_dump_json()}\n\n")
+        if self.coalesce_window <= 0:
+            super().add(f"data: {chunk.model_dump_json()}\n\n", droppable=True)
+            return
 
-    def add_chunk_from_str(self, content: str):
-        response = {
-            "id": self.id,
-            "object": "chat.completion.chunk",
-            "created": self.created,
-            "model": self.model,
-            "system_fingerprint": self.fingerprint,
-            "choices": [
+        key = _coalesce_key(chunk)
+        if self._pending is not None and not (
+            key == self._pending_key and _is_continuation(chunk)
+        ):
+            self.flush()
+        if key is None:
+            super().add(f"data: {chunk.model_dump_json()}\n\n", droppable=True)
+            return
+
+        delta = chunk.choices[0].delta
+        part = (
+            delta.content
+            if key[0] == "content"
+            else delta.tool_calls[0].function.arguments
+        )
+        if self._pending is None:
+            self._pending = chunk
+            self._pending_key = key
+            self._schedule_flush()
+        self._pending_parts.append(part)
+        self._pending_bytes += len(part.encode())
+        if self._pending_bytes >= self.coalesce_max_bytes:
+            self.flush()
+
+    def _schedule_flush(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop to wait in, chunks are flushed by later adds
+        self._flush_handle = loop.call_later(self.coalesce_window, self.flush)
+
+    def flush(self):
+        """Queue deltas merged so far as a single chunk."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending is None:
+            return
+        chunk = self._pending
+        if len(self._pending_parts) > 1:
+            text = "".join(self._pending_parts)
+            choice = chunk.choices[0]
+            delta = choice.delta
+            if self._pending_key[0] == "content":
+                delta = delta.model_copy(update={"content": text})
+            else:
+                tool_call = delta.tool_calls[0]
+                function = tool_call.function.model_copy(update={"arguments": text})
+                tool_call = tool_call.model_copy(update={"function": function})
+                delta = delta.model_copy(update={"tool_calls": [tool_call]})
+            choice = choice.model_copy(update={"delta": delta})
+            chunk = chunk.model_copy(update={"choices": [choice]})
+        self._pending = None
+        self._pending_key = None
+        self._pending_parts = []
+        self._pending_bytes = 0
+        super().add(f"data: {chunk.model_dump_json()}\n\n", droppable=True)
+
+    def _envelope(self) -> str:
+        """SSE event prefix with chunk fields shared by all events, rebuilt
+        only if the model or id are changed."""
+        if self._envelope_key != (self.id, self.model):
+            self._envelope_key = (self.id, self.model)
+            self.fingerprint = f"fp_{hex(hash(self.model))[-8:]}"
+            header = _dumps(
                 {
-                    "delta": {
-                        "content": content,
-                        "role": "assistant",
-                        "tool_calls": None,
-                    },
-                    "index": self.choice_index,
-                    "finish_reason": None,
-                    "logprobs": None,
+                    "id": self.id,
+                    "object": "chat.completion.chunk",
+                    "created": self.created,
+                    "model": self.model,
+                    "system_fingerprint": self.fingerprint,
                 }
-            ],
-            "usage": None,
-        }
-        super().add(f"data: {json.dumps(response)}\n\n")
+            )
+            self._envelope_prefix = f'data: {header[:-1]},"choices":['
+        return self._envelope_prefix
+
+    def add_chunk_from_str(self, content: str):
+        self.flush()
+        super().add(
+            f'{self._envelope()}{{"delta":{{"content":{_dumps(content)},'
+            f'"role":"assistant","tool_calls":null}},"index":{self.choice_index},'
+            f'"finish_reason":null,"logprobs":null}}],"usage":null}}\n\n'
+        )
 
     def add_tool_call(self, tool_call_id: str, function_name: str, arguments: str):
         """Добавляет tool call chunk."""
-        response = {
-            "id": self.id,
-            "object": "chat.completion.chunk",
-            "created": self.created,
-            "model": self.model,
-            "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
-            "choices": [
-                {
-                    "delta": {
-                        "tool_calls": [
-                            {
-                                "index": 0,
-                                "id": tool_call_id,
-                                "type": "function",
-                                "function": {
-                                    "name": function_name,
-                                    "arguments": arguments,
-                                },
-                            }
-                        ]
-                    },
-                    "index": self.choice_index,
-                    "logprobs": None,
-                    "finish_reason": None,
-                }
-            ],
-            "usage": None,
-        }
-        super().add(f"data: {json.dumps(response)}\n\n")
+        self.flush()
+        super().add(
+            f'{self._envelope()}{{"delta":{{"tool_calls":[{{"index":0,'
+            f'"id":{_dumps(tool_call_id)},"type":"function","function":'
+            f'{{"name":{_dumps(function_name)},"arguments":{_dumps(arguments)}}}}}]}},'
+            f'"index":{self.choice_index},"logprobs":null,"finish_reason":null}}],'
+            f'"usage":null}}\n\n'
+        )
 
-    def finish(self, finish_reason: str = "stop"):
+    def finish(self, finish_reason: str = "stop", usage: dict | None = None):
         """Завершает stream с финальным chunk и usage."""
-        final_response = {
-            "id": self.id,
-            "object": "chat.completion.chunk",
-            "created": self.created,
-            "model": self.model,
-            "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
-            "choices": [
-                {
-                    "index": self.choice_index,
-                    "delta": {},
-                    "logprobs": None,
-                    "finish_reason": finish_reason,
-                }
-            ],
-            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
-        }
-        super().add(f"data: {json.dumps(final_response)}\n\n")
+        self.flush()
+        usage = usage or {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        super().add(
+            f'{self._envelope()}{{"index":{self.choice_index},"delta":{{}},'
+            f'"logprobs":null,"finish_reason":{_dumps(finish_reason)}}}],'
+            f'"usage":{_dumps(usage)}}}\n\n'
+        )
         super().add("data: [DONE]\n\n")
         super().finish()
@@ -0,0 +1,102 @@
+"""Agent loop timing hooks.
+
+Agents report wall time of every phase, time to first token of every
+LLM stream and per-iteration summaries to registered hooks.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+from sgr_deep_research.services.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.base_agent import BaseAgent
+
+logger = logging.getLogger(__name__)
+
+
+class TimingHook:
+    """Base timing hook, override the callbacks you need."""
+
+    def on_first_token(self, agent: "BaseAgent", phase: str, seconds: float) -> None:
+        """LLM stream produced its first event."""
+
+    def on_phase(
+        self,
+        agent: "BaseAgent",
+        phase: str,
+        seconds: float,
+        tool_name: str | None = None,
+    ) -> None:
+        """Agent phase finished, tool_name is set for the tool phase.
+
+        The tool phase of several concurrent tools is named "parallel".
+        """
+
+    def on_tool(self, agent: "BaseAgent", tool_name: str, seconds: float) -> None:
+        """Tool finished, called once for every executed tool."""
+
+    def on_iteration(self, agent: "BaseAgent", timings: dict) -> None:
+        """Agent iteration finished with all its timings collected."""
+
+
+class PrometheusTimingHook(TimingHook):
+    """Export agent loop timings as histograms of MetricsRegistry."""
+
+    def __init__(self):
+        self.phase_seconds = MetricsRegistry.histogram(
+            "sgr_agent_phase_seconds",
+            "Agent phase wall time in seconds",
+            ("agent", "phase"),
+        )
+        self.ttft_seconds = MetricsRegistry.histogram(
+            "sgr_llm_time_to_first_token_seconds",
+            "Time from LLM request to first streamed event in seconds",
+            ("agent", "phase"),
+        )
+        self.tool_seconds = MetricsRegistry.histogram(
+            "sgr_tool_duration_seconds",
+            "Tool execution time in seconds",
+            ("tool",),
+        )
+        self.iteration_seconds = MetricsRegistry.histogram(
+            "sgr_agent_iteration_seconds",
+            "Agent iteration wall time in seconds",
+            ("agent",),
+        )
+
+    def on_first_token(self, agent: "BaseAgent", phase: str, seconds: float) -> None:
+        self.ttft_seconds.observe(seconds, agent=agent.name, phase=phase)
+
+    def on_phase(
+        self,
+        agent: "BaseAgent",
+        phase: str,
+        seconds: float,
+        tool_name: str | None = None,
+    ) -> None:
+        self.phase_seconds.observe(seconds, agent=agent.name, phase=phase)
+
+    def on_tool(self, agent: "BaseAgent", tool_name: str, seconds: float) -> None:
+        self.tool_seconds.observe(seconds, tool=tool_name)
+
+    def on_iteration(self, agent: "BaseAgent", timings: dict) -> None:
+        self.iteration_seconds.observe(timings["total"], agent=agent.name)
+
+
+timing_hooks: list[TimingHook] = [PrometheusTimingHook()]
+
+
+def register_timing_hook(hook: TimingHook) -> None:
+    """Add hook notified by all agents."""
+    timing_hooks.append(hook)
+
+
+def notify(callback: str, *args, **kwargs) -> None:
+    """Call hook callback on every registered hook, hook errors never
+    break the agent."""
+    for hook in timing_hooks:
+        try:
+            getattr(hook, callback)(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Timing hook {type(hook).__name__}.{callback} failed: {e}")
@@ -0,0 +1,42 @@
+"""Memoized tool schemas.
+
+Tool JSON schemas depend only on tool classes, so they are built once
+per tool combination instead of on every agent iteration.
+"""
+
+from functools import lru_cache
+from typing import Type
+
+from openai import pydantic_function_tool
+from openai.types.chat import ChatCompletionFunctionToolParam
+
+from sgr_deep_research.core.base_tool import BaseTool
+
+# tool combinations kept, agents use a handful of them per toolkit
+SCHEMA_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _build_function_tools(
+    tools: tuple[Type[BaseTool], ...],
+) -> tuple[ChatCompletionFunctionToolParam, ...]:
+    return tuple(
+        pydantic_function_tool(tool, name=tool.tool_name, description="")
+        for tool in tools
+    )
+
+
+def function_tools(
+    tools: list[Type[BaseTool]],
+) -> list[ChatCompletionFunctionToolParam]:
+    """Function tool params of tools in the given order."""
+    return list(_build_function_tools(tuple(tools)))
+
+
+def clear_schema_cache() -> None:
+    """Drop memoized schemas, e.g. after tool classes were rebuilt."""
+    # imported here to avoid circular import through core.tools
+    from sgr_deep_research.core.next_step_tool import NextStepToolsBuilder
+
+    _build_function_tools.cache_clear()
+    NextStepToolsBuilder.clear_registry()
@@ -14,6 +14,7 @@ from sgr_deep_research.core.tools.extract_page_content_tool import (
 )
 from sgr_deep_research.core.tools.final_answer_tool import FinalAnswerTool
 from sgr_deep_research.core.tools.generate_plan_tool import GeneratePlanTool
+from sgr_deep_research.core.tools.multi_web_search_tool import MultiWebSearchTool
 from sgr_deep_research.core.tools.reasoning_tool import ReasoningTool
 from sgr_deep_research.core.tools.web_search_tool import WebSearchTool
 
@@ -28,6 +29,7 @@ system_agent_tools = [
 
 research_agent_tools = [
     WebSearchTool,
+    MultiWebSearchTool,
     ExtractPageContentTool,
     CreateReportTool,
 ]
@@ -42,6 +44,7 @@ __all__ = [
     "ClarificationTool",
     "GeneratePlanTool",
     "WebSearchTool",
+    "MultiWebSearchTool",
     "ExtractPageContentTool",
     "AdaptPlanTool",
     "CreateReportTool",
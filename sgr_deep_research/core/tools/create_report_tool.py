@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import json
 import logging
-import os
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 from pydantic import Field
 
 from sgr_deep_research.core.base_tool import BaseTool
+from sgr_deep_research.services.report_storage import (
+    ReportStorage,
+    build_report_storage,
+)
 from sgr_deep_research.settings import get_config
 
 if TYPE_CHECKING:
@@ -27,6 +31,9 @@ class CreateReportTool(BaseTool):
     Citations must be integrated directly into sentences, not just listed at the end.
     """
 
+    # custom report backend, reports are saved to reports_dir when not set
+    storage: ClassVar[ReportStorage | None] = None
+
     reasoning: str = Field(description="Why ready to create report now")
     title: str = Field(description="Report title")
     user_request_language_reference: str = Field(
@@ -43,15 +50,11 @@ class CreateReportTool(BaseTool):
     )
 
     async def __call__(self, context: ResearchContext) -> str:
-        # Save report
-        reports_dir = config.execution.reports_dir
-        os.makedirs(reports_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_title = "".join(
             c for c in self.title if c.isalnum() or c in (" ", "-", "_")
         )[:50]
         filename = f"{timestamp}_{safe_title}.md"
-        filepath = os.path.join(reports_dir, filename)
 
         # Format full report with sources
         full_content = f"# {self.title}\n\n"
@@ -66,8 +69,14 @@ class CreateReportTool(BaseTool):
                 [str(source) for source in context.sources.values()]
             )
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(full_content)
+        # Save report
+        storage = self.storage or build_report_storage(
+            reports_dir=config.execution.reports_dir,
+            compression=config.execution.report_compression,
+        )
+        write_started_at = time.perf_counter()
+        filepath = await storage.save(filename, full_content)
+        write_seconds = time.perf_counter() - write_started_at
 
         report = {
             "title": self.title,
@@ -76,6 +85,7 @@ class CreateReportTool(BaseTool):
             "sources_count": len(context.sources),
             "word_count": len(self.content.split()),
             "filepath": filepath,
+            "write_seconds": round(write_seconds, 4),
             "timestamp": datetime.now().isoformat(),
         }
         logger.info(
@@ -86,6 +96,6 @@ class CreateReportTool(BaseTool):
             f"   📈 Confidence: {self.confidence}\n"
             f"   📄 Content Preview: '{self.content[:200]}...'\n"
             f"   📊 Words: {report['word_count']}, Sources: {report['sources_count']}\n"
-            f"   💾 Saved: {filepath}\n"
+            f"   💾 Saved: {filepath} in {write_seconds:.3f}s\n"
         )
         return json.dumps(report, indent=2, ensure_ascii=False)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from pydantic import Field
 
 from sgr_deep_research.core.base_tool import BaseTool
+from sgr_deep_research.core.models import SourceData
 from sgr_deep_research.services.tavily_search import TavilySearchService
 from sgr_deep_research.settings import get_config
 
@@ -33,6 +34,8 @@ class ExtractPageContentTool(BaseTool):
         - For date/number questions, cross-check extracted values with search snippets
     """
 
+    parallel_safe: ClassVar[bool] = True
+
     reasoning: str = Field(description="Why extract these specific pages")
     urls: list[str] = Field(
         description="List of URLs to extract full content from",
@@ -42,12 +45,41 @@ class ExtractPageContentTool(BaseTool):
         super().__init__(**data)
         self._search_service = TavilySearchService()
 
+    async def _get_cached_sources(self) -> tuple[list[SourceData], list[str]]:
+        """Split requested URLs into cached sources and URLs to extract."""
+        page_cache = TavilySearchService.page_cache()
+        urls = list(dict.fromkeys(self.urls))
+        if page_cache is None:
+            return [], urls
+
+        sources, missing_urls = [], []
+        for url in urls:
+            cached = await page_cache.get(url)
+            if cached is None:
+                missing_urls.append(url)
+            else:
+                sources.append(SourceData.model_validate(cached))
+        return sources, missing_urls
+
+    async def _cache_sources(self, sources: list[SourceData]):
+        page_cache = TavilySearchService.page_cache()
+        if page_cache is None:
+            return
+        for source in sources:
+            if source.full_content:
+                await page_cache.set(source.url, source.model_dump())
+
     async def __call__(self, context: ResearchContext) -> str:
         """Extract full content from specified URLs."""
 
         logger.info(f"📄 Extracting content from {len(self.urls)} URLs")
 
-        sources = await self._search_service.extract(urls=self.urls)
+        sources, missing_urls = await self._get_cached_sources()
+        served_locally = len(sources)
+        if missing_urls:
+            extracted = await self._search_service.extract(urls=missing_urls)
+            await self._cache_sources(extracted)
+            sources.extend(extracted)
 
         # Update existing sources instead of overwriting
         for source in sources:
@@ -82,5 +114,11 @@ class ExtractPageContentTool(BaseTool):
                         f"{str(source)}\n*Failed to extract content*\n\n"
                     )
 
+        if served_locally:
+            logger.info(f"📄 {served_locally} URLs served from local page cache")
+            formatted_result += (
+                f"*[{served_locally} of {len(self.urls)} URLs served from cache]*\n"
+            )
+
         logger.debug(formatted_result[:500])
         return formatted_result
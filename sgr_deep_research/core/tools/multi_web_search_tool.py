@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, ClassVar
+
+from pydantic import Field
+
+from sgr_deep_research.core.base_tool import BaseTool
+from sgr_deep_research.core.models import SearchResult, SourceData
+from sgr_deep_research.services.tavily_search import TavilySearchService
+from sgr_deep_research.settings import get_config
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.models import ResearchContext
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+config = get_config()
+
+
+class MultiWebSearchTool(BaseTool):
+    """Run several web searches at once and get one merged list of results.
+    Use this tool instead of repeated WebSearchTool calls when you already know
+    several queries to run, e.g. the search strategies of your research plan.
+    Queries are executed concurrently, results found by more than one query are
+    listed once.
+    Returns: Page titles, URLs, and short snippets (100 characters)
+    Best for: Covering several aspects of the task in one step
+
+    Usage:
+        - Each query should cover a DIFFERENT aspect, do not rephrase the same query
+        - Use SPECIFIC terms and context in queries
+        - Search queries in SAME LANGUAGE as user request
+        - Every query counts towards the search limit
+        - Use ExtractPageContentTool to get full content from found URLs
+    """
+
+    parallel_safe: ClassVar[bool] = True
+
+    reasoning: str = Field(description="Why these searches are needed")
+    queries: list[str] = Field(
+        description="Search queries in same language as user request",
+        min_length=1,
+        max_length=5,
+    )
+    max_results: int = Field(
+        default_factory=lambda: min(config.search.max_results, 10),
+        description="Maximum results per query",
+    )
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self._search_service = TavilySearchService()
+
+    def search_cost(self) -> int:
+        return len(self.queries)
+
+    def fit_searches(self, searches_left: int) -> bool:
+        """Drop queries beyond searches_left, False if none are left."""
+        if len(self.queries) > searches_left:
+            logger.warning(
+                f"Search limit reached, dropping queries: {self.queries[searches_left:]}"
+            )
+            self.queries = self.queries[:searches_left]
+        return bool(self.queries)
+
+    async def __call__(self, context: ResearchContext) -> str:
+        """Execute all queries concurrently and merge results by URL."""
+
+        if not self.queries:
+            return "Search limit reached, no queries were run."
+
+        logger.info(f"🔍 Search queries: {self.queries}")
+
+        results = await asyncio.gather(
+            *(
+                self._search_service.search(
+                    query=query,
+                    max_results=self.max_results,
+                    include_raw_content=False,
+                )
+                for query in self.queries
+            )
+        )
+
+        merged: dict[str, SourceData] = {}
+        for query, sources in zip(self.queries, results):
+            citations = []
+            for source in sources:
+                if source.url in context.sources:
+                    # URL found earlier, keep its original number
+                    source = context.sources[source.url]
+                else:
+                    source.number = len(context.sources) + 1
+                    context.sources[source.url] = source
+                citations.append(source)
+                merged.setdefault(source.url, source)
+            context.searches.append(
+                SearchResult(
+                    query=query,
+                    answer=None,
+                    citations=citations,
+                    timestamp=datetime.now(),
+                )
+            )
+        context.searches_used += len(self.queries)
+
+        formatted_result = f"Search Queries: {'; '.join(self.queries)}\n\n"
+        formatted_result += "Search Results (titles, links, short snippets):\n\n"
+
+        for source in merged.values():
+            snippet = (
+                source.snippet[:100] + "..."
+                if len(source.snippet) > 100
+                else source.snippet
+            )
+            formatted_result += f"{str(source)}\n{snippet}\n\n"
+
+        logger.debug(formatted_result)
+        return formatted_result
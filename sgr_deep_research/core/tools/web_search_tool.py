@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from pydantic import Field
 
@@ -44,6 +44,8 @@ class WebSearchTool(BaseTool):
         - If snippet directly answers the question, you may not need to extract full page
     """
 
+    parallel_safe: ClassVar[bool] = True
+
     reasoning: str = Field(description="Why this search is needed and what to expect")
     query: str = Field(description="Search query in same language as user request")
     max_results: int = Field(
@@ -55,6 +57,9 @@ class WebSearchTool(BaseTool):
         super().__init__(**data)
         self._search_service = TavilySearchService()
 
+    def search_cost(self) -> int:
+        return 1
+
     async def __call__(self, context: ResearchContext) -> str:
         """Execute web search using TavilySearchService."""
 
@@ -1,9 +1,37 @@
 """Services module for external integrations and business logic."""
 
+from sgr_deep_research.services.agent_scheduler import (
+    AgentScheduler,
+    SchedulerFullError,
+)
+from sgr_deep_research.services.agent_store import (
+    AgentStore,
+    InMemoryAgentStore,
+    SQLiteAgentStore,
+)
+from sgr_deep_research.services.cache import BaseCache, MemoryCache, SQLiteCache
+from sgr_deep_research.services.llm_client import LLMClientPool
 from sgr_deep_research.services.mcp_service import MCP2ToolConverter
+from sgr_deep_research.services.rate_limiter import RateLimiter
+from sgr_deep_research.services.report_storage import (
+    LocalReportStorage,
+    ReportStorage,
+)
 from sgr_deep_research.services.tavily_search import TavilySearchService
 
 __all__ = [
     "TavilySearchService",
     "MCP2ToolConverter",
+    "LLMClientPool",
+    "BaseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "AgentStore",
+    "InMemoryAgentStore",
+    "SQLiteAgentStore",
+    "AgentScheduler",
+    "SchedulerFullError",
+    "RateLimiter",
+    "ReportStorage",
+    "LocalReportStorage",
 ]
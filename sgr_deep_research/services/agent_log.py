@@ -0,0 +1,144 @@
+"""Agent log persistence.
+
+Agent steps are appended to JSONL files as they happen. File I/O runs
+in a single background writer thread, so it never blocks the event loop.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+from typing import IO, Callable, ClassVar
+
+from sgr_deep_research.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+# lines written by the thread before buffered files are flushed
+BATCH_SIZE = 1000
+
+
+class AgentLogWriter:
+    """Background thread appending lines to agent log files.
+
+    Lines wait in a bounded buffer. When it is full, new lines are
+    dropped and counted instead of blocking the event loop. Files are
+    flushed after every batch, so written steps survive a crash of the
+    process.
+    """
+
+    _instance: ClassVar["AgentLogWriter | None"] = None
+
+    def __init__(self, max_buffered: int = 10000):
+        # items are (path, line, on_closed), line None closes the file
+        self._queue: queue.Queue = queue.Queue(maxsize=max_buffered)
+        self._files: dict[str, IO[str]] = {}
+        self.written = 0
+        self.dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="agent-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def get(cls) -> "AgentLogWriter":
+        """Shared writer, started on first use."""
+        if cls._instance is None:
+            cls._instance = cls(max_buffered=get_config().execution.log_buffer_size)
+        return cls._instance
+
+    def write(self, path: str, line: str) -> None:
+        """Queue line to be appended to the file at path."""
+        try:
+            self._queue.put_nowait((path, line, None))
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(
+                    f"Agent log buffer is full, {self.dropped} lines dropped"
+                )
+
+    async def close(self, path: str) -> None:
+        """Wait until queued lines of path are written, then close it."""
+        loop = asyncio.get_running_loop()
+        closed = loop.create_future()
+
+        def on_closed():
+            try:
+                loop.call_soon_threadsafe(_resolve, closed)
+            except RuntimeError:
+                pass  # event loop already closed
+
+        item = (path, None, on_closed)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # closing must not be dropped, wait for space off the loop
+            await asyncio.to_thread(self._queue.put, item)
+        await closed
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: list[tuple[str, str | None, Callable | None]]):
+        touched = set()
+        for path, line, on_closed in batch:
+            try:
+                if line is None:
+                    touched.discard(path)
+                    file = self._files.pop(path, None)
+                    if file is not None:
+                        file.close()
+                    continue
+                file = self._files.get(path)
+                if file is None:
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    file = self._files[path] = open(path, "a", encoding="utf-8")
+                file.write(line)
+                touched.add(path)
+                self.written += 1
+            except OSError as e:
+                logger.error(f"Agent log write to {path} failed: {e}")
+            finally:
+                if on_closed is not None:
+                    on_closed()
+        for path in touched:
+            try:
+                self._files[path].flush()
+            except OSError as e:
+                logger.error(f"Agent log flush of {path} failed: {e}")
+
+    @property
+    def buffered(self) -> int:
+        return self._queue.qsize()
+
+    @classmethod
+    def collect_metrics(cls) -> dict[str, tuple[str, float]]:
+        writer = cls._instance
+        return {
+            "sgr_agent_log_buffered_lines": (
+                "Agent log lines waiting for the writer thread",
+                writer.buffered if writer else 0,
+            ),
+            "sgr_agent_log_written_lines": (
+                "Agent log lines written to files",
+                writer.written if writer else 0,
+            ),
+            "sgr_agent_log_dropped_lines": (
+                "Agent log lines dropped as the buffer was full",
+                writer.dropped if writer else 0,
+            ),
+        }
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
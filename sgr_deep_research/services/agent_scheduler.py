@@ -0,0 +1,149 @@
+import asyncio
+import functools
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from typing import Coroutine
+
+from pydantic import BaseModel, Field, computed_field
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerFullError(Exception):
+    """Raised when both execution slots and admission queue are full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Agent queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class SchedulerMetrics(BaseModel):
+    """Agent scheduler counters."""
+
+    running: int = Field(default=0, description="Agents currently executing")
+    queued: int = Field(default=0, description="Agents waiting for a slot")
+    admitted: int = Field(default=0, description="Agents that got a slot")
+    rejected: int = Field(default=0, description="Agents rejected as queue was full")
+    wait_time_total: float = Field(
+        default=0.0, description="Total time agents spent in queue, seconds"
+    )
+    wait_time_max: float = Field(
+        default=0.0, description="Longest time an agent spent in queue, seconds"
+    )
+
+    @computed_field
+    @property
+    def wait_time_avg(self) -> float:
+        return self.wait_time_total / self.admitted if self.admitted else 0.0
+
+
+class AgentScheduler:
+    """Bounds the number of concurrently executing agents.
+
+    Agents over the concurrency limit wait in a priority queue (higher
+    model priority first, FIFO within the same priority). When the
+    queue is full too, submit raises SchedulerFullError.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queued: int,
+        retry_after: int,
+        priorities: dict[str, int] | None = None,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.retry_after = retry_after
+        self.priorities = priorities or {}
+        self.metrics = SchedulerMetrics()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    def collect_metrics(self) -> dict[str, tuple[str, float]]:
+        """Scheduler gauges for MetricsRegistry."""
+        return {
+            "sgr_scheduler_running_agents": (
+                "Agents currently executing",
+                self.metrics.running,
+            ),
+            "sgr_scheduler_queued_agents": (
+                "Agents waiting for an execution slot",
+                self.metrics.queued,
+            ),
+            "sgr_scheduler_rejected_agents_total": (
+                "Agents rejected because the queue was full",
+                self.metrics.rejected,
+            ),
+            "sgr_scheduler_wait_seconds_avg": (
+                "Average time agents spent in queue",
+                self.metrics.wait_time_avg,
+            ),
+            "sgr_scheduler_wait_seconds_max": (
+                "Longest time an agent spent in queue",
+                self.metrics.wait_time_max,
+            ),
+        }
+
+    def submit(self, coro: Coroutine, model: str = "") -> asyncio.Task:
+        """Schedule agent coroutine, admission is decided synchronously."""
+        slot = None
+        if self.metrics.running < self.max_concurrent and not self._waiters:
+            self.metrics.running += 1
+        elif len(self._waiters) >= self.max_queued:
+            coro.close()
+            self.metrics.rejected += 1
+            raise SchedulerFullError(self.retry_after)
+        else:
+            slot = asyncio.get_running_loop().create_future()
+            priority = self.priorities.get(model, 0)
+            heapq.heappush(self._waiters, (-priority, next(self._counter), slot))
+            self.metrics.queued = len(self._waiters)
+
+        task = asyncio.create_task(self._run(coro, slot, time.monotonic()))
+        task.add_done_callback(functools.partial(self._on_task_done, coro, slot))
+        return task
+
+    async def _run(
+        self, coro: Coroutine, slot: asyncio.Future | None, enqueued_at: float
+    ):
+        if slot is not None:
+            await slot
+        wait_time = time.monotonic() - enqueued_at
+        self.metrics.admitted += 1
+        self.metrics.wait_time_total += wait_time
+        self.metrics.wait_time_max = max(self.metrics.wait_time_max, wait_time)
+        if wait_time > 1:
+            logger.info(f"Agent admitted after {wait_time:.1f}s in queue")
+        try:
+            return await coro
+        finally:
+            self._release()
+
+    def _release(self):
+        # hand the slot over to the next waiter, otherwise free it
+        while self._waiters:
+            _, _, slot = heapq.heappop(self._waiters)
+            self.metrics.queued = len(self._waiters)
+            if not slot.done():
+                slot.set_result(None)
+                return
+        self.metrics.running -= 1
+
+    def _on_task_done(
+        self, coro: Coroutine, slot: asyncio.Future | None, task: asyncio.Task
+    ):
+        # started coroutines release their slot themselves
+        if inspect.getcoroutinestate(coro) != inspect.CORO_CREATED:
+            return
+        coro.close()
+        if slot is None or (slot.done() and not slot.cancelled()):
+            # slot was granted, but the task was cancelled before using it
+            self._release()
+            return
+        self._waiters = [w for w in self._waiters if w[2] is not slot]
+        heapq.heapify(self._waiters)
+        self.metrics.queued = len(self._waiters)
@@ -0,0 +1,282 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+
+from sgr_deep_research.core.models import AgentStatesEnum
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.agents import BaseAgent
+
+logger = logging.getLogger(__name__)
+
+
+# FINISH_STATES.value is stringified by the str mixin, so members are listed here
+FINISHED_STATES = frozenset(
+    {AgentStatesEnum.COMPLETED, AgentStatesEnum.FAILED, AgentStatesEnum.ERROR}
+)
+
+
+def _is_finished(agent: "BaseAgent") -> bool:
+    return agent._context.state in FINISHED_STATES
+
+
+class AgentSummary(BaseModel):
+    """Lightweight agent description used for listings."""
+
+    agent_id: str = Field(description="Agent ID")
+    task: str = Field(description="Agent task")
+    state: str = Field(description="Current agent state")
+    creation_time: datetime = Field(description="Agent creation time")
+
+    @classmethod
+    def from_agent(cls, agent: "BaseAgent") -> "AgentSummary":
+        return cls(
+            agent_id=agent.id,
+            task=agent.task,
+            state=agent._context.state,
+            creation_time=agent.creation_time,
+        )
+
+
+class AgentSnapshot(AgentSummary):
+    """Detached copy of agent ResearchContext and conversation."""
+
+    sources_count: int = Field(default=0, description="Number of sources found")
+    context: dict[str, Any] = Field(
+        default_factory=dict, description="ResearchContext.agent_state() dump"
+    )
+    conversation: list[dict[str, Any]] = Field(
+        default_factory=list, description="Agent conversation history"
+    )
+
+    @classmethod
+    def from_agent(
+        cls, agent: "BaseAgent", include_conversation: bool = False
+    ) -> "AgentSnapshot":
+        return cls(
+            agent_id=agent.id,
+            task=agent.task,
+            state=agent._context.state,
+            creation_time=agent.creation_time,
+            sources_count=len(agent._context.sources),
+            context=agent._context.model_dump(
+                mode="json", exclude={"searches", "sources", "clarification_received"}
+            ),
+            conversation=(
+                json.loads(json.dumps(agent.conversation, default=str))
+                if include_conversation
+                else []
+            ),
+        )
+
+
+class AgentStore(MutableMapping[str, "BaseAgent"], ABC):
+    """Registry of agents served by the API.
+
+    Behaves as a mapping of live agent objects (needed to stream and to
+    deliver clarifications). Finished agents may be dropped from memory
+    by the implementation; their state stays available through
+    snapshots.
+    """
+
+    def __init__(self):
+        self._agents: OrderedDict[str, "BaseAgent"] = OrderedDict()
+
+    def __getitem__(self, agent_id: str) -> "BaseAgent":
+        agent = self._agents[agent_id]
+        self._agents.move_to_end(agent_id)
+        return agent
+
+    def __setitem__(self, agent_id: str, agent: "BaseAgent") -> None:
+        self._agents[agent_id] = agent
+        self._agents.move_to_end(agent_id)
+        self._evict()
+
+    def __delitem__(self, agent_id: str) -> None:
+        del self._agents[agent_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._agents))
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def _evict(self) -> None:
+        """Drop finished agents that are no longer worth keeping in
+        memory."""
+
+    @abstractmethod
+    async def finalize(self, agent_id: str) -> None:
+        """Called once agent execution is over."""
+
+    @abstractmethod
+    async def get_snapshot(self, agent_id: str) -> AgentSnapshot | None: ...
+
+    @abstractmethod
+    async def list_summaries(self) -> list[AgentSummary]: ...
+
+
+class InMemoryAgentStore(AgentStore):
+    """Keeps agents in memory, evicting finished ones by LRU order and
+    TTL.
+
+    Running agents are never evicted.
+    """
+
+    def __init__(self, max_finished_agents: int, finished_ttl: float):
+        super().__init__()
+        self.max_finished_agents = max_finished_agents
+        self.finished_ttl = finished_ttl
+        self._finished_at: dict[str, float] = {}
+
+    def __delitem__(self, agent_id: str) -> None:
+        super().__delitem__(agent_id)
+        self._finished_at.pop(agent_id, None)
+
+    def clear(self) -> None:
+        self._agents.clear()
+        self._finished_at.clear()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        # mapping order is LRU order, least recently used first
+        finished = [i for i, agent in self._agents.items() if _is_finished(agent)]
+        for agent_id in finished:
+            self._finished_at.setdefault(agent_id, now)
+        expired = {
+            i for i in finished if now - self._finished_at[i] >= self.finished_ttl
+        }
+        retained = [i for i in finished if i not in expired]
+        overflow = retained[: max(len(retained) - self.max_finished_agents, 0)]
+        for agent_id in [*expired, *overflow]:
+            del self[agent_id]
+
+    async def finalize(self, agent_id: str) -> None:
+        self._evict()
+
+    async def get_snapshot(self, agent_id: str) -> AgentSnapshot | None:
+        self._evict()
+        agent = self._agents.get(agent_id)
+        return AgentSnapshot.from_agent(agent) if agent is not None else None
+
+    async def list_summaries(self) -> list[AgentSummary]:
+        self._evict()
+        return [AgentSummary.from_agent(agent) for agent in self._agents.values()]
+
+
+class SQLiteAgentStore(AgentStore):
+    """Keeps running agents in memory and persists finished ones to SQLite.
+
+    On finish the agent ResearchContext and conversation are snapshotted
+    and the agent object is released. Listings read only indexed summary
+    columns. Blocking sqlite calls are offloaded to a worker thread.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS agents ("
+                "agent_id TEXT PRIMARY KEY, task TEXT NOT NULL, "
+                "state TEXT NOT NULL, creation_time TEXT NOT NULL, "
+                "snapshot TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS agents_creation_time "
+                "ON agents (creation_time)"
+            )
+
+    def clear(self) -> None:
+        self._agents.clear()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM agents")
+
+    def _save_sync(self, snapshot: AgentSnapshot) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO agents VALUES (?, ?, ?, ?, ?)",
+                (
+                    snapshot.agent_id,
+                    snapshot.task,
+                    snapshot.state,
+                    snapshot.creation_time.isoformat(),
+                    snapshot.model_dump_json(),
+                ),
+            )
+
+    def _load_sync(self, agent_id: str) -> AgentSnapshot | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT snapshot FROM agents WHERE agent_id = ?", (agent_id,)
+            ).fetchone()
+        return AgentSnapshot.model_validate_json(row[0]) if row else None
+
+    def _list_sync(self) -> list[AgentSummary]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT agent_id, task, state, creation_time FROM agents "
+                "ORDER BY creation_time"
+            ).fetchall()
+        return [
+            AgentSummary(
+                agent_id=agent_id,
+                task=task,
+                state=state,
+                creation_time=datetime.fromisoformat(creation_time),
+            )
+            for agent_id, task, state, creation_time in rows
+        ]
+
+    async def finalize(self, agent_id: str) -> None:
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            return
+        snapshot = AgentSnapshot.from_agent(agent, include_conversation=True)
+        await asyncio.to_thread(self._save_sync, snapshot)
+        # keep agent in memory while it can still receive a clarification
+        if _is_finished(agent):
+            self._agents.pop(agent_id, None)
+
+    async def get_snapshot(self, agent_id: str) -> AgentSnapshot | None:
+        agent = self._agents.get(agent_id)
+        if agent is not None:
+            return AgentSnapshot.from_agent(agent)
+        return await asyncio.to_thread(self._load_sync, agent_id)
+
+    async def list_summaries(self) -> list[AgentSummary]:
+        stored = await asyncio.to_thread(self._list_sync)
+        summaries = {summary.agent_id: summary for summary in stored}
+        for agent in self._agents.values():
+            summaries[agent.id] = AgentSummary.from_agent(agent)
+        return list(summaries.values())
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def build_agent_store(
+    backend: str, max_finished_agents: int, finished_ttl: float, path: str = ""
+) -> AgentStore:
+    """Create agent store for configured backend."""
+    if backend == "sqlite":
+        return SQLiteAgentStore(path=path)
+    return InMemoryAgentStore(
+        max_finished_agents=max_finished_agents, finished_ttl=finished_ttl
+    )
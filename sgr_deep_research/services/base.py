@@ -1,13 +1,43 @@
+import asyncio
+import logging
+from typing import ClassVar
+
 import httpx
+
 from sgr_deep_research.settings import get_config
 
 config = get_config()
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
 
 class HTTPClient:
     service_name: str = ""
     service_url: str = ""
 
+    max_connections: int = config.elastic.elastic_max_connections
+    max_keepalive_connections: int = config.elastic.elastic_max_keepalive_connections
+    max_retries: int = config.elastic.elastic_max_retries
+    retry_backoff: float = config.elastic.elastic_retry_backoff
+
+    # long-lived pooled clients shared by all subclasses, keyed by service_name
+    _clients: ClassVar[dict[str, httpx.AsyncClient]] = {}
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        client = cls._clients.get(cls.service_name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=cls.max_connections,
+                    max_keepalive_connections=cls.max_keepalive_connections,
+                ),
+                timeout=config.elastic.elastic_timeout,
+            )
+            cls._clients[cls.service_name] = client
+        return client
+
     @classmethod
     async def request(
         cls,
@@ -18,13 +48,46 @@ class HTTPClient:
         headers: dict | None = None,
         timeout: int = config.elastic.elastic_timeout,
     ):
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(
-                method=method.upper(),
-                url=url,
-                json=data,
-                params=params,
-                headers=headers,
+        client = cls._get_client()
+        for attempt in range(cls.max_retries + 1):
+            try:
+                response = await client.request(
+                    method=method.upper(),
+                    url=url,
+                    json=data,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout,
+                )
+                if (
+                    response.status_code not in RETRYABLE_STATUS_CODES
+                    or attempt == cls.max_retries
+                ):
+                    response.raise_for_status()
+                    return response.json()
+                reason = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                if attempt == cls.max_retries:
+                    raise
+                reason = repr(e)
+
+            delay = cls.retry_backoff * 2**attempt
+            logger.warning(
+                f"{cls.service_name} {method.upper()} {url} failed ({reason}), "
+                f"retry {attempt + 1}/{cls.max_retries} in {delay:.2f}s"
             )
-            response.raise_for_status()
-            return response.json()
+            await asyncio.sleep(delay)
+
+    @classmethod
+    async def close(cls):
+        """Close pooled client of this service."""
+        client = cls._clients.pop(cls.service_name, None)
+        if client is not None:
+            await client.aclose()
+
+    @classmethod
+    async def close_all(cls):
+        """Close pooled clients of all services."""
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
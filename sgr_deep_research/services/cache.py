@@ -0,0 +1,231 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats(BaseModel):
+    """Cache hit/miss counters."""
+
+    hits: int = Field(default=0, description="Number of cache hits")
+    misses: int = Field(default=0, description="Number of cache misses")
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class BaseCache(ABC):
+    """Async key-value cache with TTL and hit/miss accounting.
+
+    Values must be JSON-serializable so every backend can store them.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Any | None:
+        value = await self._get(key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        await self._set(key, value)
+
+    @abstractmethod
+    async def _get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def _set(self, key: str, value: Any) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+
+class MemoryCache(BaseCache):
+    """In-process LRU cache with per-entry TTL."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def _get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def _set(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+
+class SQLiteCache(BaseCache):
+    """On-disk cache in SQLite with TTL and LRU eviction by entry count and
+    optionally by total stored size.
+
+    Values can be zlib-compressed. Blocking sqlite calls are offloaded
+    to a worker thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float,
+        max_entries: int,
+        max_size_bytes: int | None = None,
+        compress: bool = False,
+    ):
+        super().__init__(ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.compress = compress
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+
+    def _get_sync(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        value = row[0]
+        if isinstance(value, bytes):
+            value = zlib.decompress(value).decode("utf-8")
+        return json.loads(value)
+
+    def _set_sync(self, key: str, value: Any) -> None:
+        now = time.time()
+        value = json.dumps(value, ensure_ascii=False)
+        if self.compress:
+            value = zlib.compress(value.encode("utf-8"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl, now),
+            )
+            self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            if self.max_size_bytes is not None:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM ("
+                    "SELECT key, SUM(length(value)) OVER "
+                    "(ORDER BY accessed_at DESC, rowid DESC) AS total FROM cache"
+                    ") WHERE total > ?)",
+                    (self.max_size_bytes,),
+                )
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(length(value)), 0) FROM cache"
+            ).fetchone()
+        return row[0]
+
+    def _clear_sync(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    async def _get(self, key: str) -> Any | None:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def _set(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self._set_sync, key, value)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear_sync)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache(BaseCache):
+    """Memory tier in front of a slower persistent tier.
+
+    Persistent hits are promoted to memory, writes go to both tiers.
+    """
+
+    def __init__(self, memory: MemoryCache, persistent: BaseCache):
+        super().__init__(persistent.ttl)
+        self.memory = memory
+        self.persistent = persistent
+
+    async def _get(self, key: str) -> Any | None:
+        value = await self.memory.get(key)
+        if value is not None:
+            return value
+        value = await self.persistent.get(key)
+        if value is not None:
+            await self.memory.set(key, value)
+        return value
+
+    async def _set(self, key: str, value: Any) -> None:
+        await self.memory.set(key, value)
+        await self.persistent.set(key, value)
+
+    async def clear(self) -> None:
+        await self.memory.clear()
+        await self.persistent.clear()
+
+
+def build_cache(
+    backend: str, ttl: float, max_entries: int, path: str = ""
+) -> BaseCache | None:
+    """Create cache for configured backend, None disables caching."""
+    if backend == "memory":
+        return MemoryCache(ttl=ttl, max_entries=max_entries)
+    if backend == "sqlite":
+        return SQLiteCache(path=path, ttl=ttl, max_entries=max_entries)
+    return None
@@ -0,0 +1,70 @@
+import importlib.util
+import logging
+from typing import ClassVar
+
+import httpx
+from openai import AsyncOpenAI
+
+from sgr_deep_research.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class LLMClientPool:
+    """Process-wide AsyncOpenAI client shared by all agents.
+
+    All agents reuse one pooled httpx transport, so concurrent requests
+    share warm keep-alive connections instead of paying a new TCP/TLS
+    handshake per agent.
+    """
+
+    _client: ClassVar[AsyncOpenAI | None] = None
+    _http_client: ClassVar[httpx.AsyncClient | None] = None
+
+    @classmethod
+    def _build_http_client(cls) -> httpx.AsyncClient:
+        openai_config = get_config().openai
+        http2 = openai_config.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+            http2 = False
+
+        return httpx.AsyncClient(
+            proxy=openai_config.proxy.strip() or None,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=openai_config.max_connections,
+                max_keepalive_connections=openai_config.max_keepalive_connections,
+                keepalive_expiry=openai_config.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                openai_config.timeout, connect=openai_config.connect_timeout
+            ),
+        )
+
+    @classmethod
+    def get_client(cls) -> AsyncOpenAI:
+        """Return shared client, creating it on first use."""
+        if cls._client is not None:
+            return cls._client
+
+        openai_config = get_config().openai
+        client_kwargs = {"api_key": openai_config.api_key}
+        base_url = openai_config.base_url.strip()
+        if base_url:
+            client_kwargs["base_url"] = base_url
+
+        cls._http_client = cls._build_http_client()
+        cls._client = AsyncOpenAI(http_client=cls._http_client, **client_kwargs)
+        logger.info("Initialized shared LLM client pool")
+        return cls._client
+
+    @classmethod
+    async def close(cls):
+        """Close pooled connections, next get_client call builds a fresh
+        pool."""
+        client, cls._client, cls._http_client = cls._client, None, None
+        if client is None:
+            return
+        await client.close()
+        logger.info("Closed shared LLM client pool")
@@ -1,16 +1,27 @@
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Type
+import re
+from typing import Any, Awaitable, Callable, Type
 
 from fastmcp import Client
 from jambo import SchemaConverter
 from pydantic import create_model
 
 from sgr_deep_research.core.tools import BaseTool, MCPBaseTool
+from sgr_deep_research.services.cache import SQLiteCache
 from sgr_deep_research.settings import get_config
 
 logger = logging.getLogger(__name__)
 
 
+def _schema_hash(value: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode()
+    ).hexdigest()
+
+
 class Singleton(type):
     """Singleton metaclass."""
 
@@ -22,52 +33,411 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+class MCPServerSession:
+    """Reference-counted session with one MCP server.
+
+    The first reference connects and the last one disconnects. The app
+    lifespan holds a reference for the whole run, so tool calls of all
+    agents share one session. Outside of it every call holds its own
+    reference and connects for its duration. Concurrent calls are
+    limited per server. A call failing on a dropped connection is
+    retried once after reconnecting, and sessions held by open() are
+    pinged in the background. Connecting gives up after connect_timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        client: Client,
+        max_concurrent_calls: int = 8,
+        connect_timeout: float | None = None,
+    ):
+        self.name = name
+        self.client = client
+        self.connect_timeout = connect_timeout
+        self._calls = asyncio.Semaphore(max_concurrent_calls)
+        self._lock = asyncio.Lock()
+        self._refs = 0
+        self._connected = False
+        # bumped on connect, so concurrent failures reconnect only once
+        self._generation = 0
+        self._opening: asyncio.Task | None = None
+        self._health_check: asyncio.Task | None = None
+        self.in_flight = 0
+        self.reconnects = 0
+        self.failed_health_checks = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    async def open(
+        self, health_check_interval: float = 0, health_check_timeout: float = 5
+    ) -> None:
+        """Hold a reference until close(), pinging the server meanwhile.
+
+        The session connects in background, so a slow server does not
+        hold up the caller. An unavailable server is logged, not raised,
+        calls and health checks try to connect again later.
+        """
+        self._refs += 1
+        self._opening = asyncio.create_task(self._open_connection())
+        if health_check_interval:
+            self._health_check = asyncio.create_task(
+                self._check_health(health_check_interval, health_check_timeout)
+            )
+
+    async def close(self) -> None:
+        """Release the reference taken by open()."""
+        for task in (self._opening, self._health_check):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._opening = self._health_check = None
+        await self.release()
+
+    async def acquire(self) -> None:
+        """Take a reference, connecting if the session is not open."""
+        self._refs += 1
+        try:
+            await self._ensure_connected()
+        except BaseException:
+            await self.release()
+            raise
+
+    async def release(self) -> None:
+        """Drop a reference, the last one disconnects."""
+        self._refs -= 1
+        # checked before locking, a pending connect must not hold up release
+        if self._refs == 0 and self._connected:
+            async with self._lock:
+                if self._refs == 0 and self._connected:
+                    await self._disconnect()
+
+    async def reconnect(self, generation: int | None = None) -> None:
+        """Reopen the session unless it was reopened since generation."""
+        async with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if self._connected:
+                await self._disconnect()
+            self.reconnects += 1
+            logger.warning(f"Reconnecting to MCP server {self.name}")
+            await self._connect()
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        async with self._calls:
+            return await self._request(lambda: self.client.call_tool(name, arguments))
+
+    async def list_tools(self) -> list:
+        return await self._request(self.client.list_tools)
+
+    async def _request(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        await self.acquire()
+        self.in_flight += 1
+        try:
+            generation = self._generation
+            try:
+                return await request()
+            except Exception as e:
+                if self.client.is_connected():
+                    raise
+                logger.warning(f"MCP server {self.name} connection lost: {e}")
+            await self.reconnect(generation)
+            return await request()
+        finally:
+            self.in_flight -= 1
+            await self.release()
+
+    async def _ensure_connected(self):
+        async with self._lock:
+            if not self._connected:
+                await self._connect()
+
+    async def _open_connection(self):
+        try:
+            await self._ensure_connected()
+        except Exception as e:
+            logger.error(f"MCP server {self.name} is unavailable: {e!r}")
+
+    async def _connect(self):
+        await asyncio.wait_for(self.client.__aenter__(), self.connect_timeout)
+        self._connected = True
+        self._generation += 1
+
+    async def _disconnect(self):
+        self._connected = False
+        try:
+            await self.client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"Closing MCP session {self.name} failed: {e}")
+
+    async def _check_health(self, interval: float, timeout: float):
+        while True:
+            await asyncio.sleep(interval)
+            generation = self._generation
+            try:
+                healthy = self._connected and await asyncio.wait_for(
+                    self.client.ping(), timeout
+                )
+            except Exception as e:
+                logger.warning(f"MCP server {self.name} ping failed: {e}")
+                healthy = False
+            if healthy:
+                continue
+            self.failed_health_checks += 1
+            try:
+                await self.reconnect(generation)
+            except Exception as e:
+                logger.error(f"Reconnecting to MCP server {self.name} failed: {e}")
+
+
 class MCP2ToolConverter(metaclass=Singleton):
+    """Tools of configured MCP servers.
+
+    Servers are connected and listed concurrently, each within
+    discovery_timeout, and open() does not wait for connections.
+    Tool catalogs are cached on disk per server, so a warm start builds
+    tools without waiting for servers and refreshes them in background.
+    Tool classes are kept by schema hash and only changed tools are
+    rebuilt. The toolkit list is updated in place and picked up by
+    agents created afterwards.
+    """
+
     def __init__(self):
         self.toolkit: list[Type[BaseTool]] = []
-        if not get_config().mcp.transport_config:
+        self.sessions: dict[str, MCPServerSession] = {}
+        # tool classes of each server by hash of server and tool schema
+        self._server_tools: dict[str, dict[str, Type[BaseTool]]] = {}
+        self._catalog_hashes: dict[str, str] = {}
+        self._cache_keys: dict[str, str] = {}
+        self._catalog_cache: SQLiteCache | None = None
+        self._background: set[asyncio.Task] = set()
+        mcp_config = get_config().mcp
+        if not mcp_config.transport_config:
             logger.warning(
                 "No MCP configuration found. MCP2ToolConverter will not function properly."
             )
             return
-        self.client: Client = Client(get_config().mcp.transport_config)
+        for name, server_config in self._split_servers(
+            mcp_config.transport_config
+        ).items():
+            self.sessions[name] = MCPServerSession(
+                name,
+                Client(server_config),
+                mcp_config.max_concurrent_calls,
+                mcp_config.discovery_timeout,
+            )
+            self._cache_keys[name] = (
+                f"mcp_tools:{name}:{_schema_hash(server_config)[:16]}"
+            )
+        if mcp_config.tool_cache_path:
+            self._catalog_cache = SQLiteCache(
+                mcp_config.tool_cache_path,
+                ttl=mcp_config.tool_cache_ttl,
+                max_entries=256,
+            )
+
+    @staticmethod
+    def _split_servers(transport_config: dict) -> dict[str, dict]:
+        """Transport config of each server of mcpServers, any other
+        config describes a single server."""
+        servers = transport_config.get("mcpServers")
+        if not isinstance(servers, dict) or len(servers) < 2:
+            return {next(iter(servers or {}), "default"): transport_config}
+        return {
+            name: {"mcpServers": {name: server}} for name, server in servers.items()
+        }
 
     def _to_CamelCase(self, name: str) -> str:
         return name.replace("_", " ").title().replace(" ", "")
 
+    async def open(self):
+        """Open sessions with all servers, shared by agents until
+        close(), and refresh tool catalogs periodically meanwhile."""
+        mcp_config = get_config().mcp
+        await asyncio.gather(
+            *(
+                session.open(
+                    mcp_config.health_check_interval, mcp_config.health_check_timeout
+                )
+                for session in self.sessions.values()
+            )
+        )
+        if self.sessions and mcp_config.tool_refresh_interval:
+            self._run_in_background(
+                self._refresh_periodically(mcp_config.tool_refresh_interval)
+            )
+
+    async def close(self):
+        for task in self._background:
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
+        await asyncio.gather(*(session.close() for session in self.sessions.values()))
+
     async def build_tools_from_mcp(self):
-        if not get_config().mcp.transport_config:
+        if not self.sessions:
             logger.warning("No MCP configuration found. Nothing to build.")
             return
 
-        async with self.client:
-            mcp_tools = await self.client.list_tools()
+        servers = list(self.sessions)
+        cached = await asyncio.gather(*(self._load_catalog(s) for s in servers))
+        for server, entry in zip(servers, cached):
+            if entry is not None:
+                self._set_catalog(server, entry["tools"], entry["hash"])
+        # servers without cached catalog are waited for, the rest in background
+        missing = [server for server, entry in zip(servers, cached) if entry is None]
+        await asyncio.gather(*(self._refresh_server(s) for s in missing))
+        self._update_toolkit()
+        if len(missing) < len(servers):
+            self._run_in_background(
+                self.refresh([s for s in servers if s not in missing])
+            )
+
+        logger.info(f"Built {len(self.toolkit)} MCP tools.")
 
-            for t in mcp_tools:
-                if not t.name or not t.inputSchema:
-                    logger.error(
-                        f"Skipping tool due to missing name or input schema: {t}"
-                    )
-                    continue
+    async def refresh(self, servers: list[str] | None = None):
+        """List tools of servers again and rebuild the changed ones."""
+        changed = await asyncio.gather(
+            *(self._refresh_server(s) for s in servers or self.sessions)
+        )
+        if any(changed):
+            self._update_toolkit()
+            logger.info(f"MCP tools refreshed, {len(self.toolkit)} MCP tools.")
 
-                try:
-                    t.inputSchema["title"] = self._to_CamelCase(t.name)
-                    PdModel = SchemaConverter.build(t.inputSchema)
-                except Exception as e:
-                    logger.error(
-                        f"Error creating model {t.name} from schema: {t.inputSchema}: {e}"
-                    )
-                    continue
-
-                ToolCls: Type[BaseTool] = create_model(
-                    f"MCP{self._to_CamelCase(t.name)}",
-                    __base__=(PdModel, MCPBaseTool),
-                    __doc__=t.description or "",
-                )
-                ToolCls.tool_name = t.name
-                ToolCls.description = t.description or ""
-                ToolCls._client = self.client
-                logger.info(f"Built MCP Tool: {ToolCls.tool_name}")
-                self.toolkit.append(ToolCls)
+    async def _refresh_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            await self.refresh()
+
+    def _run_in_background(self, coro: Awaitable):
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _refresh_server(self, server: str) -> bool:
+        """Discover tools of server, True if its catalog changed."""
+        catalog = await self._discover(server)
+        if catalog is None:
+            return False
+        catalog_hash = _schema_hash(catalog)
+        if catalog_hash == self._catalog_hashes.get(server):
+            return False
+        if server in self._catalog_hashes:
+            logger.info(f"MCP server {server} tools changed")
+        self._set_catalog(server, catalog, catalog_hash)
+        await self._save_catalog(server, catalog, catalog_hash)
+        return True
+
+    async def _discover(self, server: str) -> list[dict] | None:
+        try:
+            mcp_tools = await asyncio.wait_for(
+                self.sessions[server].list_tools(), get_config().mcp.discovery_timeout
+            )
+        except Exception as e:
+            logger.error(f"Listing tools of MCP server {server} failed: {e!r}")
+            return None
+        return [
+            {"name": t.name, "description": t.description, "inputSchema": t.inputSchema}
+            for t in mcp_tools
+        ]
 
-            logger.info(f"Built {len(self.toolkit)} MCP tools.")
+    async def _load_catalog(self, server: str) -> dict | None:
+        if self._catalog_cache is None:
+            return None
+        try:
+            entry = await self._catalog_cache.get(self._cache_keys[server])
+        except Exception as e:
+            logger.warning(f"Reading cached tools of MCP server {server} failed: {e}")
+            return None
+        if entry is not None:
+            logger.info(f"Loaded cached tools of MCP server {server}")
+        return entry
+
+    async def _save_catalog(self, server: str, catalog: list[dict], catalog_hash: str):
+        if self._catalog_cache is None:
+            return
+        try:
+            await self._catalog_cache.set(
+                self._cache_keys[server], {"hash": catalog_hash, "tools": catalog}
+            )
+        except Exception as e:
+            logger.warning(f"Caching tools of MCP server {server} failed: {e}")
+
+    def _set_catalog(self, server: str, catalog: list[dict], catalog_hash: str):
+        built = self._server_tools.get(server, {})
+        tools = {}
+        for t in catalog:
+            if not t["name"] or not t["inputSchema"]:
+                logger.error(f"Skipping tool due to missing name or input schema: {t}")
+                continue
+            key = _schema_hash([server, t])
+            ToolCls = built.get(key) or self._build_tool(server, t)
+            if ToolCls is not None:
+                tools[key] = ToolCls
+        self._server_tools[server] = tools
+        self._catalog_hashes[server] = catalog_hash
+
+    def _build_tool(self, server: str, t: dict) -> Type[BaseTool] | None:
+        # tools of several servers are prefixed with the server name
+        tool_name = f"{server}_{t['name']}" if len(self.sessions) > 1 else t["name"]
+        try:
+            schema = {**t["inputSchema"], "title": self._to_CamelCase(tool_name)}
+            PdModel = SchemaConverter.build(schema)
+        except Exception as e:
+            logger.error(
+                f"Error creating model {t['name']} from schema: {t['inputSchema']}: {e}"
+            )
+            return None
+
+        ToolCls: Type[BaseTool] = create_model(
+            f"MCP{self._to_CamelCase(tool_name)}",
+            __base__=(PdModel, MCPBaseTool),
+            __doc__=t["description"] or "",
+        )
+        ToolCls.tool_name = tool_name
+        ToolCls.mcp_tool_name = t["name"]
+        ToolCls.description = t["description"] or ""
+        ToolCls._client = self.sessions[server].client
+        ToolCls._session = self.sessions[server]
+        logger.info(f"Built MCP Tool: {ToolCls.tool_name}")
+        return ToolCls
+
+    def _update_toolkit(self):
+        self.toolkit[:] = [
+            ToolCls
+            for server in self.sessions
+            for ToolCls in self._server_tools.get(server, {}).values()
+        ]
+
+    @classmethod
+    def collect_metrics(cls) -> dict[str, tuple[str, float]]:
+        """Session gauges of MCP servers for MetricsRegistry."""
+        converter = cls._instances.get(cls)
+        metrics = {}
+        for name, session in (converter.sessions if converter else {}).items():
+            prefix = "sgr_mcp_" + re.sub(r"\W", "_", name)
+            metrics[f"{prefix}_connected"] = (
+                f"MCP server {name} session is open",
+                int(session.connected),
+            )
+            metrics[f"{prefix}_in_flight_calls"] = (
+                f"MCP server {name} requests in progress",
+                session.in_flight,
+            )
+            metrics[f"{prefix}_reconnects_total"] = (
+                f"MCP server {name} session reconnects",
+                session.reconnects,
+            )
+            metrics[f"{prefix}_failed_health_checks_total"] = (
+                f"MCP server {name} failed pings",
+                session.failed_health_checks,
+            )
+            metrics[f"{prefix}_tools"] = (
+                f"MCP server {name} tools in the toolkit",
+                len(converter._server_tools.get(name, {})),
+            )
+        return metrics
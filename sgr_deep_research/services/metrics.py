@@ -0,0 +1,109 @@
+import bisect
+from typing import Callable, ClassVar
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class Histogram:
+    """Cumulative histogram with per-label-set series."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        # label values -> (bucket counts, sum, count)
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        series = self._series.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[0][index] += 1
+        series[1] += value
+        series[2] += 1
+
+    def count(self, **labels: str) -> int:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        return self._series.get(key, [None, 0.0, 0])[2]
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for key, (bucket_counts, total, count) in self._series.items():
+            labels = dict(zip(self.label_names, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels({**labels, "le": repr(float(bound))})
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(
+                f"{self.name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {count}"
+            )
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Process-wide registry rendered in Prometheus text exposition format.
+
+    Histograms are observed directly, gauges are read from collector
+    callbacks at render time.
+    """
+
+    _histograms: ClassVar[dict[str, Histogram]] = {}
+    _collectors: ClassVar[list[Callable[[], dict[str, tuple[str, float]]]]] = []
+
+    @classmethod
+    def histogram(
+        cls,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get registered histogram or register a new one."""
+        if name not in cls._histograms:
+            cls._histograms[name] = Histogram(name, documentation, label_names, buckets)
+        return cls._histograms[name]
+
+    @classmethod
+    def register_collector(
+        cls, collector: Callable[[], dict[str, tuple[str, float]]]
+    ) -> None:
+        """Register callback returning {gauge name: (documentation,
+        value)}."""
+        cls._collectors.append(collector)
+
+    @classmethod
+    def render(cls) -> str:
+        lines = []
+        for histogram in cls._histograms.values():
+            lines.extend(histogram.render())
+        for collector in cls._collectors:
+            for name, (documentation, value) in collector().items():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
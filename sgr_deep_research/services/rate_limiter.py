@@ -0,0 +1,152 @@
+import asyncio
+import json
+import logging
+import time
+from typing import ClassVar, Literal
+
+from pydantic import BaseModel, Field
+
+from sgr_deep_research.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiterStats(BaseModel):
+    """Rate limiter throttling counters."""
+
+    acquired: int = Field(default=0, description="Number of granted calls")
+    throttled: int = Field(default=0, description="Number of calls that had to wait")
+    wait_time_total: float = Field(
+        default=0.0, description="Total time calls spent waiting, seconds"
+    )
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at per-minute rate.
+
+    Capacity equals one minute of quota. Waiters are served in FIFO
+    order. The balance may go negative after adjust(), later callers
+    then wait for the debt to be repaid.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self._tokens = per_minute
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1) -> float:
+        """Take amount from the bucket, waiting for refill if needed.
+
+        Returns time spent waiting in seconds.
+        """
+        # a request larger than the whole bucket could never pass otherwise
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self._tokens < amount:
+                delay = (amount - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= amount
+        return waited
+
+    def adjust(self, amount: float):
+        """Return (positive) or charge extra (negative) tokens."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute quotas of one provider,
+    shared by all agents of the process."""
+
+    _limiters: ClassVar[dict[str, "RateLimiter | None"]] = {}
+
+    def __init__(
+        self, name: str, requests_per_minute: int = 0, tokens_per_minute: int = 0
+    ):
+        self.name = name
+        self.requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.stats = RateLimiterStats()
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait until one request and the estimated tokens fit the quota."""
+        waited = 0.0
+        if self.requests is not None:
+            waited += await self.requests.acquire()
+        if self.tokens is not None and tokens:
+            waited += await self.tokens.acquire(tokens)
+        self.stats.acquired += 1
+        if waited:
+            self.stats.throttled += 1
+            self.stats.wait_time_total += waited
+            logger.info(f"⏳ {self.name} rate limit: waited {waited:.2f}s")
+        return waited
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        """Correct tokens bucket once real usage is known."""
+        if self.tokens is not None:
+            self.tokens.adjust(estimated_tokens - actual_tokens)
+
+    @classmethod
+    def collect_metrics(cls) -> dict[str, tuple[str, float]]:
+        """Throttling gauges of active limiters for MetricsRegistry."""
+        metrics = {}
+        for name, limiter in cls._limiters.items():
+            if limiter is None:
+                continue
+            metrics[f"sgr_rate_limit_{name}_throttled_total"] = (
+                f"{name} calls delayed by rate limit",
+                limiter.stats.throttled,
+            )
+            metrics[f"sgr_rate_limit_{name}_wait_seconds_total"] = (
+                f"{name} total time spent waiting for rate limit",
+                limiter.stats.wait_time_total,
+            )
+        return metrics
+
+    @classmethod
+    def for_provider(
+        cls, provider: Literal["openai", "tavily"]
+    ) -> "RateLimiter | None":
+        """Shared limiter of a provider, None if no quota is configured."""
+        if provider not in cls._limiters:
+            config = get_config()
+            if provider == "openai":
+                limiter = cls(
+                    provider,
+                    requests_per_minute=config.openai.requests_per_minute,
+                    tokens_per_minute=config.openai.tokens_per_minute,
+                )
+            else:
+                limiter = cls(
+                    provider, requests_per_minute=config.tavily.requests_per_minute
+                )
+            enabled = limiter.requests is not None or limiter.tokens is not None
+            cls._limiters[provider] = limiter if enabled else None
+        return cls._limiters[provider]
+
+
+def estimate_tokens(messages: list, max_tokens: int = 0) -> int:
+    """Rough upper estimate of request tokens: ~4 characters per prompt
+    token plus the completion budget."""
+    return len(json.dumps(messages, ensure_ascii=False, default=str)) // 4 + max_tokens
@@ -0,0 +1,46 @@
+"""Report persistence.
+
+Reports are saved through async storage backends, file I/O runs in a
+worker thread so large reports do not stall other agents' streams.
+"""
+
+import asyncio
+import gzip
+import os
+from abc import ABC, abstractmethod
+
+
+class ReportStorage(ABC):
+    """Async storage of markdown reports."""
+
+    @abstractmethod
+    async def save(self, name: str, content: str) -> str:
+        """Store report under name, return its location."""
+
+
+class LocalReportStorage(ReportStorage):
+    """Reports saved as files in a local directory, optionally gzipped."""
+
+    def __init__(self, reports_dir: str, compress: bool = False):
+        self.reports_dir = reports_dir
+        self.compress = compress
+
+    def _save_sync(self, name: str, content: str) -> str:
+        os.makedirs(self.reports_dir, exist_ok=True)
+        filepath = os.path.join(self.reports_dir, name)
+        if self.compress:
+            filepath += ".gz"
+            with gzip.open(filepath, "wt", encoding="utf-8") as f:
+                f.write(content)
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(content)
+        return filepath
+
+    async def save(self, name: str, content: str) -> str:
+        return await asyncio.to_thread(self._save_sync, name, content)
+
+
+def build_report_storage(reports_dir: str, compression: str = "none") -> ReportStorage:
+    """Create report storage for configured settings."""
+    return LocalReportStorage(reports_dir=reports_dir, compress=compression == "gzip")
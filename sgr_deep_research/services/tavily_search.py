@@ -1,14 +1,30 @@
 import logging
+from typing import ClassVar
 
 from tavily import AsyncTavilyClient
 
 from sgr_deep_research.core.models import SourceData
+from sgr_deep_research.services.cache import (
+    BaseCache,
+    MemoryCache,
+    SQLiteCache,
+    TieredCache,
+    build_cache,
+)
+from sgr_deep_research.services.rate_limiter import RateLimiter
 from sgr_deep_research.settings import get_config
 
 logger = logging.getLogger(__name__)
 
 
 class TavilySearchService:
+    # process-wide search results cache, built lazily from config
+    _search_cache: ClassVar[BaseCache | None] = None
+    _search_cache_initialized: ClassVar[bool] = False
+    # process-wide extracted pages cache keyed by URL
+    _page_cache: ClassVar[BaseCache | None] = None
+    _page_cache_initialized: ClassVar[bool] = False
+
     def __init__(self):
         config = get_config()
         self._client = AsyncTavilyClient(
@@ -24,6 +40,75 @@ class TavilySearchService:
             source.number = i
         return sources
 
+    @classmethod
+    def search_cache(cls) -> BaseCache | None:
+        """Shared search results cache, None if caching is disabled."""
+        if not cls._search_cache_initialized:
+            search_config = get_config().search
+            cls._search_cache = build_cache(
+                backend=search_config.cache_backend,
+                ttl=search_config.cache_ttl,
+                max_entries=search_config.cache_max_entries,
+                path=search_config.cache_path,
+            )
+            cls._search_cache_initialized = True
+        return cls._search_cache
+
+    @classmethod
+    def page_cache(cls) -> BaseCache | None:
+        """Shared extracted pages cache, None if caching is disabled."""
+        if not cls._page_cache_initialized:
+            scraping_config = get_config().scraping
+            memory = MemoryCache(
+                ttl=scraping_config.cache_ttl,
+                max_entries=scraping_config.cache_memory_entries,
+            )
+            if scraping_config.cache_backend == "memory":
+                cls._page_cache = memory
+            elif scraping_config.cache_backend == "tiered":
+                cls._page_cache = TieredCache(
+                    memory=memory,
+                    persistent=SQLiteCache(
+                        path=scraping_config.cache_path,
+                        ttl=scraping_config.cache_ttl,
+                        max_entries=scraping_config.cache_disk_entries,
+                        max_size_bytes=scraping_config.cache_disk_size_mb * 1024**2,
+                        compress=True,
+                    ),
+                )
+            cls._page_cache_initialized = True
+        return cls._page_cache
+
+    @classmethod
+    def collect_metrics(cls) -> dict[str, tuple[str, float]]:
+        """Hit and miss counters of built caches for MetricsRegistry."""
+        metrics = {}
+        for name, cache in (("search", cls._search_cache), ("page", cls._page_cache)):
+            if cache is None:
+                continue
+            metrics[f"sgr_{name}_cache_hits_total"] = (
+                f"Tavily {name} cache hits",
+                cache.stats.hits,
+            )
+            metrics[f"sgr_{name}_cache_misses_total"] = (
+                f"Tavily {name} cache misses",
+                cache.stats.misses,
+            )
+        return metrics
+
+    @staticmethod
+    async def _acquire_quota():
+        rate_limiter = RateLimiter.for_provider("tavily")
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+
+    @staticmethod
+    def _search_cache_key(
+        query: str, max_results: int, include_raw_content: bool
+    ) -> str:
+        normalized_query = " ".join(query.lower().split())
+        return f"{normalized_query}|{max_results}|{int(include_raw_content)}"
+
     async def search(
         self,
         query: str,
@@ -42,8 +127,18 @@ class TavilySearchService:
             Tuple with tavily answer and list of SourceData
         """
         max_results = max_results or self._config.search.max_results
+
+        search_cache = self.search_cache()
+        cache_key = self._search_cache_key(query, max_results, include_raw_content)
+        if search_cache is not None:
+            cached = await search_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"🔍 Tavily search cache hit: '{query}'")
+                return [SourceData.model_validate(source) for source in cached]
+
         logger.info(f"🔍 Tavily search: '{query}' (max_results={max_results})")
 
+        await self._acquire_quota()
         # Execute search through Tavily
         response = await self._client.search(
             query=query,
@@ -53,6 +148,10 @@ class TavilySearchService:
 
         # Convert results to SourceData
         sources = self._convert_to_source_data(response)
+        if search_cache is not None:
+            await search_cache.set(
+                cache_key, [source.model_dump() for source in sources]
+            )
         return sources
 
     async def extract(self, urls: list[str]) -> list[SourceData]:
@@ -66,6 +165,7 @@ class TavilySearchService:
         """
         logger.info(f"📄 Tavily extract: {len(urls)} URLs")
 
+        await self._acquire_quota()
         response = await self._client.extract(urls=urls)
 
         sources = []
@@ -8,6 +8,7 @@ import logging.config
 import os
 from functools import cache
 from pathlib import Path
+from typing import Literal
 
 import yaml
 from envyaml import EnvYAML
@@ -28,6 +29,34 @@ class OpenAIConfig(BaseModel):
         default="",
         description="Proxy URL (e.g., socks5://127.0.0.1:1081 or http://127.0.0.1:8080)",
     )
+    max_connections: int = Field(
+        default=100, gt=0, description="Maximum number of pooled HTTP connections"
+    )
+    max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Maximum number of idle keep-alive connections"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, gt=0, description="Idle keep-alive connection expiry in seconds"
+    )
+    http2: bool = Field(
+        default=False, description="Enable HTTP/2 (requires the 'h2' package)"
+    )
+    timeout: float = Field(
+        default=600.0, gt=0, description="Request timeout in seconds"
+    )
+    connect_timeout: float = Field(
+        default=10.0, gt=0, description="Connection timeout in seconds"
+    )
+    stream_usage: bool = Field(
+        default=True,
+        description="Request token usage in streamed completions (include_usage)",
+    )
+    requests_per_minute: int = Field(
+        default=0, ge=0, description="Provider requests per minute quota, 0 disables"
+    )
+    tokens_per_minute: int = Field(
+        default=0, ge=0, description="Provider tokens per minute quota, 0 disables"
+    )
 
 
 class TavilyConfig(BaseModel):
@@ -37,6 +66,9 @@ class TavilyConfig(BaseModel):
     api_base_url: str = Field(
         default="https://api.tavily.com", description="Tavily API base URL"
     )
+    requests_per_minute: int = Field(
+        default=0, ge=0, description="Tavily requests per minute quota, 0 disables"
+    )
 
 
 class SearchConfig(BaseModel):
@@ -45,6 +77,19 @@ class SearchConfig(BaseModel):
     max_results: int = Field(
         default=10, ge=1, description="Maximum number of search results"
     )
+    cache_backend: Literal["none", "memory", "sqlite"] = Field(
+        default="memory", description="Search results cache backend"
+    )
+    cache_ttl: int = Field(
+        default=3600, gt=0, description="Search results cache TTL in seconds"
+    )
+    cache_max_entries: int = Field(
+        default=1024, gt=0, description="Maximum number of cached search results"
+    )
+    cache_path: str = Field(
+        default="cache/search_cache.sqlite",
+        description="SQLite file for search results cache",
+    )
 
 
 class ScrapingConfig(BaseModel):
@@ -55,6 +100,26 @@ class ScrapingConfig(BaseModel):
     content_limit: int = Field(
         default=1500, gt=0, description="Content character limit per source"
     )
+    cache_backend: Literal["none", "memory", "tiered"] = Field(
+        default="memory",
+        description="Extracted pages cache: memory only or memory + compressed disk",
+    )
+    cache_ttl: int = Field(
+        default=86400, gt=0, description="Extracted pages cache TTL in seconds"
+    )
+    cache_memory_entries: int = Field(
+        default=256, gt=0, description="Maximum number of pages kept in memory"
+    )
+    cache_disk_entries: int = Field(
+        default=10000, gt=0, description="Maximum number of pages kept on disk"
+    )
+    cache_disk_size_mb: int = Field(
+        default=256, gt=0, description="Maximum compressed pages size on disk in MB"
+    )
+    cache_path: str = Field(
+        default="cache/page_cache.sqlite",
+        description="SQLite file for the on-disk pages cache",
+    )
 
 
 class PromptsConfig(BaseModel):
@@ -75,7 +140,117 @@ class ExecutionConfig(BaseModel):
     reports_dir: str = Field(
         default="reports", description="Directory for saving reports"
     )
+    report_compression: Literal["none", "gzip"] = Field(
+        default="none", description="Compression of saved report files"
+    )
     logs_dir: str = Field(default="logs", description="Directory for saving bot logs")
+    log_buffer_size: int = Field(
+        default=10000,
+        gt=0,
+        description="Agent log lines buffered for the background writer",
+    )
+    single_call_reasoning: bool = Field(
+        default=False,
+        description="Tool calling agents request reasoning and action in one LLM call",
+    )
+    max_parallel_tool_calls: int = Field(
+        default=4,
+        gt=0,
+        description="Maximum tool calls of one iteration executed concurrently",
+    )
+
+
+class AgentStoreConfig(BaseModel):
+    """API agents storage settings."""
+
+    backend: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description="Keep finished agents in memory or persist them to SQLite",
+    )
+    max_finished_agents: int = Field(
+        default=1000, gt=0, description="Maximum finished agents kept in memory"
+    )
+    finished_ttl: int = Field(
+        default=3600, gt=0, description="Finished agents in-memory TTL in seconds"
+    )
+    path: str = Field(
+        default="cache/agents.sqlite", description="SQLite file for agent snapshots"
+    )
+
+
+class SchedulerConfig(BaseModel):
+    """API agents execution scheduling settings."""
+
+    max_concurrent_agents: int = Field(
+        default=10, gt=0, description="Maximum number of agents executing at once"
+    )
+    max_queued_agents: int = Field(
+        default=100, ge=0, description="Maximum number of agents waiting for a slot"
+    )
+    retry_after: int = Field(
+        default=10, gt=0, description="Retry-After seconds returned when queue is full"
+    )
+    model_priorities: dict[str, int] = Field(
+        default_factory=dict,
+        description="Queue priority per agent model, higher is admitted first",
+    )
+
+
+class StreamingConfig(BaseModel):
+    """Agent response streaming settings."""
+
+    max_queue_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Maximum chunks queued for a reading client, 0 for unbounded",
+    )
+    queue_policy: Literal["block", "drop_intermediate", "coalesce"] = Field(
+        default="block",
+        description="Full queue handling: wait, drop LLM deltas or merge chunks",
+    )
+    on_disconnect: Literal["detach", "cancel"] = Field(
+        default="detach",
+        description="Keep agent running without a client or cancel it",
+    )
+    coalesce_window: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds LLM deltas are batched into one event, 0 disables",
+    )
+    coalesce_max_bytes: int = Field(
+        default=2048, gt=0, description="Batched deltas size that flushes an event"
+    )
+    replay_buffer_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Recent events kept for stream observers and resume",
+    )
+
+
+class CompactionConfig(BaseModel):
+    """Agent conversation compaction settings."""
+
+    enabled: bool = Field(
+        default=True, description="Compact older tool results before LLM calls"
+    )
+    max_context_tokens: int = Field(
+        default=60000,
+        gt=0,
+        description="Estimated prompt tokens above which older tool results are compacted",
+    )
+    keep_last_steps: int = Field(
+        default=2, ge=0, description="Latest agent steps kept verbatim"
+    )
+    strategy: Literal["truncate", "summarize"] = Field(
+        default="truncate",
+        description="Cut older tool results or summarize them with the LLM",
+    )
+    truncate_chars: int = Field(
+        default=500, gt=0, description="Characters kept from a truncated tool result"
+    )
+    summary_max_tokens: int = Field(
+        default=500, gt=0, description="Maximum tokens of a tool result summary"
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -84,6 +259,11 @@ class LoggingConfig(BaseModel):
     config_file: str = Field(
         default="logging_config.yaml", description="Logging configuration file path"
     )
+    step_field_max_chars: int = Field(
+        default=2000,
+        ge=0,
+        description="Characters kept per field of agent log steps, 0 keeps all",
+    )
 
 
 class MCPConfig(BaseModel):
@@ -97,12 +277,52 @@ class MCPConfig(BaseModel):
     transport_config: dict = Field(
         default_factory=dict, description="MCP servers configuration"
     )
+    max_concurrent_calls: int = Field(
+        default=8, gt=0, description="Concurrent tool calls per MCP server"
+    )
+    health_check_interval: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds between pings of open MCP sessions, 0 disables",
+    )
+    health_check_timeout: float = Field(
+        default=5.0, gt=0, description="Seconds to wait for MCP ping response"
+    )
+    discovery_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for MCP server to connect or list its tools",
+    )
+    tool_cache_path: str = Field(
+        default="cache/mcp_tools.sqlite",
+        description="SQLite file caching MCP tool catalogs, empty disables",
+    )
+    tool_cache_ttl: int = Field(
+        default=604800, gt=0, description="Cached MCP tool catalog lifetime in seconds"
+    )
+    tool_refresh_interval: float = Field(
+        default=600.0,
+        ge=0,
+        description="Seconds between MCP tool catalog refreshes, 0 disables",
+    )
 
 
 class ElasticSearchConfig(BaseModel):
     """Config for custom ElasticSearch"""
 
     elastic_timeout: int = Field(default=30, gt=0, description="Timeout in seconds")
+    elastic_max_connections: int = Field(
+        default=20, gt=0, description="Maximum number of pooled HTTP connections"
+    )
+    elastic_max_keepalive_connections: int = Field(
+        default=10, ge=0, description="Maximum number of idle keep-alive connections"
+    )
+    elastic_max_retries: int = Field(
+        default=3, ge=0, description="Retries for failed or throttled requests"
+    )
+    elastic_retry_backoff: float = Field(
+        default=0.5, ge=0, description="Base delay in seconds for exponential backoff"
+    )
     know2_api_base_url: str = Field(
         default="", description="Elastic Search Service URL"
     )
@@ -131,6 +351,18 @@ class AppConfig(BaseModel):
     prompts: PromptsConfig = Field(
         default_factory=PromptsConfig, description="Prompts settings"
     )
+    agent_store: AgentStoreConfig = Field(
+        default_factory=AgentStoreConfig, description="Agents storage settings"
+    )
+    scheduler: SchedulerConfig = Field(
+        default_factory=SchedulerConfig, description="Agents scheduling settings"
+    )
+    streaming: StreamingConfig = Field(
+        default_factory=StreamingConfig, description="Response streaming settings"
+    )
+    compaction: CompactionConfig = Field(
+        default_factory=CompactionConfig, description="Context compaction settings"
+    )
     logging: LoggingConfig = Field(
         default_factory=LoggingConfig, description="Logging settings"
     )
@@ -2,6 +2,8 @@ import sys
 from types import ModuleType
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
@@ -78,3 +80,26 @@ if "tavily" not in sys.modules:
     tavily_stub = ModuleType("tavily")
     tavily_stub.AsyncTavilyClient = object
     sys.modules["tavily"] = tavily_stub
+
+
+@pytest.fixture(autouse=True)
+def reset_service_caches():
+    """Give every test fresh in-memory search and page caches so tests do
+    not share cached results or write cache files to disk.
+
+    Shared rate limiters are dropped too, so their buckets do not leak
+    between event loops, and memoized tool schemas built with patched
+    helpers do not leak between tests.
+    """
+    from sgr_deep_research.core.tool_schemas import clear_schema_cache
+    from sgr_deep_research.services.cache import MemoryCache
+    from sgr_deep_research.services.rate_limiter import RateLimiter
+    from sgr_deep_research.services.tavily_search import TavilySearchService
+
+    TavilySearchService._search_cache = None
+    TavilySearchService._search_cache_initialized = False
+    TavilySearchService._page_cache = MemoryCache(ttl=60, max_entries=100)
+    TavilySearchService._page_cache_initialized = True
+    RateLimiter._limiters.clear()
+    clear_schema_cache()
+    yield
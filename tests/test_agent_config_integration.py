@@ -16,8 +16,8 @@ from sgr_deep_research.settings import get_config
 class TestAgentConfigurationIntegration:
     """Tests for agent integration with configuration system."""
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_config_loading_in_agents(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_config_loading_in_agents(self, mock_pool):
         """Test that agents properly load configuration."""
         # Agents use real config from config.yaml
         # Just verify agent can be created successfully
@@ -26,11 +26,11 @@ class TestAgentConfigurationIntegration:
         assert agent.task == "Config integration test"
         assert agent.name == "sgr_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_config_proxy_handling(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_config_proxy_handling(self, mock_pool):
         """Test proper handling of proxy configuration."""
         # Agents use real config from config.yaml
         # Just verify agent can be created successfully with any proxy settings
@@ -39,11 +39,11 @@ class TestAgentConfigurationIntegration:
         assert agent.task == "Proxy test"
         assert agent.name == "sgr_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_config_no_proxy_handling(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_config_no_proxy_handling(self, mock_pool):
         """Test handling when no proxy is configured."""
         # Agents use real config from config.yaml
         # Just verify agent can be created successfully
@@ -52,8 +52,8 @@ class TestAgentConfigurationIntegration:
         assert agent.task == "No proxy test"
         assert agent.name == "sgr_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
     def test_mcp_integration_in_agents(self):
         """Test that agents properly integrate MCP tools from config."""
@@ -80,8 +80,8 @@ class TestAgentConfigurationIntegration:
 class TestAgentEnvironmentVariables:
     """Tests for agent behavior with environment variables."""
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_config_file_from_environment(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_config_file_from_environment(self, mock_pool):
         """Test loading config file path from environment variable."""
         # Config is loaded at module import time
         # Just verify agent can be created successfully
@@ -90,11 +90,11 @@ class TestAgentEnvironmentVariables:
         assert agent.task == "Environment config test"
         assert agent.name == "sgr_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_default_config_parameters(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_default_config_parameters(self, mock_pool):
         """Test that agents work with default configuration parameters."""
         # Agents use real config from config.yaml
         # Just verify agent can be created successfully
@@ -103,8 +103,8 @@ class TestAgentEnvironmentVariables:
         assert agent.task == "Default config test"
         assert agent.name == "sgr_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
 
 class TestAgentConfigurationEdgeCases:
@@ -137,8 +137,8 @@ class TestAgentConfigurationEdgeCases:
             agent = SGRAgent(task="Invalid config test")
             assert agent.task == "Invalid config test"
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_config_with_special_characters(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_config_with_special_characters(self, mock_pool):
         """Test configuration with special characters in values."""
         # Agents use real config from config.yaml
         # Just verify agent can be created successfully
@@ -147,15 +147,15 @@ class TestAgentConfigurationEdgeCases:
         assert agent.task == "Special chars config test"
         assert agent.name == "sgr_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
 
 class TestMultipleAgentConfigurationConsistency:
     """Tests for configuration consistency across multiple agents."""
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_multiple_agents_same_config(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_multiple_agents_same_config(self, mock_pool):
         """Test that multiple agents use the same configuration instance."""
         # Agents use real config from config.yaml
         # Just verify both agents can be created successfully
@@ -168,8 +168,8 @@ class TestMultipleAgentConfigurationConsistency:
         assert agent1.name == "sgr_agent"
         assert agent2.name == "sgr_tool_calling_agent"
 
-        # Both should have initialized OpenAI clients
-        assert mock_openai.call_count >= 2
+        # Both should share the pooled OpenAI client
+        assert agent1.openai_client is agent2.openai_client is mock_pool.get_client.return_value
 
     def test_config_caching_behavior(self):
         """Test that configuration is properly cached."""
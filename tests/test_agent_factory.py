@@ -172,8 +172,8 @@ class TestAgentFactory:
 class TestConfigurationBasedAgentCreation:
     """Tests for creating agents based on configuration patterns."""
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_agent_config_integration(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_agent_config_integration(self, mock_pool):
         """Test that agents properly integrate configuration from settings."""
         # Agents use real config from config.yaml
         # Just verify agent can be created successfully
@@ -184,8 +184,8 @@ class TestConfigurationBasedAgentCreation:
         assert agent.task == "Test config integration"
         assert agent.name == "sgr_agent"
 
-        # Verify OpenAI client was initialized (any params)
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
     def test_agent_model_name_consistency(self):
         """Test that agent model names are consistent with class names."""
@@ -0,0 +1,160 @@
+"""Tests for agent log persistence.
+
+This module contains tests for the background JSONL writer and for
+agent steps appended to the log file while the agent executes.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.services.agent_log import AgentLogWriter
+
+
+class OneStepAgent(BaseAgent):
+    """Agent finishing after a single iteration without LLM calls."""
+
+    name = "one_step_agent"
+
+    async def _reasoning_phase(self):
+        return None
+
+    async def _select_action_phase(self, reasoning):
+        return SimpleNamespace(tool_name="final_answer_tool")
+
+    async def _action_phase(self, tool):
+        self._context.state = AgentStatesEnum.COMPLETED
+        self._log_step({"step_number": self._context.iteration, "step_type": "tool_execution", "result": "done"})
+        return "done"
+
+
+def read_lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def blocked_writer(max_buffered: int) -> tuple[AgentLogWriter, threading.Event]:
+    """Writer whose thread waits for the returned event before writing."""
+    writer = AgentLogWriter(max_buffered=max_buffered)
+    gate = threading.Event()
+    write_batch = writer._write_batch
+
+    def wait_and_write(batch):
+        gate.wait()
+        write_batch(batch)
+
+    writer._write_batch = wait_and_write
+    return writer, gate
+
+
+def wait_until_taken(writer: AgentLogWriter):
+    deadline = time.monotonic() + 1
+    while writer.buffered and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+@pytest.fixture(autouse=True)
+def reset_writer():
+    """Fresh shared writer for each test."""
+    AgentLogWriter._instance = None
+    yield
+    AgentLogWriter._instance = None
+
+
+class TestAgentLogWriter:
+    """Tests for the background writer thread."""
+
+    async def test_lines_written_before_close_returns(self, tmp_path):
+        """Test that close waits for all queued lines of the file."""
+        writer = AgentLogWriter()
+        path = str(tmp_path / "logs" / "agent-log.jsonl")
+
+        for i in range(100):
+            writer.write(path, json.dumps({"i": i}) + "\n")
+        await asyncio.wait_for(writer.close(path), timeout=5)
+
+        assert [line["i"] for line in read_lines(tmp_path / "logs" / "agent-log.jsonl")] == list(range(100))
+        assert writer.written == 100
+
+    async def test_full_buffer_drops_lines(self, tmp_path):
+        """Test that writes never block when the buffer is full."""
+        writer, gate = blocked_writer(max_buffered=1)
+        path = str(tmp_path / "agent-log.jsonl")
+        writer.write(path, "first\n")
+        wait_until_taken(writer)
+
+        writer.write(path, "second\n")
+        writer.write(path, "dropped\n")
+        gate.set()
+        await asyncio.wait_for(writer.close(path), timeout=5)
+
+        assert writer.dropped == 1
+        assert (tmp_path / "agent-log.jsonl").read_text(encoding="utf-8") == "first\nsecond\n"
+
+    async def test_close_waits_for_space(self, tmp_path):
+        """Test that closing is not dropped when the buffer is full."""
+        writer, gate = blocked_writer(max_buffered=1)
+        path = str(tmp_path / "agent-log.jsonl")
+        writer.write(path, "first\n")
+        wait_until_taken(writer)
+        writer.write(path, "second\n")
+
+        close = asyncio.create_task(writer.close(path))
+        await asyncio.sleep(0.01)
+        assert not close.done()
+
+        gate.set()
+        await asyncio.wait_for(close, timeout=5)
+        assert path not in writer._files
+
+    def test_collect_metrics(self):
+        """Test that writer counters are exported."""
+        metrics = AgentLogWriter.collect_metrics()
+
+        assert set(metrics) == {
+            "sgr_agent_log_buffered_lines",
+            "sgr_agent_log_written_lines",
+            "sgr_agent_log_dropped_lines",
+        }
+
+
+class TestAgentLogFile:
+    """Tests for steps appended by executing agents."""
+
+    async def test_steps_appended_as_jsonl(self, tmp_path, monkeypatch):
+        """Test that log file has agent, step and summary records."""
+        monkeypatch.chdir(tmp_path)
+        agent = OneStepAgent(task="Test")
+
+        await agent.execute()
+
+        records = read_lines(next((tmp_path / "logs").glob(f"*-{agent.id}-log.jsonl")))
+        assert [record["step_type"] for record in records] == ["agent", "tool_execution", "summary"]
+        assert records[0]["task"] == "Test"
+        assert records[-1]["state"] == AgentStatesEnum.COMPLETED.value
+        assert records == json.loads(json.dumps(agent.log))
+
+    async def test_log_file_closed_after_execute(self, tmp_path, monkeypatch):
+        """Test that finished agent releases its log file."""
+        monkeypatch.chdir(tmp_path)
+        agent = OneStepAgent(task="Test")
+
+        await agent.execute()
+
+        assert agent._log_path is None
+        assert not AgentLogWriter.get()._files
+
+    def test_no_file_before_execute(self, tmp_path, monkeypatch):
+        """Test that steps of an agent not executing stay in memory."""
+        monkeypatch.chdir(tmp_path)
+        agent = OneStepAgent(task="Test")
+
+        agent._log_step({"step_type": "reasoning"})
+
+        assert agent.log == [{"step_type": "reasoning"}]
+        assert not (tmp_path / "logs").exists()
@@ -0,0 +1,140 @@
+"""Tests for AgentScheduler.
+
+This module contains tests for concurrency limits, admission queue,
+priorities, rejection and metrics of agent execution scheduling.
+"""
+
+import asyncio
+
+import pytest
+
+from sgr_deep_research.services.agent_scheduler import AgentScheduler, SchedulerFullError
+
+
+class Job:
+    """Coroutine factory that blocks until released."""
+
+    def __init__(self, name: str, started: list[str]):
+        self.name = name
+        self.started = started
+        self.release = asyncio.Event()
+
+    async def run(self):
+        self.started.append(self.name)
+        await self.release.wait()
+        return self.name
+
+
+class TestAgentScheduler:
+    """Tests for AgentScheduler."""
+
+    async def test_runs_immediately_under_limit(self):
+        """Test that jobs start right away while slots are free."""
+        scheduler = AgentScheduler(max_concurrent=2, max_queued=10, retry_after=5)
+        started = []
+        jobs = [Job(str(i), started) for i in range(2)]
+
+        tasks = [scheduler.submit(job.run()) for job in jobs]
+        await asyncio.sleep(0)
+
+        assert started == ["0", "1"]
+        assert scheduler.metrics.running == 2
+        assert scheduler.metrics.queued == 0
+        for job in jobs:
+            job.release.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.metrics.running == 0
+
+    async def test_excess_jobs_wait_for_slot(self):
+        """Test that concurrency never exceeds the limit."""
+        scheduler = AgentScheduler(max_concurrent=1, max_queued=10, retry_after=5)
+        started = []
+        first, second = Job("first", started), Job("second", started)
+
+        first_task = scheduler.submit(first.run())
+        second_task = scheduler.submit(second.run())
+        await asyncio.sleep(0)
+
+        assert started == ["first"]
+        assert scheduler.metrics.queued == 1
+
+        first.release.set()
+        await first_task
+        await asyncio.sleep(0)
+
+        assert started == ["first", "second"]
+        assert scheduler.metrics.running == 1
+        second.release.set()
+        assert await second_task == "second"
+        assert scheduler.metrics.admitted == 2
+
+    async def test_rejects_when_queue_full(self):
+        """Test that SchedulerFullError carries retry_after."""
+        scheduler = AgentScheduler(max_concurrent=1, max_queued=1, retry_after=7)
+        started = []
+        jobs = [Job(str(i), started) for i in range(3)]
+        tasks = [scheduler.submit(jobs[0].run()), scheduler.submit(jobs[1].run())]
+
+        with pytest.raises(SchedulerFullError) as exc_info:
+            scheduler.submit(jobs[2].run())
+
+        assert exc_info.value.retry_after == 7
+        assert scheduler.metrics.rejected == 1
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert scheduler.metrics.running == 0
+        assert scheduler.metrics.queued == 0
+
+    async def test_priority_order(self):
+        """Test that higher priority models are admitted first, FIFO
+        otherwise."""
+        scheduler = AgentScheduler(max_concurrent=1, max_queued=10, retry_after=5, priorities={"fast": 10})
+        started = []
+        blocker = Job("blocker", started)
+        low1, low2, high = Job("low1", started), Job("low2", started), Job("high", started)
+        tasks = [
+            scheduler.submit(blocker.run()),
+            scheduler.submit(low1.run(), model="slow"),
+            scheduler.submit(low2.run(), model="slow"),
+            scheduler.submit(high.run(), model="fast"),
+        ]
+
+        for job in (blocker, high, low1, low2):
+            job.release.set()
+        await asyncio.gather(*tasks)
+
+        assert started == ["blocker", "high", "low1", "low2"]
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test that cancelling a queued job frees its queue place."""
+        scheduler = AgentScheduler(max_concurrent=1, max_queued=1, retry_after=5)
+        started = []
+        running, queued = Job("running", started), Job("queued", started)
+        running_task = scheduler.submit(running.run())
+        queued_task = scheduler.submit(queued.run())
+        await asyncio.sleep(0)
+
+        queued_task.cancel()
+        await asyncio.gather(queued_task, return_exceptions=True)
+
+        assert scheduler.metrics.queued == 0
+        running.release.set()
+        await running_task
+        assert scheduler.metrics.running == 0
+        assert started == ["running"]
+
+    async def test_wait_time_metrics(self):
+        """Test that queue wait time is recorded."""
+        scheduler = AgentScheduler(max_concurrent=1, max_queued=10, retry_after=5)
+        started = []
+        first, second = Job("first", started), Job("second", started)
+        tasks = [scheduler.submit(first.run()), scheduler.submit(second.run())]
+
+        await asyncio.sleep(0.05)
+        first.release.set()
+        second.release.set()
+        await asyncio.gather(*tasks)
+
+        assert scheduler.metrics.wait_time_max >= 0.04
+        assert scheduler.metrics.wait_time_avg > 0
@@ -0,0 +1,180 @@
+"""Tests for API agents storage.
+
+This module contains tests for in-memory eviction of finished agents
+and SQLite snapshots of finished agents.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext, SourceData
+from sgr_deep_research.services.agent_store import (
+    AgentSnapshot,
+    InMemoryAgentStore,
+    SQLiteAgentStore,
+    build_agent_store,
+)
+
+
+def make_agent(agent_id: str, state: AgentStatesEnum = AgentStatesEnum.RESEARCHING):
+    context = ResearchContext(state=state, iteration=3, searches_used=2)
+    context.sources["https://example.com"] = SourceData(number=1, url="https://example.com")
+    return SimpleNamespace(
+        id=agent_id,
+        task=f"Task {agent_id}",
+        creation_time=datetime(2025, 1, 1, 12, 0),
+        _context=context,
+        conversation=[{"role": "user", "content": "Hello"}],
+    )
+
+
+class TestAgentSnapshot:
+    """Tests for AgentSnapshot."""
+
+    def test_from_agent(self):
+        """Test that snapshot copies context fields and sources count."""
+        snapshot = AgentSnapshot.from_agent(make_agent("a"), include_conversation=True)
+
+        assert snapshot.state == "researching"
+        assert snapshot.sources_count == 1
+        assert snapshot.context["iteration"] == 3
+        assert "sources" not in snapshot.context
+        assert snapshot.conversation == [{"role": "user", "content": "Hello"}]
+
+    def test_conversation_excluded_by_default(self):
+        """Test that conversation is copied only on request."""
+        assert AgentSnapshot.from_agent(make_agent("a")).conversation == []
+
+
+class TestInMemoryAgentStore:
+    """Tests for InMemoryAgentStore eviction."""
+
+    def test_mapping_interface(self):
+        """Test dict-like access to live agents."""
+        store = InMemoryAgentStore(max_finished_agents=10, finished_ttl=60)
+        agent = make_agent("a")
+
+        store["a"] = agent
+
+        assert "a" in store
+        assert store["a"] is agent
+        assert store.get("missing") is None
+        assert len(store) == 1
+
+    def test_running_agents_never_evicted(self):
+        """Test that max_finished_agents does not limit running agents."""
+        store = InMemoryAgentStore(max_finished_agents=1, finished_ttl=60)
+
+        for i in range(5):
+            store[str(i)] = make_agent(str(i))
+
+        assert len(store) == 5
+
+    def test_least_recently_used_finished_agent_evicted(self):
+        """Test that finished agents over the limit are evicted in LRU
+        order."""
+        store = InMemoryAgentStore(max_finished_agents=2, finished_ttl=60)
+        store["a"] = make_agent("a", AgentStatesEnum.COMPLETED)
+        store["b"] = make_agent("b", AgentStatesEnum.FAILED)
+        _ = store["a"]
+        store["c"] = make_agent("c", AgentStatesEnum.ERROR)
+
+        assert set(store) == {"a", "c"}
+
+    async def test_finished_agent_expires(self):
+        """Test that finished agents are dropped after TTL."""
+        store = InMemoryAgentStore(max_finished_agents=10, finished_ttl=10)
+        store["running"] = make_agent("running")
+        with patch("sgr_deep_research.services.agent_store.time.monotonic", return_value=100.0):
+            store["done"] = make_agent("done", AgentStatesEnum.COMPLETED)
+        with patch("sgr_deep_research.services.agent_store.time.monotonic", return_value=111.0):
+            summaries = await store.list_summaries()
+
+        assert [s.agent_id for s in summaries] == ["running"]
+        assert await store.get_snapshot("done") is None
+
+    async def test_get_snapshot(self):
+        """Test that snapshot of a live agent is returned."""
+        store = InMemoryAgentStore(max_finished_agents=10, finished_ttl=60)
+        store["a"] = make_agent("a")
+
+        snapshot = await store.get_snapshot("a")
+
+        assert snapshot.agent_id == "a"
+        assert snapshot.sources_count == 1
+
+
+class TestSQLiteAgentStore:
+    """Tests for SQLiteAgentStore snapshots."""
+
+    async def test_finished_agent_persisted_and_released(self, tmp_path):
+        """Test that finalize moves finished agent from memory to SQLite."""
+        store = SQLiteAgentStore(path=str(tmp_path / "agents.sqlite"))
+        agent = make_agent("a")
+        store["a"] = agent
+        agent._context.state = AgentStatesEnum.COMPLETED
+
+        await store.finalize("a")
+
+        assert "a" not in store
+        snapshot = await store.get_snapshot("a")
+        assert snapshot.state == "completed"
+        assert snapshot.context["searches_used"] == 2
+        assert snapshot.conversation == [{"role": "user", "content": "Hello"}]
+
+    async def test_running_agent_kept_in_memory(self, tmp_path):
+        """Test that an unfinished agent stays live after finalize."""
+        store = SQLiteAgentStore(path=str(tmp_path / "agents.sqlite"))
+        store["a"] = make_agent("a", AgentStatesEnum.WAITING_FOR_CLARIFICATION)
+
+        await store.finalize("a")
+
+        assert "a" in store
+
+    async def test_list_merges_live_and_stored(self, tmp_path):
+        """Test that listing includes both live and persisted agents."""
+        store = SQLiteAgentStore(path=str(tmp_path / "agents.sqlite"))
+        store["done"] = make_agent("done", AgentStatesEnum.COMPLETED)
+        await store.finalize("done")
+        store["running"] = make_agent("running")
+
+        summaries = {s.agent_id: s for s in await store.list_summaries()}
+
+        assert set(summaries) == {"done", "running"}
+        assert summaries["done"].task == "Task done"
+
+    async def test_snapshots_survive_restart(self, tmp_path):
+        """Test that persisted agents are available after reopening."""
+        path = str(tmp_path / "agents.sqlite")
+        store = SQLiteAgentStore(path=path)
+        store["a"] = make_agent("a", AgentStatesEnum.COMPLETED)
+        await store.finalize("a")
+        store.close()
+
+        reopened = SQLiteAgentStore(path=path)
+
+        assert (await reopened.get_snapshot("a")).task == "Task a"
+        assert len(await reopened.list_summaries()) == 1
+
+    async def test_clear(self, tmp_path):
+        """Test that clear removes live and persisted agents."""
+        store = SQLiteAgentStore(path=str(tmp_path / "agents.sqlite"))
+        store["a"] = make_agent("a", AgentStatesEnum.COMPLETED)
+        await store.finalize("a")
+
+        store.clear()
+
+        assert await store.list_summaries() == []
+
+
+class TestBuildAgentStore:
+    """Tests for build_agent_store factory."""
+
+    def test_build_memory(self):
+        store = build_agent_store("memory", max_finished_agents=1, finished_ttl=1)
+        assert isinstance(store, InMemoryAgentStore)
+
+    def test_build_sqlite(self, tmp_path):
+        store = build_agent_store("sqlite", max_finished_agents=1, finished_ttl=1, path=str(tmp_path / "a.sqlite"))
+        assert isinstance(store, SQLiteAgentStore)
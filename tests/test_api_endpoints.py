@@ -22,6 +22,7 @@ from sgr_deep_research.api.endpoints import (
 from sgr_deep_research.api.models import AgentModel, ChatCompletionRequest, ChatMessage, ClarificationRequest
 from sgr_deep_research.core.agents import SGRAgent
 from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.services.agent_scheduler import AgentScheduler
 
 
 class TestIsAgentId:
@@ -150,7 +151,7 @@ class TestChatCompletionEndpoint:
         # Mock asyncio.create_task to properly handle coroutines
         with (
             patch("sgr_deep_research.api.endpoints.AGENT_MODEL_MAPPING", mock_mapping),
-            patch("sgr_deep_research.api.endpoints.asyncio.create_task") as mock_create_task,
+            patch("sgr_deep_research.services.agent_scheduler.asyncio.create_task") as mock_create_task,
         ):
             # Schedule the coroutine via event loop to avoid 'never awaited' warnings
             def mock_create_task_func(coro):
@@ -169,6 +170,34 @@ class TestChatCompletionEndpoint:
             # Verify execute task was created
             mock_create_task.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_scheduler_full_returns_429(self):
+        """Test that a full scheduler queue rejects request with Retry-
+        After."""
+        mock_agent = Mock()
+        mock_agent.id = "test_agent_12345678-1234-1234-1234-123456789012"
+
+        async def mock_execute():
+            pass
+
+        mock_agent.execute = mock_execute
+        mock_mapping = {AgentModel.SGR_AGENT: Mock(return_value=mock_agent)}
+        request = ChatCompletionRequest(
+            model="sgr_agent", messages=[ChatMessage(role="user", content="Test task")], stream=True
+        )
+
+        with (
+            patch("sgr_deep_research.api.endpoints.AGENT_MODEL_MAPPING", mock_mapping),
+            patch("sgr_deep_research.api.endpoints.agent_scheduler", AgentScheduler(1, 0, retry_after=7)) as scheduler,
+        ):
+            scheduler.metrics.running = 1
+            with pytest.raises(HTTPException) as exc_info:
+                await create_chat_completion(request)
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers == {"Retry-After": "7"}
+        assert mock_agent.id not in agents_storage
+
     @pytest.mark.asyncio
     async def test_non_streaming_request_raises_error(self):
         """Test that non-streaming request raises HTTPException."""
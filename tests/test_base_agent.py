@@ -11,7 +11,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.base_agent import BaseAgent, config
 from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
 from sgr_deep_research.core.tools import BaseTool, ReasoningTool
 
@@ -201,7 +201,14 @@ class TestBaseAgentInitialization:
 
         agent = BaseAgent(task="Test")
 
-        mock_generator.assert_called_once_with(model=agent.id)
+        mock_generator.assert_called_once_with(
+            model=agent.id,
+            max_queue_size=config.streaming.max_queue_size,
+            policy=config.streaming.queue_policy,
+            coalesce_window=config.streaming.coalesce_window,
+            coalesce_max_bytes=config.streaming.coalesce_max_bytes,
+            replay_buffer_size=config.streaming.replay_buffer_size,
+        )
 
 
 class TestBaseAgentClarificationHandling:
@@ -226,8 +226,8 @@ class TestBenchmarkAgentExecution:
             # Verify parent execute was called
             mock_parent_execute.assert_called_once()
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_benchmark_agent_config_integration(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_benchmark_agent_config_integration(self, mock_pool):
         """Test that BenchmarkAgent properly integrates with configuration
         system."""
         # Agents use real config from config.yaml
@@ -237,8 +237,8 @@ class TestBenchmarkAgentExecution:
         assert agent.task == "Config integration test"
         assert agent.name == "benchmark_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
 
 class TestBenchmarkAgentIntegration:
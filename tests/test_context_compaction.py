@@ -0,0 +1,134 @@
+"""Tests for conversation context compaction.
+
+This module contains tests for ContextCompactor truncation and
+summarization of older tool results and for compaction applied in
+BaseAgent._prepare_context.
+"""
+
+from unittest.mock import AsyncMock
+
+from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.context_compaction import ContextCompactor
+from sgr_deep_research.services.rate_limiter import estimate_tokens
+
+CITATION = "[7] Example page - https://example.com/page"
+
+
+def make_conversation(steps: int, result_chars: int = 4000) -> list[dict]:
+    """Conversation with one large tool result per step."""
+    messages = [{"role": "user", "content": "task"}]
+    for step in range(1, steps + 1):
+        messages.append({"role": "assistant", "content": None, "tool_calls": [{"id": f"{step}-action"}]})
+        content = f"Result of step {step}\n" + "x" * result_chars + f"\n{CITATION}\n"
+        messages.append({"role": "tool", "content": content, "tool_call_id": f"{step}-action"})
+    return messages
+
+
+class TestContextCompactor:
+    """Tests for ContextCompactor."""
+
+    async def test_under_budget_unchanged(self):
+        """Test that context within budget is returned as is."""
+        messages = make_conversation(3, result_chars=100)
+        compactor = ContextCompactor(max_tokens=100_000)
+
+        compacted, tokens_before, tokens_after = await compactor.compact(messages)
+
+        assert compacted is messages
+        assert tokens_before == tokens_after == estimate_tokens(messages)
+
+    async def test_latest_steps_kept_verbatim(self):
+        """Test that only results older than keep_last_steps are
+        compacted."""
+        messages = make_conversation(4)
+        compactor = ContextCompactor(max_tokens=100, keep_last_steps=2, truncate_chars=50)
+
+        compacted, tokens_before, tokens_after = await compactor.compact(messages)
+
+        tool_results = [m["content"] for m in compacted if m["role"] == "tool"]
+        assert all("characters compacted" in content for content in tool_results[:2])
+        assert tool_results[2:] == [m["content"] for m in messages if m["role"] == "tool"][2:]
+        assert tokens_after < tokens_before
+
+    async def test_conversation_not_modified(self):
+        """Test that compaction does not change original messages."""
+        messages = make_conversation(3)
+        original = [dict(message) for message in messages]
+
+        await ContextCompactor(max_tokens=100, keep_last_steps=1).compact(messages)
+
+        assert messages == original
+
+    async def test_stops_when_budget_reached(self):
+        """Test that oldest results are compacted first and only as
+        needed."""
+        messages = make_conversation(4)
+        budget = estimate_tokens(messages) - 500
+        compactor = ContextCompactor(max_tokens=budget, keep_last_steps=1, truncate_chars=50)
+
+        compacted, _, tokens_after = await compactor.compact(messages)
+
+        tool_results = [m["content"] for m in compacted if m["role"] == "tool"]
+        assert "characters compacted" in tool_results[0]
+        assert "characters compacted" not in tool_results[1]
+        assert tokens_after <= budget
+
+    async def test_truncation_keeps_citations(self):
+        """Test that source citations survive truncation."""
+        compactor = ContextCompactor(max_tokens=100, keep_last_steps=1, truncate_chars=50)
+
+        compacted, _, _ = await compactor.compact(make_conversation(2))
+
+        assert CITATION in compacted[2]["content"]
+
+    async def test_summarize_strategy(self):
+        """Test that summaries are requested once per result and keep
+        citations."""
+        summarizer = AsyncMock(return_value="Short summary")
+        compactor = ContextCompactor(max_tokens=100, keep_last_steps=1, strategy="summarize", summarizer=summarizer)
+        messages = make_conversation(2)
+
+        first, _, _ = await compactor.compact(messages)
+        second, _, _ = await compactor.compact(messages)
+
+        assert summarizer.await_count == 1
+        assert first[2]["content"] == second[2]["content"] == f"Short summary\n\nSources:\n{CITATION}"
+
+    async def test_failed_summary_falls_back_to_truncation(self):
+        """Test that summarizer errors do not break the LLM call."""
+        summarizer = AsyncMock(side_effect=RuntimeError("llm down"))
+        compactor = ContextCompactor(
+            max_tokens=100, keep_last_steps=1, strategy="summarize", truncate_chars=50, summarizer=summarizer
+        )
+
+        compacted, _, _ = await compactor.compact(make_conversation(2))
+
+        assert "characters compacted" in compacted[2]["content"]
+
+
+class TestAgentContextCompaction:
+    """Tests for compaction in BaseAgent._prepare_context."""
+
+    async def test_compaction_recorded_in_log(self):
+        """Test that token counts before and after are saved in agent
+        log."""
+        agent = BaseAgent(task="Test")
+        agent._compactor = ContextCompactor(max_tokens=100, keep_last_steps=1, truncate_chars=50)
+        agent.conversation = make_conversation(3)
+
+        context = await agent._prepare_context()
+
+        assert context[0]["role"] == "system"
+        entry = agent.log[-1]
+        assert entry["step_type"] == "context_compaction"
+        assert entry["tokens_after"] < entry["tokens_before"]
+        assert agent.conversation == make_conversation(3)
+
+    async def test_no_log_without_compaction(self):
+        """Test that small context leaves the log untouched."""
+        agent = BaseAgent(task="Test")
+        agent.conversation = [{"role": "user", "content": "test"}]
+
+        await agent._prepare_context()
+
+        assert agent.log == []
@@ -3,9 +3,11 @@
 This module contains tests for CreateReportTool with file generation.
 """
 
+import gzip
 import json
 import os
 import tempfile
+import threading
 from datetime import datetime
 from unittest.mock import patch
 
@@ -14,6 +16,7 @@ from pydantic import ValidationError
 
 from sgr_deep_research.core.models import ResearchContext, SourceData
 from sgr_deep_research.core.tools.create_report_tool import CreateReportTool
+from sgr_deep_research.services.report_storage import LocalReportStorage, ReportStorage
 
 
 class TestCreateReportTool:
@@ -372,3 +375,79 @@ class TestCreateReportTool:
                 # Just verify it doesn't crash and creates report
                 assert result_data["title"] == "Report"
                 assert os.path.exists(result_data["filepath"])
+
+
+class TestReportStorage:
+    """Tests for report storage backends used by CreateReportTool."""
+
+    @staticmethod
+    def make_tool() -> CreateReportTool:
+        return CreateReportTool(
+            reasoning="Complete",
+            title="Report",
+            user_request_language_reference="Task",
+            content="Отчёт " * 1000,
+            confidence="high",
+        )
+
+    @pytest.mark.asyncio
+    async def test_write_latency_in_result(self, tmp_path):
+        """Test that report write time is reported."""
+        with patch("sgr_deep_research.core.tools.create_report_tool.config") as mock_config:
+            mock_config.execution.reports_dir = str(tmp_path)
+            mock_config.execution.report_compression = "none"
+
+            result_data = json.loads(await self.make_tool()(ResearchContext()))
+
+        assert result_data["write_seconds"] >= 0
+        assert result_data["filepath"].endswith(".md")
+
+    @pytest.mark.asyncio
+    async def test_gzip_compression(self, tmp_path):
+        """Test that gzip compressed reports keep the full content."""
+        with patch("sgr_deep_research.core.tools.create_report_tool.config") as mock_config:
+            mock_config.execution.reports_dir = str(tmp_path)
+            mock_config.execution.report_compression = "gzip"
+
+            result_data = json.loads(await self.make_tool()(ResearchContext()))
+
+        filepath = result_data["filepath"]
+        assert filepath.endswith(".md.gz")
+        with gzip.open(filepath, "rt", encoding="utf-8") as f:
+            assert "Отчёт Отчёт" in f.read()
+
+    @pytest.mark.asyncio
+    async def test_write_runs_off_event_loop(self, tmp_path):
+        """Test that files are written in a worker thread."""
+        storage = LocalReportStorage(str(tmp_path))
+        threads = []
+        save_sync = storage._save_sync
+
+        def record_thread(name, content):
+            threads.append(threading.current_thread())
+            return save_sync(name, content)
+
+        storage._save_sync = record_thread
+        await storage.save("report.md", "content")
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert (tmp_path / "report.md").read_text(encoding="utf-8") == "content"
+
+    @pytest.mark.asyncio
+    async def test_custom_storage(self):
+        """Test that a custom backend replaces local files."""
+
+        class MemoryStorage(ReportStorage):
+            def __init__(self):
+                self.reports = {}
+
+            async def save(self, name: str, content: str) -> str:
+                self.reports[name] = content
+                return f"memory://{name}"
+
+        storage = MemoryStorage()
+        with patch.object(CreateReportTool, "storage", storage):
+            result_data = json.loads(await self.make_tool()(ResearchContext()))
+
+        assert result_data["filepath"].startswith("memory://")
+        assert list(storage.reports.values())[0].startswith("# Report")
@@ -0,0 +1,168 @@
+"""Tests for pooled HTTPClient.
+
+This module contains tests for HTTPClient connection reuse, retries and
+shutdown using httpx mock transport.
+"""
+
+import httpx
+import pytest
+
+from sgr_deep_research.services.base import HTTPClient
+
+
+class DummyServiceClient(HTTPClient):
+    service_name = "dummy_service"
+    service_url = "https://dummy.example.com"
+    max_retries = 2
+    retry_backoff = 0
+
+
+class OtherServiceClient(HTTPClient):
+    service_name = "other_service"
+
+
+@pytest.fixture(autouse=True)
+async def reset_clients():
+    """Close and drop pooled clients between tests."""
+    yield
+    await HTTPClient.close_all()
+
+
+def install_transport(client_cls: type[HTTPClient], handler) -> httpx.AsyncClient:
+    """Pre-seed pool with a client backed by mock transport."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    HTTPClient._clients[client_cls.service_name] = client
+    return client
+
+
+class TestHTTPClientPooling:
+    """Tests for long-lived pooled clients."""
+
+    def test_client_reused_per_service(self):
+        """Test that the same client is returned for the same service."""
+        assert DummyServiceClient._get_client() is DummyServiceClient._get_client()
+
+    def test_clients_separated_by_service_name(self):
+        """Test that different services get different pooled clients."""
+        assert DummyServiceClient._get_client() is not OtherServiceClient._get_client()
+
+    async def test_closed_client_is_recreated(self):
+        """Test that a closed client is replaced on next use."""
+        client = DummyServiceClient._get_client()
+        await client.aclose()
+
+        assert DummyServiceClient._get_client() is not client
+
+    async def test_close_only_affects_own_service(self):
+        """Test that close drops only the calling service client."""
+        DummyServiceClient._get_client()
+        other = OtherServiceClient._get_client()
+
+        await DummyServiceClient.close()
+
+        assert "dummy_service" not in HTTPClient._clients
+        assert HTTPClient._clients["other_service"] is other
+
+    async def test_close_all(self):
+        """Test that close_all closes every pooled client."""
+        dummy = DummyServiceClient._get_client()
+        other = OtherServiceClient._get_client()
+
+        await HTTPClient.close_all()
+
+        assert HTTPClient._clients == {}
+        assert dummy.is_closed
+        assert other.is_closed
+
+
+class TestHTTPClientRequest:
+    """Tests for request execution and retries."""
+
+    async def test_request_returns_json(self):
+        """Test successful request returns decoded JSON."""
+        install_transport(DummyServiceClient, lambda request: httpx.Response(200, json={"ok": True}))
+
+        result = await DummyServiceClient.request("get", "https://dummy.example.com/ping")
+
+        assert result == {"ok": True}
+
+    async def test_request_sends_payload(self):
+        """Test that method, params and JSON body are forwarded."""
+        captured = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured["method"] = request.method
+            captured["query"] = dict(request.url.params)
+            captured["body"] = request.content
+            return httpx.Response(200, json={})
+
+        install_transport(DummyServiceClient, handler)
+
+        await DummyServiceClient.request("post", "https://dummy.example.com/x", data={"a": 1}, params={"q": "v"})
+
+        assert captured["method"] == "POST"
+        assert captured["query"] == {"q": "v"}
+        assert b'"a"' in captured["body"]
+
+    async def test_request_retries_on_server_error(self):
+        """Test that 5xx responses are retried until success."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"attempts": len(calls)})
+
+        install_transport(DummyServiceClient, handler)
+
+        result = await DummyServiceClient.request("get", "https://dummy.example.com/flaky")
+
+        assert result == {"attempts": 3}
+
+    async def test_request_raises_after_retries_exhausted(self):
+        """Test that the last retryable error is raised."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(429)
+
+        install_transport(DummyServiceClient, handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await DummyServiceClient.request("get", "https://dummy.example.com/busy")
+
+        assert len(calls) == DummyServiceClient.max_retries + 1
+
+    async def test_request_does_not_retry_client_error(self):
+        """Test that 4xx responses other than 429 fail immediately."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(404)
+
+        install_transport(DummyServiceClient, handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await DummyServiceClient.request("get", "https://dummy.example.com/missing")
+
+        assert len(calls) == 1
+
+    async def test_request_retries_transport_error(self):
+        """Test that connection errors are retried."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("boom", request=request)
+            return httpx.Response(200, json={"ok": True})
+
+        install_transport(DummyServiceClient, handler)
+
+        result = await DummyServiceClient.request("get", "https://dummy.example.com/reconnect")
+
+        assert result == {"ok": True}
+        assert len(calls) == 2
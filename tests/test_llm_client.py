@@ -0,0 +1,108 @@
+"""Tests for shared LLM client pool.
+
+This module contains tests for LLMClientPool lifecycle and agent client
+injection.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.services.llm_client import LLMClientPool
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    """Ensure every test starts without a shared client."""
+    LLMClientPool._client = None
+    LLMClientPool._http_client = None
+    yield
+    LLMClientPool._client = None
+    LLMClientPool._http_client = None
+
+
+class TestLLMClientPool:
+    """Tests for LLMClientPool class."""
+
+    @patch("sgr_deep_research.services.llm_client.AsyncOpenAI")
+    def test_get_client_is_shared(self, mock_openai):
+        """Test that repeated calls return the same client instance."""
+        mock_openai.return_value = Mock()
+
+        client1 = LLMClientPool.get_client()
+        client2 = LLMClientPool.get_client()
+
+        assert client1 is client2
+        mock_openai.assert_called_once()
+
+    @patch("sgr_deep_research.services.llm_client.AsyncOpenAI")
+    def test_get_client_uses_pooled_http_client(self, mock_openai):
+        """Test that client is built on top of the pooled httpx client."""
+        LLMClientPool.get_client()
+
+        kwargs = mock_openai.call_args.kwargs
+        assert kwargs["http_client"] is LLMClientPool._http_client
+        assert kwargs["api_key"] == "test"
+
+    @patch("sgr_deep_research.services.llm_client.AsyncOpenAI")
+    def test_http2_fallback_without_h2(self, mock_openai):
+        """Test that HTTP/2 falls back to HTTP/1.1 when h2 is missing."""
+        with (
+            patch("sgr_deep_research.services.llm_client.get_config") as mock_config,
+            patch("sgr_deep_research.services.llm_client.importlib.util.find_spec", return_value=None),
+            patch("sgr_deep_research.services.llm_client.httpx.AsyncClient") as mock_http_client,
+        ):
+            mock_config.return_value.openai.http2 = True
+            mock_config.return_value.openai.proxy = ""
+            mock_config.return_value.openai.max_connections = 10
+            mock_config.return_value.openai.max_keepalive_connections = 5
+            mock_config.return_value.openai.keepalive_expiry = 30.0
+            mock_config.return_value.openai.timeout = 60.0
+            mock_config.return_value.openai.connect_timeout = 5.0
+
+            LLMClientPool.get_client()
+
+        assert mock_http_client.call_args.kwargs["http2"] is False
+
+    @pytest.mark.asyncio
+    @patch("sgr_deep_research.services.llm_client.AsyncOpenAI")
+    async def test_close_resets_pool(self, mock_openai):
+        """Test that close releases the client and allows rebuilding."""
+        mock_openai.return_value = Mock(close=AsyncMock())
+        client = LLMClientPool.get_client()
+
+        await LLMClientPool.close()
+
+        client.close.assert_awaited_once()
+        assert LLMClientPool._client is None
+        assert LLMClientPool._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_close_without_client(self):
+        """Test that closing an unused pool is a no-op."""
+        await LLMClientPool.close()
+        assert LLMClientPool._client is None
+
+
+class TestAgentClientInjection:
+    """Tests for injecting LLM client into agents."""
+
+    def test_agent_uses_injected_client(self):
+        """Test that an explicitly provided client is used."""
+        client = Mock()
+        agent = BaseAgent(task="Test", openai_client=client)
+
+        assert agent.openai_client is client
+
+    @patch("sgr_deep_research.services.llm_client.AsyncOpenAI")
+    def test_agents_share_pooled_client(self, mock_openai):
+        """Test that agents without injected client share the pooled
+        one."""
+        mock_openai.return_value = Mock()
+
+        agent1 = BaseAgent(task="Task 1")
+        agent2 = BaseAgent(task="Task 2")
+
+        assert agent1.openai_client is agent2.openai_client
+        mock_openai.assert_called_once()
@@ -14,6 +14,7 @@ from pydantic import Field
 
 from sgr_deep_research.core.base_tool import BaseTool, MCPBaseTool
 from sgr_deep_research.core.models import ResearchContext
+from sgr_deep_research.settings import MCPConfig
 
 
 class TestMCPBaseTool:
@@ -237,14 +238,14 @@ class TestMCP2ToolConverter:
         converter = MCP2ToolConverter()
 
         assert converter.toolkit == []
-        assert not hasattr(converter, "client")
+        assert converter.sessions == {}
 
     @patch("sgr_deep_research.services.mcp_service.get_config")
     @patch("sgr_deep_research.services.mcp_service.Client")
     def test_mcp2tool_converter_init_with_config(self, mock_client_class, mock_get_config):
         """Test initialization with valid MCP config."""
         mock_config = Mock()
-        mock_config.mcp.transport_config = {"type": "stdio"}
+        mock_config.mcp = MCPConfig(transport_config={"type": "stdio"}, tool_cache_path="")
         mock_get_config.return_value = mock_config
 
         from sgr_deep_research.services.mcp_service import MCP2ToolConverter
@@ -255,7 +256,7 @@ class TestMCP2ToolConverter:
 
         converter = MCP2ToolConverter()
 
-        assert hasattr(converter, "client")
+        assert list(converter.sessions) == ["default"]
         mock_client_class.assert_called_once_with({"type": "stdio"})
 
     def test_to_camel_case_simple(self):
@@ -329,7 +330,7 @@ class TestMCP2ToolConverter:
         """Test basic tool building from MCP."""
         # Setup config
         mock_config = Mock()
-        mock_config.mcp.transport_config = {"type": "stdio"}
+        mock_config.mcp = MCPConfig(transport_config={"type": "stdio"}, tool_cache_path="")
         mock_get_config.return_value = mock_config
 
         # Setup client
@@ -371,7 +372,7 @@ class TestMCP2ToolConverter:
     async def test_build_tools_skips_tool_without_name(self, mock_client_class, mock_get_config):
         """Test that tools without name are skipped."""
         mock_config = Mock()
-        mock_config.mcp.transport_config = {"type": "stdio"}
+        mock_config.mcp = MCPConfig(transport_config={"type": "stdio"}, tool_cache_path="")
         mock_get_config.return_value = mock_config
 
         mock_client = AsyncMock()
@@ -399,7 +400,7 @@ class TestMCP2ToolConverter:
     async def test_build_tools_skips_tool_without_schema(self, mock_client_class, mock_get_config):
         """Test that tools without inputSchema are skipped."""
         mock_config = Mock()
-        mock_config.mcp.transport_config = {"type": "stdio"}
+        mock_config.mcp = MCPConfig(transport_config={"type": "stdio"}, tool_cache_path="")
         mock_get_config.return_value = mock_config
 
         mock_client = AsyncMock()
@@ -428,7 +429,7 @@ class TestMCP2ToolConverter:
     async def test_build_tools_handles_schema_error(self, mock_schema_converter, mock_client_class, mock_get_config):
         """Test handling of schema conversion errors."""
         mock_config = Mock()
-        mock_config.mcp.transport_config = {"type": "stdio"}
+        mock_config.mcp = MCPConfig(transport_config={"type": "stdio"}, tool_cache_path="")
         mock_get_config.return_value = mock_config
 
         mock_client = AsyncMock()
@@ -465,7 +466,7 @@ class TestMCP2ToolConverter:
     ):
         """Test building multiple tools."""
         mock_config = Mock()
-        mock_config.mcp.transport_config = {"type": "stdio"}
+        mock_config.mcp = MCPConfig(transport_config={"type": "stdio"}, tool_cache_path="")
         mock_get_config.return_value = mock_config
 
         mock_client = AsyncMock()
@@ -509,7 +510,7 @@ class TestMCP2ToolConverter:
     ):
         """Test that built tools have _client reference set."""
         mock_config = Mock()
-        mock_config.mcp.transport_config = {"type": "stdio"}
+        mock_config.mcp = MCPConfig(transport_config={"type": "stdio"}, tool_cache_path="")
         mock_get_config.return_value = mock_config
 
         mock_client = AsyncMock()
@@ -549,7 +550,7 @@ class TestMCP2ToolConverter:
     ):
         """Test that schema title is set to CamelCase tool name."""
         mock_config = Mock()
-        mock_config.mcp.transport_config = {"type": "stdio"}
+        mock_config.mcp = MCPConfig(transport_config={"type": "stdio"}, tool_cache_path="")
         mock_get_config.return_value = mock_config
 
         mock_client = AsyncMock()
@@ -0,0 +1,377 @@
+"""Tests for shared MCP server sessions.
+
+This module contains tests for reference-counted MCP sessions,
+per-server call limits, reconnects and health checks, and for tools
+discovered, cached and refreshed per server by MCP2ToolConverter.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from pydantic import create_model
+
+from sgr_deep_research.core.base_tool import MCPBaseTool
+from sgr_deep_research.core.models import ResearchContext
+from sgr_deep_research.services import mcp_service
+from sgr_deep_research.services.mcp_service import MCP2ToolConverter, MCPServerSession
+from sgr_deep_research.settings import MCPConfig
+
+SCHEMA = {"type": "object", "properties": {"query": {"type": "string"}}}
+
+
+def mcp_tool(name: str, description: str = "") -> SimpleNamespace:
+    return SimpleNamespace(name=name, description=description, inputSchema=dict(SCHEMA))
+
+
+class FakeClient:
+    """MCP client counting connections and concurrent calls."""
+
+    def __init__(self, tools: list | None = None, list_delay: float = 0, connect_delay: float = 0):
+        self.tools = tools or []
+        self.list_delay = list_delay
+        self.connect_delay = connect_delay
+        self.connected = False
+        self.opened = 0
+        self.closed = 0
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+        self.drop_next_call = False
+        self.fail_next_connect = False
+        self.ping_ok = True
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.connect_delay)
+        if self.fail_next_connect:
+            self.fail_next_connect = False
+            raise ConnectionError("refused")
+        self.opened += 1
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed += 1
+        self.connected = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def call_tool(self, name, arguments):
+        assert self.connected
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if self.drop_next_call:
+            self.drop_next_call = False
+            self.connected = False
+            raise ConnectionError("connection dropped")
+        self.calls.append((name, arguments))
+        return SimpleNamespace(content=[Mock(model_dump_json=Mock(return_value=f'"{name}"'))])
+
+    async def list_tools(self):
+        await asyncio.sleep(self.list_delay)
+        return self.tools
+
+    async def ping(self):
+        return self.ping_ok
+
+
+@pytest.fixture
+def schema_builds(monkeypatch) -> list[str]:
+    """Titles of schemas built into tool models."""
+    builds = []
+
+    def build(schema):
+        builds.append(schema["title"])
+        return create_model(schema["title"], query=(str, ...))
+
+    monkeypatch.setattr(mcp_service, "SchemaConverter", SimpleNamespace(build=build))
+    return builds
+
+
+@pytest.fixture
+def make_converter(monkeypatch, schema_builds):
+    """Factory of fresh MCP2ToolConverter connected to fake clients by server name."""
+    converters = []
+
+    def make(clients: dict[str, FakeClient], url: str = "https://mcp", **settings) -> MCP2ToolConverter:
+        settings = {"health_check_interval": 0, "tool_refresh_interval": 0, "tool_cache_path": "", **settings}
+        servers = {name: {"url": f"{url}/{name}"} for name in clients}
+        config = SimpleNamespace(mcp=MCPConfig(transport_config={"mcpServers": servers}, **settings))
+        monkeypatch.setattr(mcp_service, "get_config", lambda: config)
+        monkeypatch.setattr(mcp_service, "Client", lambda server: clients[next(iter(server["mcpServers"]))])
+        MCP2ToolConverter._instances.pop(MCP2ToolConverter, None)
+        converters.append(MCP2ToolConverter())
+        return converters[-1]
+
+    yield make
+    for converter in converters:
+        for task in converter._background:
+            task.cancel()
+    MCP2ToolConverter._instances.pop(MCP2ToolConverter, None)
+
+
+class TestMCPServerSession:
+    """Tests for reference counting, limits and reconnects."""
+
+    async def test_open_session_shared_by_calls(self):
+        """Test that calls reuse the session held by open()."""
+        client = FakeClient()
+        session = MCPServerSession("server", client)
+
+        await session.open()
+        for _ in range(5):
+            await session.call_tool("tool", {})
+        assert (client.opened, client.closed) == (1, 0)
+
+        await session.close()
+        assert (client.opened, client.closed) == (1, 1)
+        assert not session.connected
+
+    async def test_calls_without_open_connect_for_their_duration(self):
+        """Test that concurrent calls share one connection closed by the last of them."""
+        client = FakeClient()
+        session = MCPServerSession("server", client)
+
+        await asyncio.gather(*(session.call_tool("tool", {}) for _ in range(5)))
+
+        assert (client.opened, client.closed) == (1, 1)
+        assert len(client.calls) == 5
+
+    async def test_concurrent_calls_limited(self):
+        """Test that calls above the server limit wait."""
+        client = FakeClient()
+        session = MCPServerSession("server", client, max_concurrent_calls=2)
+        await session.open()
+
+        await asyncio.gather(*(session.call_tool("tool", {"i": i}) for i in range(6)))
+
+        assert client.max_active == 2
+        assert len(client.calls) == 6
+        await session.close()
+
+    async def test_dropped_connection_reconnected_and_retried(self):
+        """Test that call failing on a lost connection is retried once."""
+        client = FakeClient()
+        session = MCPServerSession("server", client)
+        await session.open()
+        client.drop_next_call = True
+
+        await session.call_tool("tool", {"q": 1})
+
+        assert client.calls == [("tool", {"q": 1})]
+        assert session.reconnects == 1
+        assert session.connected
+        await session.close()
+
+    async def test_tool_error_not_retried(self):
+        """Test that errors on a live connection are raised as they are."""
+        client = FakeClient()
+        session = MCPServerSession("server", client)
+        await session.open()
+
+        async def failing_call(name, arguments):
+            raise ValueError("bad arguments")
+
+        client.call_tool = failing_call
+        with pytest.raises(ValueError):
+            await session.call_tool("tool", {})
+
+        assert session.reconnects == 0
+        await session.close()
+
+    async def test_unavailable_server_connected_on_call(self):
+        """Test that a server down at startup is connected by later calls."""
+        client = FakeClient()
+        client.fail_next_connect = True
+        session = MCPServerSession("server", client)
+
+        await session.open()
+        await asyncio.sleep(0.01)
+        assert not session.connected
+
+        await session.call_tool("tool", {})
+        assert session.connected
+        await session.close()
+        assert client.closed == 1
+
+    async def test_open_does_not_wait_for_connect(self):
+        """Test that open returns at once and a hanging connect gives up after timeout."""
+        client = FakeClient(connect_delay=10)
+        session = MCPServerSession("server", client, connect_timeout=0.05)
+
+        await asyncio.wait_for(session.open(), timeout=0.01)
+        await asyncio.sleep(0.1)
+
+        assert session._opening.done()
+        assert not session.connected
+        await asyncio.wait_for(session.close(), timeout=0.01)
+
+    async def test_failed_ping_reconnects(self):
+        """Test that health check reopens a session that stopped answering."""
+        client = FakeClient()
+        client.ping_ok = False
+        session = MCPServerSession("server", client)
+
+        await session.open(health_check_interval=0.01)
+        await asyncio.sleep(0.05)
+        client.ping_ok = True
+        await asyncio.sleep(0.02)
+
+        assert session.failed_health_checks >= 1
+        assert session.reconnects == session.failed_health_checks
+        assert session.connected
+        await session.close()
+        assert not session.connected
+
+
+class TestMCPToolsWithSessions:
+    """Tests for tools calling MCP servers through shared sessions."""
+
+    async def test_tool_calls_session_with_server_name(self):
+        """Test that tool prefixed with the server name calls the server tool."""
+        client = FakeClient()
+        session = MCPServerSession("deepwiki", client)
+
+        class TestMCPTool(MCPBaseTool):
+            query: str = "sgr"
+
+        TestMCPTool.tool_name = "deepwiki_ask_question"
+        TestMCPTool.mcp_tool_name = "ask_question"
+        TestMCPTool._session = session
+
+        result = await TestMCPTool()(ResearchContext())
+
+        assert client.calls == [("ask_question", {"query": "sgr"})]
+        assert "ask_question" in result
+
+    async def test_session_per_server(self, make_converter):
+        """Test that every configured server gets its own session and prefixed tools."""
+        clients = {"deepwiki": FakeClient([mcp_tool("ask")]), "context7": FakeClient([mcp_tool("get_docs")])}
+        mcp = make_converter(clients, max_concurrent_calls=4)
+
+        await mcp.open()
+        await mcp.build_tools_from_mcp()
+
+        assert list(mcp.sessions) == ["deepwiki", "context7"]
+        assert [tool.tool_name for tool in mcp.toolkit] == ["deepwiki_ask", "context7_get_docs"]
+        await mcp.toolkit[1](query="agents")(ResearchContext())
+        assert clients["context7"].calls == [("get_docs", {"query": "agents"})]
+        assert all(client.opened == 1 for client in clients.values())
+        assert MCP2ToolConverter.collect_metrics()["sgr_mcp_context7_connected"][1] == 1
+
+        await mcp.close()
+        assert all(client.closed == 1 for client in clients.values())
+
+    def test_single_server_keeps_config(self):
+        """Test that a single server is connected with the config as it is."""
+        transport_config = {"mcpServers": {"deepwiki": {"url": "https://deepwiki"}}}
+
+        assert MCP2ToolConverter._split_servers(transport_config) == {"deepwiki": transport_config}
+
+
+class TestMCPToolDiscovery:
+    """Tests for concurrent discovery and cached tool catalogs."""
+
+    async def test_servers_listed_concurrently(self, make_converter):
+        """Test that startup waits for the slowest server, not for all of them."""
+        clients = {name: FakeClient([mcp_tool("search")], list_delay=0.2) for name in ("a", "b", "c")}
+        mcp = make_converter(clients)
+
+        started = time.monotonic()
+        await mcp.build_tools_from_mcp()
+
+        assert time.monotonic() - started < 0.4
+        assert [tool.tool_name for tool in mcp.toolkit] == ["a_search", "b_search", "c_search"]
+
+    async def test_slow_server_skipped(self, make_converter):
+        """Test that a server not answering in time does not block startup."""
+        clients = {"fast": FakeClient([mcp_tool("search")]), "slow": FakeClient([mcp_tool("ask")], list_delay=10)}
+        mcp = make_converter(clients, discovery_timeout=0.1)
+
+        await asyncio.wait_for(mcp.build_tools_from_mcp(), timeout=1)
+
+        assert [tool.tool_name for tool in mcp.toolkit] == ["fast_search"]
+
+    async def test_hanging_connect_does_not_block_startup(self, make_converter):
+        """Test that open and discovery in lifespan order give up on a server that never connects."""
+        clients = {"fast": FakeClient([mcp_tool("search")]), "hanging": FakeClient([mcp_tool("ask")], connect_delay=10)}
+        mcp = make_converter(clients, discovery_timeout=0.1)
+
+        started = time.monotonic()
+        await mcp.open()
+        await mcp.build_tools_from_mcp()
+
+        assert time.monotonic() - started < 0.5
+        assert [tool.tool_name for tool in mcp.toolkit] == ["fast_search"]
+        await asyncio.wait_for(mcp.close(), timeout=0.5)
+
+    async def test_warm_start_from_cache(self, make_converter, tmp_path):
+        """Test that cached catalog builds tools without waiting for the server."""
+        cache_path = str(tmp_path / "mcp_tools.sqlite")
+        cold = make_converter({"docs": FakeClient([mcp_tool("search", "Search docs")])}, tool_cache_path=cache_path)
+        await cold.build_tools_from_mcp()
+        client = FakeClient([mcp_tool("search", "Search docs")], list_delay=10, connect_delay=10)
+        mcp = make_converter({"docs": client}, tool_cache_path=cache_path)
+
+        await asyncio.wait_for(mcp.open(), timeout=0.1)
+        await asyncio.wait_for(mcp.build_tools_from_mcp(), timeout=0.1)
+
+        assert [(tool.tool_name, tool.description) for tool in mcp.toolkit] == [("search", "Search docs")]
+        assert len(mcp._background) == 1
+        await mcp.close()
+
+    async def test_cache_keyed_by_server_config(self, make_converter, tmp_path):
+        """Test that catalog cached for another server address is not used."""
+        cache_path = str(tmp_path / "mcp_tools.sqlite")
+        cold = make_converter({"docs": FakeClient([mcp_tool("search")])}, tool_cache_path=cache_path)
+        await cold.build_tools_from_mcp()
+        mcp = make_converter({"docs": FakeClient([mcp_tool("ask")])}, tool_cache_path=cache_path, url="https://other")
+
+        await mcp.build_tools_from_mcp()
+
+        assert [tool.tool_name for tool in mcp.toolkit] == ["ask"]
+
+    async def test_refresh_rebuilds_changed_tools(self, make_converter, schema_builds):
+        """Test that refresh updates the toolkit in place and keeps unchanged tools."""
+        client = FakeClient([mcp_tool("search"), mcp_tool("ask")])
+        mcp = make_converter({"docs": client})
+        await mcp.build_tools_from_mcp()
+        toolkit = mcp.toolkit
+        search = toolkit[0]
+
+        client.tools = [mcp_tool("search"), mcp_tool("ask", "Ask with context"), mcp_tool("get_docs")]
+        await mcp.refresh()
+
+        assert mcp.toolkit is toolkit
+        assert [tool.tool_name for tool in toolkit] == ["search", "ask", "get_docs"]
+        assert toolkit[0] is search
+        assert toolkit[1].description == "Ask with context"
+        assert schema_builds == ["Search", "Ask", "Ask", "GetDocs"]
+
+    async def test_periodic_refresh(self, make_converter):
+        """Test that tools added on the server appear without a restart."""
+        client = FakeClient([mcp_tool("search")])
+        mcp = make_converter({"docs": client}, tool_refresh_interval=0.01)
+        await mcp.open()
+        await mcp.build_tools_from_mcp()
+
+        client.tools = [mcp_tool("search"), mcp_tool("ask")]
+        await asyncio.sleep(0.05)
+
+        assert [tool.tool_name for tool in mcp.toolkit] == ["search", "ask"]
+        await mcp.close()
+        assert not mcp._background
+
+    async def test_build_twice_keeps_toolkit(self, make_converter):
+        """Test that repeated builds do not duplicate tools."""
+        mcp = make_converter({"docs": FakeClient([mcp_tool("search")])})
+
+        await mcp.build_tools_from_mcp()
+        await mcp.build_tools_from_mcp()
+
+        assert [tool.tool_name for tool in mcp.toolkit] == ["search"]
@@ -0,0 +1,135 @@
+"""Tests for MultiWebSearchTool.
+
+This module contains tests for concurrent execution of several queries
+and merging their results by URL.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from sgr_deep_research.core.models import ResearchContext, SourceData
+from sgr_deep_research.core.tools import MultiWebSearchTool, research_agent_tools
+
+
+def make_source(url: str, title: str = "Title") -> SourceData:
+    return SourceData(number=0, title=title, url=url, snippet=f"Snippet of {url}")
+
+
+@pytest.fixture(autouse=True)
+def patch_tavily_client():
+    """Allow tool construction without real client."""
+    with patch("sgr_deep_research.services.tavily_search.AsyncTavilyClient"):
+        yield
+
+
+def make_tool(
+    results: dict[str, list[SourceData]], delays: dict[str, float] | None = None
+) -> tuple[MultiWebSearchTool, list[str]]:
+    tool = MultiWebSearchTool(reasoning="Test", queries=list(results), max_results=3)
+    calls = []
+
+    async def search(query, max_results, include_raw_content):
+        calls.append(query)
+        await asyncio.sleep((delays or {}).get(query, 0))
+        return [source.model_copy() for source in results[query]]
+
+    tool._search_service.search = search
+    return tool, calls
+
+
+class TestMultiWebSearchTool:
+    """Tests for MultiWebSearchTool class."""
+
+    def test_registered_in_research_tools(self):
+        """Test that agents get the tool with research tools."""
+        assert MultiWebSearchTool in research_agent_tools
+        assert MultiWebSearchTool.parallel_safe is True
+
+    def test_queries_required(self):
+        """Test that at least one query is required."""
+        with pytest.raises(ValidationError):
+            MultiWebSearchTool(reasoning="Test", queries=[])
+
+    async def test_queries_run_concurrently(self):
+        """Test that slow queries overlap instead of running one by one."""
+        tool, calls = make_tool(
+            {"a": [make_source("https://a.com")], "b": [make_source("https://b.com")]},
+            delays={"a": 0.05, "b": 0.05},
+        )
+
+        started_at = asyncio.get_running_loop().time()
+        await tool(ResearchContext())
+
+        assert asyncio.get_running_loop().time() - started_at < 0.09
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_results_deduplicated_by_url(self):
+        """Test that URL found by several queries is listed and numbered
+        once."""
+        tool, _ = make_tool(
+            {
+                "first": [make_source("https://shared.com", "Shared"), make_source("https://a.com")],
+                "second": [make_source("https://shared.com", "Shared"), make_source("https://b.com")],
+            }
+        )
+        context = ResearchContext()
+
+        result = await tool(context)
+
+        assert list(context.sources) == ["https://shared.com", "https://a.com", "https://b.com"]
+        assert [source.number for source in context.sources.values()] == [1, 2, 3]
+        assert result.count("[1] Shared - https://shared.com") == 1
+        assert "Search Queries: first; second" in result
+
+    async def test_known_sources_keep_numbers(self):
+        """Test that sources from earlier searches keep their citation
+        numbers."""
+        context = ResearchContext()
+        known = make_source("https://known.com")
+        known.number = 1
+        context.sources[known.url] = known
+        tool, _ = make_tool({"q": [make_source("https://new.com"), make_source("https://known.com")]})
+
+        await tool(context)
+
+        assert context.sources["https://known.com"].number == 1
+        assert context.sources["https://new.com"].number == 2
+
+    async def test_each_query_recorded_and_counted(self):
+        """Test that every query is a search in context and counts to
+        limit."""
+        tool, _ = make_tool({"a": [make_source("https://a.com")], "b": [make_source("https://a.com")]})
+        context = ResearchContext()
+
+        await tool(context)
+
+        assert context.searches_used == 2
+        assert [search.query for search in context.searches] == ["a", "b"]
+        assert context.searches[1].citations[0].number == 1
+
+    async def test_queries_trimmed_to_searches_left(self):
+        """Test that one call does not run more searches than are left."""
+        tool, calls = make_tool({q: [make_source(f"https://{q}.com")] for q in ("a", "b", "c", "d")})
+        context = ResearchContext(max_searches=4, searches_used=2)
+
+        assert tool.fit_searches(context.searches_left)
+        result = await tool(context)
+
+        assert sorted(calls) == ["a", "b"]
+        assert context.searches_used == 4
+        assert "c.com" not in result
+
+    async def test_no_searches_left(self):
+        """Test that nothing is searched once the limit is reached."""
+        tool, calls = make_tool({"a": [make_source("https://a.com")]})
+        context = ResearchContext(max_searches=1, searches_used=1)
+
+        assert not tool.fit_searches(context.searches_left)
+        result = await tool(context)
+
+        assert calls == []
+        assert context.searches_used == 1
+        assert "limit" in result
@@ -0,0 +1,156 @@
+"""Tests for extracted pages cache.
+
+This module contains tests for compressed size-bounded SQLite storage,
+the tiered memory + disk cache and its use in ExtractPageContentTool.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sgr_deep_research.core.models import ResearchContext, SourceData
+from sgr_deep_research.core.tools.extract_page_content_tool import ExtractPageContentTool
+from sgr_deep_research.services.cache import MemoryCache, SQLiteCache, TieredCache
+from sgr_deep_research.services.tavily_search import TavilySearchService
+
+
+@pytest.fixture(autouse=True)
+def patch_tavily_client():
+    """Allow TavilySearchService construction without real client."""
+    with patch("sgr_deep_research.services.tavily_search.AsyncTavilyClient"):
+        yield
+
+
+class TestCompressedSQLiteCache:
+    """Tests for compression and size bound of SQLiteCache."""
+
+    async def test_compressed_roundtrip(self, tmp_path):
+        """Test that compressed values are decoded transparently."""
+        cache = SQLiteCache(path=str(tmp_path / "pages.sqlite"), ttl=60, max_entries=10, compress=True)
+        page = {"url": "https://example.com", "full_content": "текст " * 1000}
+
+        await cache.set("https://example.com", page)
+
+        assert await cache.get("https://example.com") == page
+
+    async def test_compression_reduces_size(self, tmp_path):
+        """Test that repetitive content is stored compressed."""
+        plain = SQLiteCache(path=str(tmp_path / "plain.sqlite"), ttl=60, max_entries=10)
+        compressed = SQLiteCache(path=str(tmp_path / "zip.sqlite"), ttl=60, max_entries=10, compress=True)
+        page = {"full_content": "lorem ipsum " * 1000}
+
+        await plain.set("key", page)
+        await compressed.set("key", page)
+
+        assert compressed.size_bytes() < plain.size_bytes() / 10
+
+    async def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        """Test that total stored size stays under the limit."""
+        cache = SQLiteCache(path=str(tmp_path / "pages.sqlite"), ttl=60, max_entries=100, max_size_bytes=2500)
+
+        for i in range(5):
+            with patch("sgr_deep_research.services.cache.time.time", return_value=float(i + 1)):
+                await cache.set(f"page{i}", "x" * 1000)
+
+        assert cache.size_bytes() <= 2500
+        with patch("sgr_deep_research.services.cache.time.time", return_value=10.0):
+            assert await cache.get("page0") is None
+            assert await cache.get("page4") is not None
+
+
+class TestTieredCache:
+    """Tests for TieredCache."""
+
+    async def test_persistent_hit_promoted_to_memory(self, tmp_path):
+        """Test that disk hits are copied into the memory tier."""
+        memory = MemoryCache(ttl=60, max_entries=10)
+        disk = SQLiteCache(path=str(tmp_path / "pages.sqlite"), ttl=60, max_entries=10)
+        await disk.set("key", "value")
+        cache = TieredCache(memory=memory, persistent=disk)
+
+        assert await cache.get("key") == "value"
+        assert len(memory) == 1
+        assert cache.stats.hits == 1
+
+    async def test_set_writes_both_tiers(self, tmp_path):
+        """Test that writes go to memory and disk."""
+        memory = MemoryCache(ttl=60, max_entries=10)
+        disk = SQLiteCache(path=str(tmp_path / "pages.sqlite"), ttl=60, max_entries=10)
+        cache = TieredCache(memory=memory, persistent=disk)
+
+        await cache.set("key", "value")
+
+        assert await memory.get("key") == "value"
+        assert await disk.get("key") == "value"
+
+    async def test_miss_in_both_tiers(self, tmp_path):
+        """Test that a miss in both tiers returns None."""
+        cache = TieredCache(
+            memory=MemoryCache(ttl=60, max_entries=10),
+            persistent=SQLiteCache(path=str(tmp_path / "pages.sqlite"), ttl=60, max_entries=10),
+        )
+
+        assert await cache.get("missing") is None
+        assert cache.stats.misses == 1
+
+
+class TestExtractPageContentToolCaching:
+    """Tests for page cache usage in ExtractPageContentTool."""
+
+    @staticmethod
+    def make_source(url: str, content: str = "Page content") -> SourceData:
+        return SourceData(number=0, title="page", url=url, full_content=content, char_count=len(content))
+
+    async def test_second_extract_served_from_cache(self):
+        """Test that already extracted URL is not sent to Tavily again."""
+        url = "https://example.com/page"
+        tool = ExtractPageContentTool(reasoning="Extract", urls=[url])
+        tool._search_service.extract = AsyncMock(return_value=[self.make_source(url)])
+        await tool(ResearchContext())
+
+        second_tool = ExtractPageContentTool(reasoning="Extract again", urls=[url])
+        second_tool._search_service.extract = AsyncMock()
+        result = await second_tool(ResearchContext())
+
+        second_tool._search_service.extract.assert_not_called()
+        assert "Page content" in result
+        assert "1 of 1 URLs served from cache" in result
+
+    async def test_only_misses_sent_in_single_batch(self):
+        """Test that cache misses are extracted in one batched call."""
+        cached_url = "https://example.com/cached"
+        await TavilySearchService.page_cache().set(cached_url, self.make_source(cached_url, "Cached").model_dump())
+        urls = [cached_url, "https://example.com/new1", "https://example.com/new2"]
+        tool = ExtractPageContentTool(reasoning="Extract", urls=urls)
+        tool._search_service.extract = AsyncMock(
+            return_value=[self.make_source(urls[1], "New 1"), self.make_source(urls[2], "New 2")]
+        )
+
+        context = ResearchContext()
+        result = await tool(context)
+
+        tool._search_service.extract.assert_called_once_with(urls=urls[1:])
+        assert set(context.sources) == set(urls)
+        assert "Cached" in result
+        assert "1 of 3 URLs served from cache" in result
+
+    async def test_failed_extraction_not_cached(self):
+        """Test that pages without content are retried next time."""
+        url = "https://example.com/broken"
+        tool = ExtractPageContentTool(reasoning="Extract", urls=[url])
+        tool._search_service.extract = AsyncMock(return_value=[self.make_source(url, "")])
+        await tool(ResearchContext())
+
+        assert await TavilySearchService.page_cache().get(url) is None
+
+    async def test_cache_disabled(self):
+        """Test that all URLs are extracted when caching is disabled."""
+        TavilySearchService._page_cache = None
+        url = "https://example.com/page"
+        tool = ExtractPageContentTool(reasoning="Extract", urls=[url])
+        tool._search_service.extract = AsyncMock(return_value=[self.make_source(url)])
+
+        result = await tool(ResearchContext())
+
+        tool._search_service.extract.assert_called_once_with(urls=[url])
+        assert "served from cache" not in result
@@ -0,0 +1,285 @@
+"""Tests for parallel execution of tool calls of one completion.
+
+This module contains tests for selecting independent tool calls,
+concurrent execution under the per-iteration cap and deterministic
+ordering of results in conversation.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sgr_deep_research.core import timing
+from sgr_deep_research.core.agents import ToolCallingAgent
+from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.models import AgentStatesEnum, SourceData
+from sgr_deep_research.core.timing import TimingHook
+from sgr_deep_research.core.tools import (
+    BaseTool,
+    ClarificationTool,
+    FinalAnswerTool,
+    MultiWebSearchTool,
+    WebSearchTool,
+)
+
+
+class SlowTool(BaseTool):
+    """Independent tool finishing after given delay."""
+
+    parallel_safe: ClassVar[bool] = True
+    running: ClassVar[int] = 0
+    max_running: ClassVar[int] = 0
+
+    label: str
+    delay: float = 0.0
+
+    async def __call__(self, context) -> str:
+        SlowTool.running += 1
+        SlowTool.max_running = max(SlowTool.max_running, SlowTool.running)
+        await asyncio.sleep(self.delay)
+        SlowTool.running -= 1
+        return f"result {self.label}"
+
+
+class SearchTool(SlowTool):
+    """Independent tool counting as given number of searches."""
+
+    searches: int = 1
+
+    def search_cost(self) -> int:
+        return self.searches
+
+
+class FailingTool(SlowTool):
+    """Independent tool raising after given delay."""
+
+    async def __call__(self, context) -> str:
+        await asyncio.sleep(self.delay)
+        raise RuntimeError(f"{self.label} failed")
+
+
+class ParallelAgent(BaseAgent):
+    """Agent selecting given tools once and finishing on the next
+    iteration."""
+
+    name = "parallel_agent"
+
+    def __init__(self, tools, **kwargs):
+        super().__init__(task="Test", **kwargs)
+        self.selected = tools
+
+    async def _reasoning_phase(self):
+        return None
+
+    async def _select_action_phase(self, reasoning):
+        if self._context.iteration > 1:
+            self._context.state = AgentStatesEnum.COMPLETED
+            return make_final_answer()
+        tools = self._select_parallel_batch(self.selected)
+        self._add_action_calls(tools)
+        return tools if len(tools) > 1 else tools[0]
+
+    async def _action_phase(self, tool):
+        return ""
+
+
+def make_final_answer() -> FinalAnswerTool:
+    return FinalAnswerTool(reasoning="r", completed_steps=["done"], answer="a", status="completed")
+
+
+def reset_slow_tool():
+    SlowTool.running = 0
+    SlowTool.max_running = 0
+
+
+class TestSelectParallelBatch:
+    """Tests for BaseAgent._select_parallel_batch."""
+
+    def test_independent_tools_kept_in_order(self):
+        """Test that all parallel-safe calls are kept in call order."""
+        agent = ParallelAgent([])
+        tools = [SlowTool(label="a"), SlowTool(label="b"), SlowTool(label="c")]
+
+        assert agent._select_parallel_batch(tools) == tools
+
+    def test_flow_tool_runs_alone(self):
+        """Test that a leading non-parallel tool drops the other calls."""
+        agent = ParallelAgent([])
+        final_answer = make_final_answer()
+
+        assert agent._select_parallel_batch([final_answer, SlowTool(label="a")]) == [final_answer]
+
+    def test_flow_tool_after_independent_tools_dropped(self):
+        """Test that non-parallel calls after independent ones are
+        skipped."""
+        agent = ParallelAgent([])
+        search = SlowTool(label="a")
+        clarification = ClarificationTool(reasoning="r", unclear_terms=["x"], assumptions=["y", "z"], questions=["q?"])
+
+        assert agent._select_parallel_batch([search, clarification]) == [search]
+
+    def test_searches_over_limit_skipped(self):
+        """Test that search calls are kept only if they fit in the searches
+        left."""
+        agent = ParallelAgent([])
+        agent.max_searches = 3
+        agent._context.searches_used = 1
+        first, second, third = SearchTool(label="a"), SearchTool(label="b", searches=3), SearchTool(label="c")
+        other = SlowTool(label="d")
+
+        assert agent._select_parallel_batch([first, second, third, other]) == [first, third, other]
+
+    def test_mixed_search_batch_within_limit(self):
+        """Test that a single search and a multi-query search together do
+        not exceed the limit."""
+        agent = ParallelAgent([])
+        agent.max_searches = 2
+        single, multi = SearchTool(label="a"), SearchTool(label="b", searches=3)
+
+        batch = agent._select_parallel_batch([single, multi])
+
+        assert batch == [single]
+        assert sum(tool.search_cost() for tool in batch) <= agent.max_searches
+
+    def test_first_search_kept_without_searches_left(self):
+        """Test that batch is never empty when the limit is reached."""
+        agent = ParallelAgent([])
+        agent.max_searches = 1
+        agent._context.searches_used = 1
+        first, second = SearchTool(label="a"), SearchTool(label="b")
+
+        assert agent._select_parallel_batch([first, second]) == [first]
+
+    def test_searches_unlimited_without_max_searches(self):
+        """Test that agents without a search limit keep all searches."""
+        agent = ParallelAgent([])
+        tools = [SearchTool(label=str(i)) for i in range(5)]
+
+        assert agent._select_parallel_batch(tools) == tools
+
+
+class TestParallelActionPhase:
+    """Tests for concurrent execution of selected tools."""
+
+    async def test_results_ordered_by_call_not_completion(self, tmp_path, monkeypatch):
+        """Test that conversation follows call order when later tools finish
+        first."""
+        monkeypatch.chdir(tmp_path)
+        reset_slow_tool()
+        agent = ParallelAgent([SlowTool(label="a", delay=0.03), SlowTool(label="b", delay=0.0)])
+
+        await agent.execute()
+
+        assistant, first, second = agent.conversation[1:4]
+        assert [call["id"] for call in assistant["tool_calls"]] == ["1-action", "1-action-1"]
+        assert (first["tool_call_id"], first["content"]) == ("1-action", "result a")
+        assert (second["tool_call_id"], second["content"]) == ("1-action-1", "result b")
+        assert agent.timings[0]["tool_name"] == "parallel"
+
+    async def test_each_tool_timed(self, tmp_path, monkeypatch):
+        """Test that tools of a batch reach timing hooks one by one."""
+        monkeypatch.chdir(tmp_path)
+        reset_slow_tool()
+        hook = MagicMock(spec=TimingHook)
+        timing.register_timing_hook(hook)
+        try:
+            agent = ParallelAgent([SlowTool(label="a"), SlowTool(label="b")])
+            await agent.execute()
+        finally:
+            timing.timing_hooks.remove(hook)
+
+        tools = [call.args[1] for call in hook.on_tool.call_args_list]
+        assert tools[:2] == ["slowtool", "slowtool"]
+        assert hook.on_phase.call_args_list[2].kwargs["tool_name"] == "parallel"
+
+    async def test_tools_run_concurrently(self, tmp_path, monkeypatch):
+        """Test that independent tools overlap in time."""
+        monkeypatch.chdir(tmp_path)
+        reset_slow_tool()
+        agent = ParallelAgent([SlowTool(label=str(i), delay=0.01) for i in range(3)])
+
+        await agent._parallel_action_phase(agent.selected)
+
+        assert SlowTool.max_running == 3
+
+    async def test_concurrency_cap(self):
+        """Test that max_parallel_tool_calls bounds running tools."""
+        reset_slow_tool()
+        agent = ParallelAgent([SlowTool(label=str(i), delay=0.01) for i in range(5)])
+        agent.max_parallel_tool_calls = 2
+
+        results = await agent._parallel_action_phase(agent.selected)
+
+        assert SlowTool.max_running == 2
+        assert results == [f"result {i}" for i in range(5)]
+
+    async def test_failed_tool_gets_error_result(self):
+        """Test that a raising tool does not drop results of the other
+        calls."""
+        reset_slow_tool()
+        tools = [FailingTool(label="a"), SlowTool(label="b", delay=0.01)]
+        agent = ParallelAgent(tools)
+        agent._add_action_calls(tools)
+
+        results = await agent._parallel_action_phase(tools)
+
+        assert results == ["Error: a failed", "result b"]
+        assert [message["tool_call_id"] for message in agent.conversation[-2:]] == ["0-action", "0-action-1"]
+        assert SlowTool.running == 0
+
+    async def test_mixed_search_batch_runs_within_limit(self):
+        """Test that a web search and a multi-query search of one batch run
+        no more searches than the limit."""
+        queries = []
+
+        async def search(query, max_results, include_raw_content):
+            queries.append(query)
+            return [SourceData(number=0, title=query, url=f"https://{query}.com", snippet=query)]
+
+        with patch("sgr_deep_research.services.tavily_search.AsyncTavilyClient"):
+            tools = [
+                WebSearchTool(reasoning="r", query="a"),
+                MultiWebSearchTool(reasoning="r", queries=["b", "c", "d"]),
+            ]
+        for tool in tools:
+            tool._search_service.search = search
+        agent = ParallelAgent([])
+        agent.max_searches = 2
+
+        batch = agent._select_parallel_batch(tools)
+        await agent._parallel_action_phase(batch)
+
+        assert batch == tools
+        assert tools[1].queries == ["b"]
+        assert sorted(queries) == ["a", "b"]
+        assert agent._context.searches_used == 2
+
+
+class TestToolCallingAgentParallelCalls:
+    """Tests for multiple tool calls returned to ToolCallingAgent."""
+
+    async def test_all_tool_calls_selected(self):
+        """Test that every independent tool call of the completion is
+        returned."""
+        tools = [SlowTool(label="a"), SlowTool(label="b")]
+        tool_calls = [SimpleNamespace(function=SimpleNamespace(parsed_arguments=tool)) for tool in tools]
+        completion = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(tool_calls=tool_calls))], usage=None
+        )
+        stream = MagicMock()
+        stream.__aiter__.return_value = iter([])
+        stream.get_final_completion = AsyncMock(return_value=completion)
+        manager = MagicMock()
+        manager.__aenter__ = AsyncMock(return_value=stream)
+        manager.__aexit__ = AsyncMock(return_value=None)
+        client = MagicMock()
+        client.chat.completions.stream.return_value = manager
+        agent = ToolCallingAgent(task="Test", openai_client=client)
+        agent._prepare_tools = AsyncMock(return_value=[])
+        agent._context.iteration = 1
+
+        selected = await agent._select_action_phase()
+
+        assert selected == tools
+        assert len(agent.conversation[-1]["tool_calls"]) == 2
@@ -0,0 +1,109 @@
+"""Tests for request prefix stability.
+
+This module contains tests asserting that system prompt and tool
+schemas sent to the LLM are byte-identical between iterations, so
+provider side prompt caching can reuse them.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sgr_deep_research.core.agents import SGRToolCallingAgent
+from sgr_deep_research.core.prompts import PromptLoader
+from sgr_deep_research.core.tools import (
+    ClarificationTool,
+    CreateReportTool,
+    FinalAnswerTool,
+    ReasoningTool,
+    WebSearchTool,
+)
+
+
+def fake_function_tool(model, name, description):
+    return {"type": "function", "function": {"name": name, "parameters": model.model_json_schema()}}
+
+
+def make_client(iterations: int) -> MagicMock:
+    """Client answering reasoning and selection calls of given iterations."""
+    reasoning = ReasoningTool(
+        reasoning_steps=["step"],
+        current_situation="situation",
+        plan_status="plan",
+        remaining_steps=["next"],
+        task_completed=False,
+    )
+    action = ClarificationTool(reasoning="r", unclear_terms=["x"], assumptions=["a", "b"], questions=["q?"])
+    managers = []
+    for tool in [reasoning, action] * iterations:
+        message = SimpleNamespace(tool_calls=[SimpleNamespace(function=SimpleNamespace(parsed_arguments=tool))])
+        stream = MagicMock()
+        stream.__aiter__.return_value = iter([])
+        stream.get_final_completion = AsyncMock(
+            return_value=SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+        )
+        manager = MagicMock()
+        manager.__aenter__ = AsyncMock(return_value=stream)
+        manager.__aexit__ = AsyncMock(return_value=None)
+        managers.append(manager)
+    client = MagicMock()
+    client.chat.completions.stream.side_effect = managers
+    return client
+
+
+@pytest.fixture(autouse=True)
+def patch_function_tool():
+    with patch("sgr_deep_research.core.tool_schemas.pydantic_function_tool", fake_function_tool):
+        yield
+
+
+class TestPromptPrefixStability:
+    """Tests for deterministic system prompt and tools."""
+
+    def test_system_prompt_memoized(self):
+        """Test that the same toolkit renders the very same prompt
+        object."""
+        tools = [ReasoningTool, WebSearchTool, FinalAnswerTool]
+
+        assert PromptLoader.get_system_prompt(tools) is PromptLoader.get_system_prompt(list(tools))
+
+    def test_tools_follow_toolkit_order(self):
+        """Test that tool order does not depend on set iteration order."""
+        agent = SGRToolCallingAgent(task="Test")
+        expected = [tool for tool in agent.toolkit if tool in {WebSearchTool, FinalAnswerTool, ReasoningTool}]
+
+        for tools in ({WebSearchTool, FinalAnswerTool, ReasoningTool}, {ReasoningTool, FinalAnswerTool, WebSearchTool}):
+            assert agent._ordered_tools(tools) == expected
+
+    def test_tools_outside_toolkit_last(self):
+        """Test that fallback tools missing in toolkit are ordered by
+        name."""
+        agent = SGRToolCallingAgent(task="Test")
+        agent.toolkit = [ReasoningTool]
+
+        assert agent._ordered_tools({FinalAnswerTool, CreateReportTool, ReasoningTool}) == [
+            ReasoningTool,
+            CreateReportTool,
+            FinalAnswerTool,
+        ]
+
+    async def test_request_prefix_identical_across_iterations(self):
+        """Test that system prompt and tools are byte-identical in every
+        call."""
+        client = make_client(iterations=3)
+        agent = SGRToolCallingAgent(task="Test", openai_client=client)
+        agent.toolkit = [ReasoningTool, ClarificationTool, WebSearchTool, CreateReportTool, FinalAnswerTool]
+
+        for iteration in range(1, 4):
+            agent._context.iteration = iteration
+            reasoning = await agent._reasoning_phase()
+            await agent._select_action_phase(reasoning)
+
+        calls = client.chat.completions.stream.call_args_list
+        assert len(calls) == 6
+        prefixes = {
+            json.dumps([call.kwargs["messages"][0], call.kwargs["tools"]], ensure_ascii=False) for call in calls
+        }
+        assert len(prefixes) == 1
@@ -0,0 +1,152 @@
+"""Tests for outbound calls rate limiting.
+
+This module contains tests for TokenBucket, RateLimiter and their use
+before LLM completion streams and Tavily calls.
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sgr_deep_research.core.agents import SGRAgent
+from sgr_deep_research.services import rate_limiter
+from sgr_deep_research.services.rate_limiter import RateLimiter, TokenBucket, estimate_tokens
+from sgr_deep_research.services.tavily_search import TavilySearchService
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    async def test_acquire_within_capacity_does_not_wait(self):
+        """Test that a full bucket grants requests immediately."""
+        bucket = TokenBucket(per_minute=60)
+
+        waited = [await bucket.acquire() for _ in range(60)]
+
+        assert sum(waited) == 0
+        assert bucket.available < 1
+
+    async def test_acquire_waits_for_refill(self):
+        """Test that an empty bucket delays the caller until refill."""
+        bucket = TokenBucket(per_minute=600)
+        await bucket.acquire(600)
+
+        started = time.monotonic()
+        waited = await bucket.acquire(1)
+
+        assert waited > 0
+        assert time.monotonic() - started >= 0.04
+
+    async def test_oversized_request_capped_to_capacity(self):
+        """Test that a request larger than the bucket still passes."""
+        bucket = TokenBucket(per_minute=100)
+
+        assert await bucket.acquire(1000) == 0
+
+    async def test_adjust_returns_and_charges_tokens(self):
+        """Test that adjust refunds unused tokens and accounts overuse."""
+        bucket = TokenBucket(per_minute=600)
+        await bucket.acquire(500)
+
+        bucket.adjust(400)
+        assert bucket.available == pytest.approx(500, abs=1)
+
+        bucket.adjust(-700)
+        assert bucket.available < 0
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    async def test_acquire_consumes_request_and_tokens(self):
+        """Test that one request and estimated tokens are reserved."""
+        limiter = RateLimiter("test", requests_per_minute=10, tokens_per_minute=1000)
+
+        await limiter.acquire(tokens=300)
+
+        assert limiter.requests.available == pytest.approx(9, abs=0.01)
+        assert limiter.tokens.available == pytest.approx(700, abs=1)
+        assert limiter.stats.acquired == 1
+        assert limiter.stats.throttled == 0
+
+    async def test_throttled_calls_counted(self):
+        """Test that waiting calls update throttling stats."""
+        limiter = RateLimiter("test", requests_per_minute=600)
+        await limiter.requests.acquire(600)
+
+        await limiter.acquire()
+
+        assert limiter.stats.throttled == 1
+        assert limiter.stats.wait_time_total > 0
+
+    async def test_reconcile_refunds_overestimate(self):
+        """Test that reconcile returns tokens not actually used."""
+        limiter = RateLimiter("test", tokens_per_minute=1000)
+        await limiter.acquire(tokens=800)
+
+        limiter.reconcile(estimated_tokens=800, actual_tokens=300)
+
+        assert limiter.tokens.available == pytest.approx(700, abs=1)
+
+    def test_for_provider_disabled_by_default(self):
+        """Test that zero quotas disable limiting."""
+        assert RateLimiter.for_provider("openai") is None
+        assert RateLimiter.for_provider("tavily") is None
+
+    def test_for_provider_shared_instance(self):
+        """Test that configured limiter is shared per provider."""
+        config = SimpleNamespace(openai=SimpleNamespace(requests_per_minute=100, tokens_per_minute=0))
+        with patch("sgr_deep_research.services.rate_limiter.get_config", return_value=config):
+            limiter = RateLimiter.for_provider("openai")
+
+        assert limiter is not None
+        assert limiter.tokens is None
+        assert RateLimiter.for_provider("openai") is limiter
+
+    def test_estimate_tokens(self):
+        """Test estimate covers prompt characters and completion budget."""
+        messages = [{"role": "user", "content": "x" * 400}]
+
+        assert 100 + 500 <= estimate_tokens(messages, max_tokens=500) < 150 + 500
+
+
+class TestRateLimiterIntegration:
+    """Tests for limiter calls in agents and Tavily service."""
+
+    async def test_stream_completion_acquires_and_reconciles(self, monkeypatch):
+        """Test that LLM stream waits for quota and reports real usage."""
+        # frozen clock, so no tokens are refilled while the test runs
+        monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=lambda: 1000.0))
+        limiter = RateLimiter("openai", requests_per_minute=100, tokens_per_minute=100000)
+        RateLimiter._limiters["openai"] = limiter
+        completion = SimpleNamespace(usage=SimpleNamespace(prompt_tokens=30, completion_tokens=20, total_tokens=50))
+        stream = MagicMock()
+        stream.get_final_completion = AsyncMock(return_value=completion)
+        stream_manager = MagicMock()
+        stream_manager.__aenter__ = AsyncMock(return_value=stream)
+        stream_manager.__aexit__ = AsyncMock(return_value=None)
+        client = MagicMock()
+        client.chat.completions.stream.return_value = stream_manager
+        agent = SGRAgent(task="Test", openai_client=client)
+
+        async with agent._stream_completion(messages=[{"role": "user", "content": "hi"}], max_tokens=1000):
+            pass
+
+        assert limiter.stats.acquired == 1
+        assert limiter.tokens.available == 100000 - 50
+
+    async def test_tavily_search_acquires_quota(self):
+        """Test that Tavily calls go through the tavily limiter."""
+        limiter = RateLimiter("tavily", requests_per_minute=100)
+        RateLimiter._limiters["tavily"] = limiter
+        with patch("sgr_deep_research.services.tavily_search.AsyncTavilyClient"):
+            service = TavilySearchService()
+        service._client.search = AsyncMock(return_value={"results": []})
+        service._client.extract = AsyncMock(return_value={"results": []})
+
+        await service.search("query")
+        await service.extract(["https://example.com"])
+
+        assert limiter.stats.acquired == 2
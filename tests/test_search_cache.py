@@ -0,0 +1,212 @@
+"""Tests for search results cache.
+
+This module contains tests for in-memory and SQLite cache backends and
+their integration into TavilySearchService.search.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sgr_deep_research.services.cache import MemoryCache, SQLiteCache, build_cache
+from sgr_deep_research.services.tavily_search import TavilySearchService
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache backend."""
+
+    async def test_get_missing_key(self):
+        """Test that a missing key returns None and counts a miss."""
+        cache = MemoryCache(ttl=60, max_entries=10)
+
+        assert await cache.get("missing") is None
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 0
+
+    async def test_set_and_get(self):
+        """Test that stored value is returned and counts a hit."""
+        cache = MemoryCache(ttl=60, max_entries=10)
+
+        await cache.set("key", [{"url": "https://example.com"}])
+
+        assert await cache.get("key") == [{"url": "https://example.com"}]
+        assert cache.stats.hits == 1
+
+    async def test_lru_eviction(self):
+        """Test that least recently used entry is evicted first."""
+        cache = MemoryCache(ttl=60, max_entries=2)
+
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+
+    async def test_ttl_expiration(self):
+        """Test that expired entries are not returned."""
+        cache = MemoryCache(ttl=10, max_entries=10)
+
+        with patch("sgr_deep_research.services.cache.time.monotonic", return_value=100.0):
+            await cache.set("key", "value")
+        with patch("sgr_deep_research.services.cache.time.monotonic", return_value=111.0):
+            assert await cache.get("key") is None
+
+        assert len(cache) == 0
+
+    async def test_hit_rate(self):
+        """Test hit rate calculation."""
+        cache = MemoryCache(ttl=60, max_entries=10)
+        assert cache.stats.hit_rate == 0.0
+
+        await cache.set("key", "value")
+        await cache.get("key")
+        await cache.get("other")
+
+        assert cache.stats.hit_rate == 0.5
+
+
+class TestSQLiteCache:
+    """Tests for SQLiteCache backend."""
+
+    async def test_set_and_get(self, tmp_path):
+        """Test that stored value is returned."""
+        cache = SQLiteCache(path=str(tmp_path / "cache.sqlite"), ttl=60, max_entries=10)
+
+        await cache.set("key", {"title": "Тест"})
+
+        assert await cache.get("key") == {"title": "Тест"}
+        assert cache.stats.hits == 1
+
+    async def test_persists_between_instances(self, tmp_path):
+        """Test that values survive reopening the database."""
+        path = str(tmp_path / "cache.sqlite")
+        cache = SQLiteCache(path=path, ttl=60, max_entries=10)
+        await cache.set("key", [1, 2, 3])
+        cache.close()
+
+        reopened = SQLiteCache(path=path, ttl=60, max_entries=10)
+
+        assert await reopened.get("key") == [1, 2, 3]
+
+    async def test_ttl_expiration(self, tmp_path):
+        """Test that expired entries are not returned."""
+        cache = SQLiteCache(path=str(tmp_path / "cache.sqlite"), ttl=10, max_entries=10)
+
+        with patch("sgr_deep_research.services.cache.time.time", return_value=100.0):
+            await cache.set("key", "value")
+        with patch("sgr_deep_research.services.cache.time.time", return_value=111.0):
+            assert await cache.get("key") is None
+
+    async def test_max_entries_eviction(self, tmp_path):
+        """Test that oldest accessed entries are evicted over the limit."""
+        cache = SQLiteCache(path=str(tmp_path / "cache.sqlite"), ttl=60, max_entries=2)
+
+        with patch("sgr_deep_research.services.cache.time.time", return_value=1.0):
+            await cache.set("a", 1)
+        with patch("sgr_deep_research.services.cache.time.time", return_value=2.0):
+            await cache.set("b", 2)
+        with patch("sgr_deep_research.services.cache.time.time", return_value=3.0):
+            await cache.set("c", 3)
+
+        with patch("sgr_deep_research.services.cache.time.time", return_value=4.0):
+            assert await cache.get("a") is None
+            assert await cache.get("c") == 3
+
+    async def test_clear(self, tmp_path):
+        """Test that clear removes all entries."""
+        cache = SQLiteCache(path=str(tmp_path / "cache.sqlite"), ttl=60, max_entries=10)
+        await cache.set("key", "value")
+
+        await cache.clear()
+
+        assert await cache.get("key") is None
+
+
+class TestBuildCache:
+    """Tests for build_cache factory."""
+
+    def test_build_memory(self):
+        assert isinstance(build_cache("memory", ttl=1, max_entries=1), MemoryCache)
+
+    def test_build_sqlite(self, tmp_path):
+        cache = build_cache("sqlite", ttl=1, max_entries=1, path=str(tmp_path / "c.sqlite"))
+        assert isinstance(cache, SQLiteCache)
+
+    def test_build_disabled(self):
+        assert build_cache("none", ttl=1, max_entries=1) is None
+
+
+class TestTavilySearchCaching:
+    """Tests for search results caching in TavilySearchService."""
+
+    @pytest.fixture
+    def service(self):
+        with patch("sgr_deep_research.services.tavily_search.AsyncTavilyClient"):
+            service = TavilySearchService()
+        service._client.search = AsyncMock(
+            return_value={"results": [{"title": "Title", "url": "https://example.com", "content": "Snippet"}]}
+        )
+        TavilySearchService._search_cache = MemoryCache(ttl=60, max_entries=10)
+        TavilySearchService._search_cache_initialized = True
+        return service
+
+    def test_cache_key_normalization(self):
+        """Test that query case and whitespace do not affect cache key."""
+        key1 = TavilySearchService._search_cache_key("  Python   Asyncio ", 5, False)
+        key2 = TavilySearchService._search_cache_key("python asyncio", 5, False)
+
+        assert key1 == key2
+
+    def test_cache_key_includes_parameters(self):
+        """Test that max_results and include_raw_content are part of the
+        key."""
+        base = TavilySearchService._search_cache_key("query", 5, False)
+
+        assert base != TavilySearchService._search_cache_key("query", 10, False)
+        assert base != TavilySearchService._search_cache_key("query", 5, True)
+
+    async def test_repeated_search_served_from_cache(self, service):
+        """Test that repeated normalized query does not call Tavily
+        again."""
+        first = await service.search("Test Query", max_results=5, include_raw_content=False)
+        second = await service.search("test   query", max_results=5, include_raw_content=False)
+
+        service._client.search.assert_called_once()
+        assert [s.url for s in first] == [s.url for s in second]
+        assert TavilySearchService.search_cache().stats.hits == 1
+        assert TavilySearchService.search_cache().stats.misses == 1
+
+    async def test_cache_counters_collected(self, service):
+        """Test that hits and misses are exported as metrics."""
+        await service.search("query", max_results=5)
+        await service.search("query", max_results=5)
+
+        metrics = TavilySearchService.collect_metrics()
+
+        assert metrics["sgr_search_cache_hits_total"][1] == 1
+        assert metrics["sgr_search_cache_misses_total"][1] == 1
+
+    async def test_cached_sources_are_independent_copies(self, service):
+        """Test that mutating returned sources does not corrupt the
+        cache."""
+        first = await service.search("query", max_results=5)
+        first[0].number = 42
+        first[0].full_content = "mutated"
+
+        second = await service.search("query", max_results=5)
+
+        assert second[0].number == 0
+        assert second[0].full_content == ""
+
+    async def test_cache_disabled(self, service):
+        """Test that every search hits Tavily when caching is disabled."""
+        TavilySearchService._search_cache = None
+
+        await service.search("query", max_results=5)
+        await service.search("query", max_results=5)
+
+        assert service._client.search.call_count == 2
@@ -155,6 +155,7 @@ class TestScrapingConfig:
         assert config.enabled is False
         assert config.max_pages == 5
         assert config.content_limit == 1500
+        assert config.cache_backend == "memory"
 
     def test_scraping_config_max_pages_validation(self):
         """Test max_pages validation - must be positive."""
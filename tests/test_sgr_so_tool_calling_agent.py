@@ -112,8 +112,8 @@ class TestSGRSOToolCallingAgentReasoningPhase:
 class TestSGRSOToolCallingAgentConfigIntegration:
     """Tests for SGRSOToolCallingAgent configuration integration."""
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_config_integration_openai_settings(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_config_integration_openai_settings(self, mock_pool):
         """Test that OpenAI configuration is properly integrated."""
         # Agents use real config from config.yaml
         # Just verify agent can be created successfully
@@ -122,11 +122,11 @@ class TestSGRSOToolCallingAgentConfigIntegration:
         assert agent.task == "Test config integration"
         assert agent.name == "sgr_so_tool_calling_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
 
-    @patch("sgr_deep_research.core.base_agent.AsyncOpenAI")
-    def test_config_integration_no_proxy(self, mock_openai):
+    @patch("sgr_deep_research.core.base_agent.LLMClientPool")
+    def test_config_integration_no_proxy(self, mock_pool):
         """Test that agent works with any proxy configuration."""
         # Agents use real config from config.yaml
         # Just verify agent can be created successfully
@@ -135,5 +135,5 @@ class TestSGRSOToolCallingAgentConfigIntegration:
         assert agent.task == "Test no proxy"
         assert agent.name == "sgr_so_tool_calling_agent"
 
-        # Verify OpenAI client was initialized
-        assert mock_openai.called
+        # Verify OpenAI client comes from the shared pool
+        assert agent.openai_client is mock_pool.get_client.return_value
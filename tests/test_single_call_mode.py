@@ -0,0 +1,140 @@
+"""Tests for single-call mode of SGRToolCallingAgent.
+
+This module contains tests for requesting reasoning and action as
+parallel tool calls of one completion and for the fallback to the
+two-call flow.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sgr_deep_research.core.agents import SGRToolCallingAgent
+from sgr_deep_research.core.tools import FinalAnswerTool, ReasoningTool, WebSearchTool
+
+
+def make_reasoning() -> ReasoningTool:
+    return ReasoningTool(
+        reasoning_steps=["Need data"],
+        current_situation="Starting",
+        plan_status="On track",
+        remaining_steps=["Search the web"],
+        task_completed=False,
+    )
+
+
+def make_completion(*tools) -> SimpleNamespace:
+    tool_calls = [SimpleNamespace(function=SimpleNamespace(parsed_arguments=tool)) for tool in tools]
+    message = SimpleNamespace(tool_calls=tool_calls, content=None)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def make_client(*completions) -> MagicMock:
+    """OpenAI client mock returning given completions one per stream."""
+    client = MagicMock()
+    managers = []
+    for completion in completions:
+        stream = MagicMock()
+        stream.__aiter__.return_value = iter([])
+        stream.get_final_completion = AsyncMock(return_value=completion)
+        manager = MagicMock()
+        manager.__aenter__ = AsyncMock(return_value=stream)
+        manager.__aexit__ = AsyncMock(return_value=None)
+        managers.append(manager)
+    client.chat.completions.stream.side_effect = managers
+    return client
+
+
+@pytest.fixture(autouse=True)
+def patch_tavily_client():
+    """Allow WebSearchTool construction without real client."""
+    with patch("sgr_deep_research.services.tavily_search.AsyncTavilyClient"):
+        yield
+
+
+@pytest.fixture
+def make_agent():
+    def _make_agent(client, single_call=True):
+        agent = SGRToolCallingAgent(task="Test", openai_client=client, single_call=single_call)
+        agent._prepare_tools = AsyncMock(return_value=[])
+        return agent
+
+    return _make_agent
+
+
+class TestSingleCallMode:
+    """Tests for single-call reasoning and action selection."""
+
+    def test_disabled_by_default(self):
+        """Test that single-call mode is opt-in."""
+        assert SGRToolCallingAgent(task="Test").single_call is False
+
+    async def test_one_completion_per_iteration(self, make_agent):
+        """Test that reasoning and action come from one LLM call."""
+        search = WebSearchTool(reasoning="Need data", query="test query")
+        client = make_client(make_completion(make_reasoning(), search))
+        agent = make_agent(client)
+
+        reasoning = await agent._reasoning_phase()
+        action = await agent._select_action_phase(reasoning)
+
+        assert client.chat.completions.stream.call_count == 1
+        kwargs = client.chat.completions.stream.call_args.kwargs
+        assert kwargs["parallel_tool_calls"] is True
+        assert kwargs["tool_choice"] == "required"
+        assert isinstance(reasoning, ReasoningTool)
+        assert action is search
+
+    async def test_conversation_has_both_tool_calls(self, make_agent):
+        """Test that one assistant message carries reasoning and action
+        calls."""
+        client = make_client(make_completion(make_reasoning(), WebSearchTool(reasoning="r", query="q")))
+        agent = make_agent(client)
+
+        reasoning = await agent._reasoning_phase()
+        await agent._select_action_phase(reasoning)
+
+        assistant, reasoning_result = agent.conversation
+        assert [call["id"] for call in assistant["tool_calls"]] == ["0-reasoning", "0-action"]
+        assert reasoning_result["tool_call_id"] == "0-reasoning"
+
+    async def test_missing_action_falls_back_to_selection_call(self, make_agent):
+        """Test that reasoning-only response triggers separate selection
+        call."""
+        final_answer = FinalAnswerTool(reasoning="Done", completed_steps=["Answered"], answer="42", status="completed")
+        client = make_client(make_completion(make_reasoning()), make_completion(final_answer))
+        agent = make_agent(client)
+
+        reasoning = await agent._reasoning_phase()
+        action = await agent._select_action_phase(reasoning)
+
+        assert client.chat.completions.stream.call_count == 2
+        assert action is final_answer
+
+    async def test_missing_reasoning_falls_back_to_two_calls(self, make_agent):
+        """Test that response without reasoning falls back to forced
+        reasoning call."""
+        reasoning = make_reasoning()
+        client = make_client(
+            make_completion(WebSearchTool(reasoning="r", query="q")),
+            make_completion(reasoning),
+        )
+        agent = make_agent(client)
+
+        result = await agent._reasoning_phase()
+
+        assert result is reasoning
+        assert client.chat.completions.stream.call_count == 2
+        assert agent._pending_actions == []
+
+    async def test_two_call_mode_unchanged(self, make_agent):
+        """Test that default mode forces ReasoningTool in a separate call."""
+        client = make_client(make_completion(make_reasoning()))
+        agent = make_agent(client, single_call=False)
+
+        await agent._reasoning_phase()
+
+        kwargs = client.chat.completions.stream.call_args.kwargs
+        assert kwargs["tool_choice"]["function"]["name"] == ReasoningTool.tool_name
+        assert "parallel_tool_calls" not in kwargs
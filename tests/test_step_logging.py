@@ -0,0 +1,135 @@
+"""Tests for cheap agent step logging.
+
+This module contains tests for lazily formatted step messages and for
+payloads truncated before they are kept in the agent log.
+"""
+
+import logging
+
+import pytest
+
+from sgr_deep_research.core.agents import SGRAgent
+from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.step_logging import LazyMessage, truncate
+from sgr_deep_research.core.tools import FinalAnswerTool, ReasoningTool
+
+
+def make_reasoning() -> ReasoningTool:
+    return ReasoningTool(
+        reasoning_steps=["Step 1", "Step 2"],
+        current_situation="Testing",
+        plan_status="Good",
+        enough_data=False,
+        remaining_steps=["Next"],
+        task_completed=False,
+    )
+
+
+class CountingHandler(logging.Handler):
+    def __init__(self, level: int):
+        super().__init__(level)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def agent():
+    agent = SGRAgent(task="Test")
+    agent.log_field_max_chars = 100
+    yield agent
+    agent.logger.handlers.clear()
+
+
+class TestLazyMessage:
+    """Tests for deferred formatting of step messages."""
+
+    @pytest.mark.parametrize(
+        "logger_level, handler_level", [(logging.WARNING, logging.INFO), (logging.INFO, logging.WARNING)]
+    )
+    def test_not_formatted_when_discarded(self, agent, monkeypatch, logger_level, handler_level):
+        """Test that step messages are not built for discarded records."""
+        handler = CountingHandler(handler_level)
+        agent.logger.addHandler(handler)
+        agent.logger.setLevel(logger_level)
+        monkeypatch.setattr(agent.logger, "propagate", False)
+        formatted = []
+        format_reasoning = agent._format_reasoning
+        monkeypatch.setattr(agent, "_format_reasoning", lambda result: formatted.append(1) or format_reasoning(result))
+
+        agent._log_reasoning(make_reasoning())
+
+        assert formatted == []
+        assert handler.messages == []
+        assert len(agent.log) == 1
+
+    def test_formatted_when_emitted(self, agent):
+        """Test that emitted records carry the full step message."""
+        handler = CountingHandler(logging.INFO)
+        agent.logger.addHandler(handler)
+        agent.logger.setLevel(logging.INFO)
+
+        agent._log_tool_execution(make_reasoning(), "Tool result")
+
+        assert "TOOL EXECUTION DEBUG" in handler.messages[0]
+        assert "Tool result" in handler.messages[0]
+
+    def test_str_calls_format(self):
+        """Test that message is built on str()."""
+        assert str(LazyMessage(lambda: "built")) == "built"
+
+
+class TestTruncate:
+    """Tests for per-field payload cap."""
+
+    def test_long_strings_cut_in_nested_values(self):
+        """Test that strings are cut at any depth."""
+        value = {"text": "a" * 10, "items": ["b" * 3, {"deep": "c" * 10}], "n": 5}
+
+        assert truncate(value, 4) == {
+            "text": "aaaa... [+6 chars]",
+            "items": ["bbb", {"deep": "cccc... [+6 chars]"}],
+            "n": 5,
+        }
+
+    def test_zero_keeps_values(self):
+        """Test that cap of zero returns values unchanged."""
+        value = {"text": "a" * 10}
+
+        assert truncate(value, 0) is value
+
+
+class TestAgentLogPayloads:
+    """Tests for truncated payloads in the agent log."""
+
+    def test_tool_result_truncated(self, agent):
+        """Test that long page texts are not kept whole."""
+        tool = FinalAnswerTool(
+            reasoning="r", completed_steps=["Read page"], answer="Done", status=AgentStatesEnum.COMPLETED
+        )
+        page = "page text " * 10_000
+
+        agent._log_tool_execution(tool, page)
+
+        entry = agent.log[0]
+        assert len(entry["agent_tool_execution_result"]) < 200
+        assert entry["agent_tool_execution_result"].startswith(page[:100])
+        assert entry["agent_tool_context"]["completed_steps"] == ["Read page"]
+
+    def test_reasoning_truncated(self, agent):
+        """Test that reasoning fields are capped too."""
+        reasoning = make_reasoning()
+        reasoning.current_situation = "x" * 1000
+
+        agent._log_reasoning(reasoning)
+
+        assert agent.log[0]["agent_reasoning"]["current_situation"] == "x" * 100 + "... [+900 chars]"
+
+    def test_cap_disabled(self, agent):
+        """Test that full results are kept with cap of zero."""
+        agent.log_field_max_chars = 0
+
+        agent._log_tool_execution(make_reasoning(), "r" * 5000)
+
+        assert agent.log[0]["agent_tool_execution_result"] == "r" * 5000
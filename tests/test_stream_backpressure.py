@@ -0,0 +1,237 @@
+"""Tests for bounded client stream queues.
+
+This module contains tests for queue policies applied while a client
+reads the stream, for detaching the generator on client disconnect and
+for stream queue metrics.
+"""
+
+import asyncio
+
+import pytest
+
+from sgr_deep_research.core.stream import StreamingGenerator
+
+
+async def attach(generator: StreamingGenerator):
+    """Start client stream and read its first chunk, the client then stops
+    reading."""
+    stream = generator.stream()
+    first = await anext(stream)
+    return stream, first
+
+
+class TestBlockPolicy:
+    """Tests for producer waiting on a full queue."""
+
+    async def test_unbounded_without_consumer(self):
+        """Test that chunks are buffered before the client attaches."""
+        generator = StreamingGenerator(max_queue_size=2)
+
+        for i in range(10):
+            generator.add(f"chunk {i}")
+        await asyncio.wait_for(generator.drain(), timeout=1)
+
+        assert generator.queue.qsize() == 10
+
+    async def test_drain_waits_for_client(self):
+        """Test that drain blocks until the client reads the queue."""
+        generator = StreamingGenerator(max_queue_size=2)
+        generator.add("first")
+        stream, _ = await attach(generator)
+        generator.add("a")
+        generator.add("b")
+
+        drain = asyncio.create_task(generator.drain())
+        await asyncio.sleep(0.01)
+        assert not drain.done()
+
+        assert await anext(stream) == "a"
+        await asyncio.wait_for(drain, timeout=1)
+        await stream.aclose()
+
+    async def test_unbounded_queue_never_blocks(self):
+        """Test that max_queue_size of zero keeps the queue unbounded."""
+        generator = StreamingGenerator()
+        generator.add("first")
+        stream, _ = await attach(generator)
+
+        for i in range(100):
+            generator.add(f"chunk {i}")
+        await asyncio.wait_for(generator.drain(), timeout=1)
+
+        assert generator.queue.qsize() == 100
+        await stream.aclose()
+
+
+class TestDropIntermediatePolicy:
+    """Tests for dropping LLM deltas on a full queue."""
+
+    async def test_droppable_chunks_dropped(self):
+        """Test that deltas are dropped while other chunks are kept."""
+        generator = StreamingGenerator(max_queue_size=2, policy="drop_intermediate")
+        generator.add("first")
+        stream, _ = await attach(generator)
+
+        generator.add("delta 1", droppable=True)
+        generator.add("delta 2", droppable=True)
+        generator.add("delta 3", droppable=True)
+        generator.add("tool call")
+
+        assert list(generator.queue._queue) == ["delta 1", "delta 2", "tool call"]
+        assert generator.dropped == 1
+        await stream.aclose()
+
+
+class TestCoalescePolicy:
+    """Tests for merging chunks on a full queue."""
+
+    async def test_overflow_merged_into_pending_tail(self):
+        """Test that overflowing chunks are merged into one chunk queued
+        after the others."""
+        generator = StreamingGenerator(max_queue_size=2, policy="coalesce")
+        generator.add("first")
+        stream, _ = await attach(generator)
+
+        for data in ["a", "b", "c", "d"]:
+            generator.add(data)
+        assert generator.queue.qsize() == 2
+        generator.finish()
+
+        assert [chunk async for chunk in stream] == ["a", "b", "cd"]
+        assert generator.dropped == 0
+
+    async def test_pending_tail_queued_when_client_reads(self):
+        """Test that merged chunk moves to the queue once there is room,
+        ahead of later chunks."""
+        generator = StreamingGenerator(max_queue_size=1, policy="coalesce")
+        generator.add("first")
+        stream, _ = await attach(generator)
+        generator.add("a")
+        generator.add("b")
+        generator.add("c")
+
+        assert await stream.__anext__() == "a"
+        generator.add("d")
+        generator.finish()
+
+        assert [chunk async for chunk in stream] == ["bc", "d"]
+
+
+class TestDisconnect:
+    """Tests for client disconnect handling."""
+
+    async def test_detach_releases_queue(self):
+        """Test that disconnect drops queued and new chunks."""
+        generator = StreamingGenerator(max_queue_size=10)
+        generator.add("first")
+        stream, _ = await attach(generator)
+        generator.add("pending")
+
+        await stream.aclose()
+        generator.add("after disconnect")
+
+        assert generator.detached
+        assert generator.queue.qsize() == 0
+        assert generator.dropped == 1
+
+    async def test_detach_wakes_blocked_producer(self):
+        """Test that a producer waiting in drain resumes after
+        disconnect."""
+        generator = StreamingGenerator(max_queue_size=1)
+        generator.add("first")
+        stream, _ = await attach(generator)
+        generator.add("a")
+        drain = asyncio.create_task(generator.drain())
+        await asyncio.sleep(0.01)
+
+        await stream.aclose()
+
+        await asyncio.wait_for(drain, timeout=1)
+
+    async def test_disconnect_callbacks(self):
+        """Test that callbacks run on disconnect and failing ones are
+        ignored."""
+        generator = StreamingGenerator()
+        called = []
+
+        def failing():
+            raise RuntimeError("boom")
+
+        generator.on_disconnect(failing)
+        generator.on_disconnect(lambda: called.append(True))
+        generator.add("first")
+        stream, _ = await attach(generator)
+
+        await stream.aclose()
+
+        assert called == [True]
+
+    async def test_finished_stream_not_detached(self):
+        """Test that reading the stream to the end is not a disconnect."""
+        generator = StreamingGenerator()
+        called = []
+        generator.on_disconnect(lambda: called.append(True))
+        generator.add("data")
+        generator.finish()
+
+        assert [chunk async for chunk in generator.stream()] == ["data"]
+        assert not generator.detached
+        assert called == []
+
+    async def test_detached_chunks_reach_subscribers(self):
+        """Test that chunks after detach, e.g. after clarification, are
+        read through subscribe()."""
+        generator = StreamingGenerator()
+        generator.add("first")
+        stream, _ = await attach(generator)
+        await stream.aclose()
+
+        generator.add("again")
+        generator.finish()
+
+        assert generator.dropped == 1
+        assert [event async for event in generator.subscribe(0)] == ["id: 1\nagain"]
+
+
+class TestStreamMetrics:
+    """Tests for stream queue gauges."""
+
+    async def test_collect_metrics(self):
+        """Test that metrics report depth, drops and disconnects."""
+        disconnects = StreamingGenerator._disconnects_total
+        generator = StreamingGenerator(max_queue_size=1, policy="drop_intermediate")
+        generator.add("first")
+        stream, _ = await attach(generator)
+        generator.add("a", droppable=True)
+        generator.add("b", droppable=True)
+
+        metrics = StreamingGenerator.collect_metrics()
+
+        assert metrics["sgr_stream_queue_depth"][1] >= 1
+        assert metrics["sgr_stream_queue_depth_max"][1] >= 1
+        assert metrics["sgr_stream_dropped_chunks"][1] >= 1
+
+        await stream.aclose()
+        assert StreamingGenerator.collect_metrics()["sgr_stream_disconnects_total"][1] == disconnects + 1
+
+
+@pytest.mark.parametrize("policy", ["block", "drop_intermediate", "coalesce"])
+async def test_all_chunks_delivered_to_fast_client(policy):
+    """Test that a client keeping up receives every chunk in order."""
+    generator = StreamingGenerator(max_queue_size=2, policy=policy)
+
+    async def produce():
+        for i in range(50):
+            generator.add(str(i), droppable=True)
+            await generator.drain()
+            await asyncio.sleep(0)
+        generator.finish()
+
+    producer = asyncio.create_task(produce())
+    received = [chunk async for chunk in generator.stream()]
+    await producer
+
+    if policy == "block":
+        assert received == [str(i) for i in range(50)]
+    else:
+        assert "".join(received).startswith("0")
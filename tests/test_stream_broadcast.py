@@ -0,0 +1,205 @@
+"""Tests for stream fan-out to subscribers.
+
+This module contains tests for the replay ring buffer of
+StreamingGenerator, subscribers with own cursors, Last-Event-ID resume
+and the agent stream endpoint.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from sgr_deep_research.api.endpoints import _cancel_agent, agents_storage, provide_clarification, stream_agent
+from sgr_deep_research.api.models import ClarificationRequest
+from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.stream import StreamingGenerator
+
+
+async def read_all(stream) -> list[str]:
+    return await asyncio.wait_for(collect(stream), timeout=1)
+
+
+async def collect(stream) -> list[str]:
+    return [event async for event in stream]
+
+
+class TestReplay:
+    """Tests for buffered events replay."""
+
+    async def test_subscriber_replays_buffer(self):
+        """Test that a late subscriber receives all buffered events with
+        ids."""
+        generator = StreamingGenerator()
+        generator.add("data: a\n\n")
+        generator.add("data: b\n\n")
+        generator.finish()
+
+        assert await read_all(generator.subscribe()) == ["id: 0\ndata: a\n\n", "id: 1\ndata: b\n\n"]
+
+    async def test_resume_after_last_event_id(self):
+        """Test that resume skips events the client already received."""
+        generator = StreamingGenerator()
+        for data in ["a", "b", "c"]:
+            generator.add(data)
+        generator.finish()
+
+        assert await read_all(generator.subscribe(last_event_id=1)) == ["id: 2\nc"]
+
+    async def test_unknown_event_id_waits_for_next_event(self):
+        """Test that an id beyond the stream starts at live events."""
+        generator = StreamingGenerator()
+        generator.add("a")
+        subscriber = asyncio.create_task(collect(generator.subscribe(last_event_id=100)))
+        await asyncio.sleep(0)
+
+        generator.add("b")
+        generator.finish()
+
+        assert await asyncio.wait_for(subscriber, timeout=1) == ["id: 1\nb"]
+
+    async def test_subscribe_to_finished_stream(self):
+        """Test that subscriber of a finished stream ends after replay."""
+        generator = StreamingGenerator()
+        generator.add("a")
+        generator.finish()
+
+        assert await read_all(generator.subscribe(last_event_id=100)) == []
+        assert await read_all(generator.subscribe()) == ["id: 0\na"]
+
+    async def test_evicted_events_skipped(self):
+        """Test that a subscriber behind the ring buffer continues from
+        the oldest kept event."""
+        generator = StreamingGenerator(replay_buffer_size=2)
+        for data in ["a", "b", "c", "d"]:
+            generator.add(data)
+        generator.finish()
+
+        assert await read_all(generator.subscribe(last_event_id=0)) == ["id: 3\nd"]
+
+    def test_last_event_id(self):
+        """Test that last event id follows added events."""
+        generator = StreamingGenerator()
+        assert generator.last_event_id is None
+
+        generator.add("a")
+        generator.add("b")
+
+        assert generator.last_event_id == 1
+
+
+class TestFanOut:
+    """Tests for several readers of one agent stream."""
+
+    async def test_subscribers_receive_live_events(self):
+        """Test that every subscriber and the client receive all events."""
+        generator = StreamingGenerator()
+        subscribers = [asyncio.create_task(collect(generator.subscribe())) for _ in range(3)]
+        client = asyncio.create_task(collect(generator.stream()))
+        await asyncio.sleep(0)
+        assert generator.subscribers == 3
+
+        for data in ["a", "b"]:
+            generator.add(data)
+            await asyncio.sleep(0)
+        generator.finish()
+
+        results = await asyncio.wait_for(asyncio.gather(*subscribers), timeout=1)
+        assert results == [["id: 0\na", "id: 1\nb"]] * 3
+        assert await client == ["a", "b"]
+        assert generator.subscribers == 0
+
+    async def test_detached_client_still_recorded(self):
+        """Test that events after client disconnect remain available for
+        resume."""
+        generator = StreamingGenerator()
+        generator.add("a")
+        stream = generator.stream()
+        await anext(stream)
+        await stream.aclose()
+
+        generator.add("b")
+        generator.finish()
+
+        assert generator.detached
+        assert await read_all(generator.subscribe(last_event_id=0)) == ["id: 1\nb"]
+
+    async def test_slow_subscriber_does_not_block(self):
+        """Test that producer never waits for subscribers."""
+        generator = StreamingGenerator(max_queue_size=1, replay_buffer_size=2)
+        subscriber = generator.subscribe()
+
+        for i in range(10):
+            generator.add(str(i))
+            await asyncio.wait_for(generator.drain(), timeout=1)
+
+        assert await anext(subscriber) == "id: 8\n8"
+        await subscriber.aclose()
+
+    async def test_subscribers_metric(self):
+        """Test that subscribers are exported as a gauge."""
+        generator = StreamingGenerator()
+        subscriber = asyncio.create_task(collect(generator.subscribe()))
+        await asyncio.sleep(0)
+
+        assert StreamingGenerator.collect_metrics()["sgr_stream_subscribers"][1] >= 1
+
+        generator.finish()
+        await subscriber
+
+
+class TestStreamEndpoint:
+    """Tests for agent stream endpoint."""
+
+    def setup_method(self):
+        agents_storage.clear()
+
+    async def test_unknown_agent(self):
+        """Test that unknown agent returns 404."""
+        with pytest.raises(HTTPException) as exc_info:
+            await stream_agent("missing_agent_id", last_event_id=None)
+
+        assert exc_info.value.status_code == 404
+
+    async def test_resume_from_header(self):
+        """Test that stream starts after Last-Event-ID."""
+        agent = Mock(id="sgr_agent_test", streaming_generator=StreamingGenerator())
+        agent.streaming_generator.add("a")
+        agent.streaming_generator.add("b")
+        agent.streaming_generator.finish()
+        agents_storage[agent.id] = agent
+
+        response = await stream_agent(agent.id, last_event_id=0)
+
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "text/event-stream"
+        assert await read_all(response.body_iterator) == ["id: 1\nb"]
+
+    async def test_clarification_streamed_as_events(self):
+        """Test that events after clarification are served as SSE."""
+        agent = Mock(id="sgr_agent_test", streaming_generator=StreamingGenerator())
+        agent.streaming_generator.add("question")
+
+        async def resume(clarifications):
+            agent.streaming_generator.add(f"got {clarifications}")
+            agent.streaming_generator.finish()
+
+        agent.provide_clarification = AsyncMock(side_effect=resume)
+        agents_storage[agent.id] = agent
+
+        response = await provide_clarification(agent.id, ClarificationRequest(clarifications="answer"))
+
+        assert response.media_type == "text/event-stream"
+        assert await read_all(response.body_iterator) == ["id: 1\ngot answer"]
+
+    def test_observed_agent_not_cancelled(self):
+        """Test that client disconnect does not cancel an observed agent."""
+        agent = Mock(streaming_generator=Mock(subscribers=1))
+        agent._context.state = AgentStatesEnum.RESEARCHING
+        task = Mock()
+
+        _cancel_agent(agent, task)
+
+        task.cancel.assert_not_called()
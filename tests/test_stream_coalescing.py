@@ -0,0 +1,169 @@
+"""Tests for LLM delta coalescing in OpenAIStreamingGenerator.
+
+This module contains tests for merging consecutive text and tool call
+arguments deltas into single SSE events.
+"""
+
+import asyncio
+import json
+
+from pydantic import BaseModel
+
+from sgr_deep_research.core.stream import OpenAIStreamingGenerator
+
+
+class Function(BaseModel):
+    name: str | None = None
+    arguments: str | None = None
+
+
+class ToolCall(BaseModel):
+    index: int = 0
+    id: str | None = None
+    type: str | None = None
+    function: Function | None = None
+
+
+class Delta(BaseModel):
+    role: str | None = None
+    content: str | None = None
+    tool_calls: list[ToolCall] | None = None
+
+
+class Choice(BaseModel):
+    index: int = 0
+    delta: Delta
+    finish_reason: str | None = None
+
+
+class Chunk(BaseModel):
+    id: str = "chatcmpl-test"
+    model: str = "gpt"
+    choices: list[Choice]
+    usage: dict | None = None
+
+
+def text(content: str, finish_reason: str | None = None) -> Chunk:
+    return Chunk(choices=[Choice(delta=Delta(content=content), finish_reason=finish_reason)])
+
+
+def arguments(part: str, tool_call_id: str | None = None, name: str | None = None, index: int = 0) -> Chunk:
+    tool_call = ToolCall(index=index, id=tool_call_id, function=Function(name=name, arguments=part))
+    return Chunk(choices=[Choice(delta=Delta(tool_calls=[tool_call]))])
+
+
+def queued_chunks(generator: OpenAIStreamingGenerator) -> list[dict]:
+    return [
+        json.loads(item[len("data: ") :])
+        for item in generator.queue._queue
+        if item is not None and item != "data: [DONE]\n\n"
+    ]
+
+
+def contents(generator: OpenAIStreamingGenerator) -> list[str]:
+    return [chunk["choices"][0]["delta"]["content"] for chunk in queued_chunks(generator)]
+
+
+class TestCoalescingDisabled:
+    """Tests for default streaming without coalescing."""
+
+    def test_event_per_chunk(self):
+        """Test that every delta is its own event by default."""
+        generator = OpenAIStreamingGenerator(model="test")
+
+        for part in ["a", "b", "c"]:
+            generator.add_chunk(text(part))
+
+        assert contents(generator) == ["a", "b", "c"]
+
+
+class TestTextCoalescing:
+    """Tests for merging text deltas."""
+
+    async def test_deltas_merged_into_one_event(self):
+        """Test that consecutive text deltas become one event."""
+        generator = OpenAIStreamingGenerator(model="test", coalesce_window=10)
+
+        for part in ["Hel", "lo", ", world"]:
+            generator.add_chunk(text(part))
+        assert generator.queue.qsize() == 0
+
+        generator.flush()
+
+        assert contents(generator) == ["Hello, world"]
+        assert queued_chunks(generator)[0]["model"] == "test"
+
+    async def test_window_flushes(self):
+        """Test that pending deltas are sent when the window elapses."""
+        generator = OpenAIStreamingGenerator(coalesce_window=0.01)
+        generator.add_chunk(text("a"))
+        generator.add_chunk(text("b"))
+
+        await asyncio.sleep(0.05)
+
+        assert contents(generator) == ["ab"]
+
+    async def test_byte_threshold_flushes(self):
+        """Test that collected bytes beyond the threshold flush early."""
+        generator = OpenAIStreamingGenerator(coalesce_window=10, coalesce_max_bytes=4)
+
+        for part in ["ab", "cd", "e"]:
+            generator.add_chunk(text(part))
+
+        assert contents(generator) == ["abcd"]
+
+    async def test_finish_reason_chunk_flushes_first(self):
+        """Test that a final delta is sent after pending ones in order."""
+        generator = OpenAIStreamingGenerator(coalesce_window=10)
+        generator.add_chunk(text("a"))
+        generator.add_chunk(text("b"))
+
+        generator.add_chunk(text("c", finish_reason="stop"))
+
+        assert contents(generator) == ["ab", "c"]
+
+    async def test_other_chunks_flush_first(self):
+        """Test that tool results and finish keep order with pending
+        deltas."""
+        generator = OpenAIStreamingGenerator(coalesce_window=10)
+        generator.add_chunk(text("a"))
+        generator.add_chunk_from_str("result")
+        generator.add_chunk(text("b"))
+
+        generator.finish()
+
+        chunks = queued_chunks(generator)
+        assert [chunk["choices"][0]["delta"].get("content") for chunk in chunks] == ["a", "result", "b", None]
+        assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+
+
+class TestToolCallCoalescing:
+    """Tests for merging tool call arguments deltas."""
+
+    async def test_arguments_merged_per_tool_call(self):
+        """Test that arguments of one tool call are merged and a new call
+        starts a new event."""
+        generator = OpenAIStreamingGenerator(coalesce_window=10)
+
+        generator.add_chunk(arguments('{"q', tool_call_id="call_1", name="search"))
+        generator.add_chunk(arguments('": "x"}'))
+        generator.add_chunk(arguments('{"a', tool_call_id="call_2", name="answer", index=1))
+        generator.add_chunk(arguments('": 1}', index=1))
+        generator.flush()
+
+        tool_calls = [chunk["choices"][0]["delta"]["tool_calls"][0] for chunk in queued_chunks(generator)]
+        assert [(call["id"], call["function"]["name"]) for call in tool_calls] == [
+            ("call_1", "search"),
+            ("call_2", "answer"),
+        ]
+        assert [call["function"]["arguments"] for call in tool_calls] == ['{"q": "x"}', '{"a": 1}']
+
+    async def test_text_and_arguments_not_mixed(self):
+        """Test that deltas of different kinds are never merged."""
+        generator = OpenAIStreamingGenerator(coalesce_window=10)
+
+        generator.add_chunk(text("thinking"))
+        generator.add_chunk(arguments("{}", tool_call_id="call_1", name="search"))
+        generator.flush()
+
+        assert generator.queue.qsize() == 2
@@ -581,3 +581,72 @@ class TestOpenAIStreamingGenerator:
         data = json.loads(json_str)
 
         assert len(data["choices"][0]["delta"]["content"]) == 10000
+
+
+class TestChunkSerialization:
+    """Tests for SSE chunks encoded from the cached envelope."""
+
+    @staticmethod
+    def parse(item: str) -> dict:
+        assert item.startswith("data: ") and item.endswith("\n\n")
+        return json.loads(item[len("data: ") :])
+
+    def test_content_chunk_matches_openai_format(self):
+        """Test that content chunk has every field of a full chunk."""
+        generator = OpenAIStreamingGenerator(model="test-model")
+        generator.add_chunk_from_str('he said "привет"\n')
+
+        assert self.parse(generator.queue.get_nowait()) == {
+            "id": generator.id,
+            "object": "chat.completion.chunk",
+            "created": generator.created,
+            "model": "test-model",
+            "system_fingerprint": generator.fingerprint,
+            "choices": [
+                {
+                    "delta": {"content": 'he said "привет"\n', "role": "assistant", "tool_calls": None},
+                    "index": 0,
+                    "finish_reason": None,
+                    "logprobs": None,
+                }
+            ],
+            "usage": None,
+        }
+
+    def test_tool_call_chunk(self):
+        """Test that tool call arguments are encoded as a JSON string."""
+        generator = OpenAIStreamingGenerator()
+        generator.add_tool_call("call_1", "websearchtool", '{"query": "x"}')
+
+        delta = self.parse(generator.queue.get_nowait())["choices"][0]["delta"]
+
+        assert delta["tool_calls"] == [
+            {
+                "index": 0,
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": "websearchtool", "arguments": '{"query": "x"}'},
+            }
+        ]
+
+    def test_finish_chunk_usage(self):
+        """Test that final chunk carries finish reason and usage."""
+        generator = OpenAIStreamingGenerator()
+        usage = {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3}
+        generator.finish(finish_reason="length", usage=usage)
+
+        final = self.parse(generator.queue.get_nowait())
+
+        assert final["choices"] == [{"index": 0, "delta": {}, "logprobs": None, "finish_reason": "length"}]
+        assert final["usage"] == usage
+
+    def test_envelope_follows_model_change(self):
+        """Test that cached envelope is rebuilt when model is changed."""
+        generator = OpenAIStreamingGenerator(model="first")
+        generator.model = "second"
+        generator.add_chunk_from_str("x")
+
+        chunk = self.parse(generator.queue.get_nowait())
+
+        assert chunk["model"] == "second"
+        assert chunk["system_fingerprint"] == generator.fingerprint == f"fp_{hex(hash('second'))[-8:]}"
@@ -0,0 +1,182 @@
+"""Tests for agent loop latency instrumentation.
+
+This module contains tests for timing hooks, per-iteration timings in
+the agent log and Prometheus text exposition of metrics.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sgr_deep_research.api.endpoints import get_metrics
+from sgr_deep_research.core import timing
+from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.timing import TimingHook
+from sgr_deep_research.services.metrics import Histogram, MetricsRegistry
+
+
+class RecordingHook(TimingHook):
+    def __init__(self):
+        self.events = []
+
+    def on_first_token(self, agent, phase, seconds):
+        self.events.append(("first_token", phase))
+
+    def on_phase(self, agent, phase, seconds, tool_name=None):
+        self.events.append(("phase", phase, tool_name))
+
+    def on_tool(self, agent, tool_name, seconds):
+        self.events.append(("tool", tool_name))
+
+    def on_iteration(self, agent, timings):
+        self.events.append(("iteration", timings["iteration"]))
+
+
+class FailingHook(TimingHook):
+    def on_phase(self, agent, phase, seconds, tool_name=None):
+        raise RuntimeError("broken hook")
+
+
+class OneStepAgent(BaseAgent):
+    """Agent finishing after a single iteration without LLM calls."""
+
+    name = "one_step_agent"
+
+    async def _reasoning_phase(self):
+        return None
+
+    async def _select_action_phase(self, reasoning):
+        return SimpleNamespace(tool_name="final_answer_tool")
+
+    async def _action_phase(self, tool):
+        self._context.state = AgentStatesEnum.COMPLETED
+        return "done"
+
+
+@pytest.fixture
+def hook():
+    """Register recording hook for a single test."""
+    recording_hook = RecordingHook()
+    timing.register_timing_hook(recording_hook)
+    yield recording_hook
+    timing.timing_hooks.remove(recording_hook)
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observe_and_render(self):
+        """Test cumulative buckets, sum and count in exposition."""
+        histogram = Histogram("test_seconds", "Test histogram", ("phase",), buckets=(0.1, 1.0))
+
+        histogram.observe(0.05, phase="a")
+        histogram.observe(0.5, phase="a")
+        histogram.observe(5, phase="a")
+        lines = histogram.render()
+
+        assert "# TYPE test_seconds histogram" in lines
+        assert 'test_seconds_bucket{phase="a",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{phase="a",le="1.0"} 2' in lines
+        assert 'test_seconds_bucket{phase="a",le="+Inf"} 3' in lines
+        assert 'test_seconds_count{phase="a"} 3' in lines
+        assert histogram.count(phase="a") == 3
+
+    def test_label_values_escaped(self):
+        """Test that quotes in label values do not break the format."""
+        histogram = Histogram("test_seconds", "Test histogram", ("tool",), buckets=(1.0,))
+
+        histogram.observe(0.5, tool='say "hi"')
+
+        assert 'test_seconds_count{tool="say \\"hi\\""} 1' in histogram.render()
+
+
+class TestAgentTimings:
+    """Tests for timings collected by BaseAgent.execute."""
+
+    async def test_iteration_timings_reported(self, hook, tmp_path, monkeypatch):
+        """Test that every phase and iteration reach the hooks."""
+        monkeypatch.chdir(tmp_path)
+        agent = OneStepAgent(task="Test")
+
+        await agent.execute()
+
+        assert hook.events == [
+            ("phase", "reasoning", None),
+            ("phase", "select_action", None),
+            ("tool", "final_answer_tool"),
+            ("phase", "tool", "final_answer_tool"),
+            ("iteration", 1),
+        ]
+        assert agent.timings[0]["tool_name"] == "final_answer_tool"
+        assert agent.timings[0]["total"] >= agent.timings[0]["tool"]
+
+    async def test_timings_saved_in_agent_log(self, tmp_path, monkeypatch):
+        """Test that the agent log summary contains per-iteration timings."""
+        monkeypatch.chdir(tmp_path)
+        agent = OneStepAgent(task="Test")
+
+        await agent.execute()
+
+        log_file = next((tmp_path / "logs").glob("*-log.jsonl"))
+        saved = json.loads(log_file.read_text(encoding="utf-8").splitlines()[-1])
+        assert set(saved["timings"][0]) >= {"iteration", "reasoning", "select_action", "tool", "total", "ttft"}
+
+    async def test_failing_hook_does_not_break_agent(self, tmp_path, monkeypatch):
+        """Test that hook errors are swallowed."""
+        monkeypatch.chdir(tmp_path)
+        failing_hook = FailingHook()
+        timing.register_timing_hook(failing_hook)
+        try:
+            agent = OneStepAgent(task="Test")
+            await agent.execute()
+        finally:
+            timing.timing_hooks.remove(failing_hook)
+
+        assert agent._context.state == AgentStatesEnum.COMPLETED
+
+    async def test_time_to_first_token_recorded(self, hook):
+        """Test that first streamed event reports TTFT for current
+        phase."""
+        stream = MagicMock()
+        stream.__aiter__.return_value = iter(["event1", "event2"])
+        stream.get_final_completion = AsyncMock(return_value=SimpleNamespace(usage=None))
+        stream_manager = MagicMock()
+        stream_manager.__aenter__ = AsyncMock(return_value=stream)
+        stream_manager.__aexit__ = AsyncMock(return_value=None)
+        client = MagicMock()
+        client.chat.completions.stream.return_value = stream_manager
+        agent = OneStepAgent(task="Test", openai_client=client)
+        agent._phase = "reasoning"
+
+        async with agent._stream_completion(messages=[]) as timed_stream:
+            events = [event async for event in timed_stream]
+
+        assert events == ["event1", "event2"]
+        assert hook.events == [("first_token", "reasoning")]
+        assert len(agent._iteration_timings["ttft"]["reasoning"]) == 1
+
+
+class TestMetricsEndpoint:
+    """Tests for /metrics endpoint."""
+
+    async def test_metrics_exposition(self, tmp_path, monkeypatch):
+        """Test that agent histograms and scheduler gauges are exported."""
+        monkeypatch.chdir(tmp_path)
+        await OneStepAgent(task="Test").execute()
+
+        response = await get_metrics()
+        body = response.body.decode()
+
+        assert response.media_type.startswith("text/plain")
+        assert 'sgr_tool_duration_seconds_count{tool="final_answer_tool"}' in body
+        assert 'sgr_agent_phase_seconds_bucket{agent="one_step_agent",phase="reasoning",le="+Inf"}' in body
+        assert "sgr_scheduler_queued_agents 0" in body
+
+    def test_registry_histogram_reused(self):
+        """Test that histograms are registered once by name."""
+        first = MetricsRegistry.histogram("test_registry_seconds", "Test")
+
+        assert MetricsRegistry.histogram("test_registry_seconds", "Test") is first
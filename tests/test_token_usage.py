@@ -0,0 +1,136 @@
+"""Tests for token usage accounting.
+
+This module contains tests for per-phase usage in ResearchContext,
+usage recording from completion streams and usage in the final SSE
+chunk and agent state.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sgr_deep_research.api.endpoints import agents_storage, get_agent_state
+from sgr_deep_research.core.agents import SGRAgent
+from sgr_deep_research.core.models import ResearchContext, TokenUsage
+from sgr_deep_research.core.stream import OpenAIStreamingGenerator
+
+
+def make_client(prompt_tokens: int, completion_tokens: int) -> MagicMock:
+    """OpenAI client mock whose stream reports given usage."""
+    usage = SimpleNamespace(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
+    stream = MagicMock()
+    stream.get_final_completion = AsyncMock(return_value=SimpleNamespace(usage=usage))
+    stream_manager = MagicMock()
+    stream_manager.__aenter__ = AsyncMock(return_value=stream)
+    stream_manager.__aexit__ = AsyncMock(return_value=None)
+    client = MagicMock()
+    client.chat.completions.stream.return_value = stream_manager
+    return client
+
+
+class TestResearchContextUsage:
+    """Tests for usage counters in ResearchContext."""
+
+    def test_add_usage_accumulates_per_phase(self):
+        """Test that usage is summed per phase and in total."""
+        context = ResearchContext()
+
+        context.add_usage("reasoning", TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15))
+        context.add_usage("reasoning", TokenUsage(prompt_tokens=20, completion_tokens=5, total_tokens=25))
+        context.add_usage("select_action", TokenUsage(prompt_tokens=7, completion_tokens=3, total_tokens=10))
+
+        assert context.usage.total_tokens == 50
+        assert context.usage_by_phase["reasoning"].prompt_tokens == 30
+        assert context.usage_by_phase["select_action"].completion_tokens == 3
+
+    def test_agent_state_includes_usage(self):
+        """Test that usage is part of agent_state output."""
+        context = ResearchContext()
+        context.add_usage("tool", TokenUsage(total_tokens=3))
+
+        state = context.agent_state()
+
+        assert state["usage"]["total_tokens"] == 3
+        assert state["usage_by_phase"]["tool"]["total_tokens"] == 3
+
+
+class TestStreamCompletionUsage:
+    """Tests for usage recording in BaseAgent._stream_completion."""
+
+    async def test_usage_recorded_for_current_phase(self):
+        """Test that reported usage goes to the phase being executed."""
+        agent = SGRAgent(task="Test", openai_client=make_client(100, 20))
+        agent._phase = "select_action"
+
+        async with agent._stream_completion(messages=[]):
+            pass
+
+        assert agent._context.usage.total_tokens == 120
+        assert agent._context.usage_by_phase["select_action"].prompt_tokens == 100
+
+    async def test_include_usage_requested(self):
+        """Test that stream asks provider to report usage."""
+        client = make_client(1, 1)
+        agent = SGRAgent(task="Test", openai_client=client)
+
+        async with agent._stream_completion(messages=[]):
+            pass
+
+        assert client.chat.completions.stream.call_args.kwargs["stream_options"] == {"include_usage": True}
+
+    async def test_missing_usage_ignored(self):
+        """Test that providers without usage do not break accounting."""
+        client = make_client(1, 1)
+        stream = client.chat.completions.stream.return_value.__aenter__.return_value
+        stream.get_final_completion.return_value = SimpleNamespace(usage=None)
+        agent = SGRAgent(task="Test", openai_client=client)
+
+        async with agent._stream_completion(messages=[]):
+            pass
+
+        assert agent._context.usage.total_tokens == 0
+
+
+class TestStreamingUsage:
+    """Tests for usage in OpenAIStreamingGenerator."""
+
+    async def test_finish_reports_usage(self):
+        """Test that final chunk carries aggregated usage."""
+        generator = OpenAIStreamingGenerator()
+        usage = {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12}
+        generator.finish(usage=usage)
+
+        items = [item async for item in generator.stream()]
+
+        assert json.loads(items[-2][6:])["usage"] == usage
+
+    async def test_usage_only_chunk_skipped(self):
+        """Test that intermediate usage-only chunks are not forwarded."""
+        generator = OpenAIStreamingGenerator()
+        generator.add_chunk(SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=1)))
+        generator.finish()
+
+        items = [item async for item in generator.stream()]
+
+        assert len(items) == 2
+
+
+class TestAgentStateUsage:
+    """Tests for usage in /agents/{id}/state."""
+
+    async def test_state_exposes_usage(self):
+        """Test that agent state response includes usage counters."""
+        agents_storage.clear()
+        agent = SGRAgent(task="Test")
+        agent._context.add_usage("reasoning", TokenUsage(prompt_tokens=4, completion_tokens=1, total_tokens=5))
+        agents_storage[agent.id] = agent
+
+        response = await get_agent_state(agent.id)
+
+        assert response.usage == {"prompt_tokens": 4, "completion_tokens": 1, "total_tokens": 5}
+        assert response.usage_by_phase["reasoning"]["total_tokens"] == 5
+        agents_storage.clear()
@@ -0,0 +1,142 @@
+"""Tests for memoized tool schemas.
+
+This module contains tests for function tool params and NextStepTools
+models built once per tool combination and for the registry of dynamic
+discriminant models.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sgr_deep_research.core.agents import SGRToolCallingAgent
+from sgr_deep_research.core.tool_schemas import SCHEMA_CACHE_SIZE, _build_function_tools, function_tools
+from sgr_deep_research.core.tools import FinalAnswerTool, NextStepToolsBuilder, ReasoningTool, WebSearchTool
+
+
+@pytest.fixture
+def function_tool():
+    """Patch pydantic_function_tool with a counting fake."""
+    fake = Mock(side_effect=lambda tool, name, description: {"type": "function", "function": {"name": name}})
+    with patch("sgr_deep_research.core.tool_schemas.pydantic_function_tool", fake):
+        yield fake
+
+
+class TestFunctionTools:
+    """Tests for memoized function tool params."""
+
+    def test_schemas_built_once(self, function_tool):
+        """Test that repeated calls reuse prebuilt params."""
+        tools = [ReasoningTool, WebSearchTool, FinalAnswerTool]
+
+        first = function_tools(tools)
+        second = function_tools(list(tools))
+
+        assert function_tool.call_count == 3
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_order_preserved(self, function_tool):
+        """Test that params follow requested tool order."""
+        names = [param["function"]["name"] for param in function_tools([WebSearchTool, ReasoningTool])]
+
+        assert names == [WebSearchTool.tool_name, ReasoningTool.tool_name]
+
+    def test_returned_list_is_a_copy(self, function_tool):
+        """Test that callers cannot change cached params list."""
+        function_tools([ReasoningTool]).append("extra")
+
+        assert len(function_tools([ReasoningTool])) == 1
+
+    def test_cache_is_bounded(self):
+        """Test that the cache is LRU with bounded size."""
+        assert _build_function_tools.cache_info().maxsize == SCHEMA_CACHE_SIZE
+
+    async def test_prepare_tools_reuses_schemas(self, function_tool):
+        """Test that agent iterations do not regenerate schemas."""
+        agent = SGRToolCallingAgent(task="Test")
+        agent.toolkit = [ReasoningTool, WebSearchTool, FinalAnswerTool]
+
+        for iteration in range(5):
+            agent._context.iteration = iteration
+            await agent._prepare_tools()
+
+        assert function_tool.call_count == 3
+
+
+class TestNextStepToolsCache:
+    """Tests for memoized NextStepTools models."""
+
+    def test_same_tools_same_model(self):
+        """Test that model is created once per tool combination."""
+        first = NextStepToolsBuilder.build_NextStepTools([WebSearchTool, FinalAnswerTool])
+        second = NextStepToolsBuilder.build_NextStepTools([WebSearchTool, FinalAnswerTool])
+
+        assert first is second
+
+    def test_different_tools_different_model(self):
+        """Test that other tool combinations get their own model."""
+        first = NextStepToolsBuilder.build_NextStepTools([WebSearchTool, FinalAnswerTool])
+        second = NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool])
+
+        assert first is not second
+        assert "websearchtool" not in str(second.model_json_schema())
+
+    def test_cached_model_parses(self):
+        """Test that reused model still validates tool calls."""
+        model = NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool])
+        NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool])
+
+        parsed = model.model_validate(
+            {
+                "reasoning_steps": ["a", "b"],
+                "current_situation": "done",
+                "plan_status": "done",
+                "enough_data": True,
+                "remaining_steps": ["finish"],
+                "task_completed": True,
+                "function": {
+                    "tool_name_discriminator": "finalanswertool",
+                    "reasoning": "r",
+                    "completed_steps": ["done"],
+                    "answer": "42",
+                    "status": "completed",
+                },
+            }
+        )
+
+        assert isinstance(parsed.function, FinalAnswerTool)
+
+
+class TestDynamicModelRegistry:
+    """Tests for discriminant models and unions shared across agents."""
+
+    def test_discriminant_model_registered_once(self):
+        """Test that every tool class gets a single discriminant model."""
+        first = NextStepToolsBuilder._create_discriminant_tool(WebSearchTool)
+
+        assert NextStepToolsBuilder._create_discriminant_tool(WebSearchTool) is first
+        assert issubclass(first, WebSearchTool)
+
+    def test_discriminant_models_shared_between_subsets(self):
+        """Test that different subsets reuse the same per-tool models."""
+        NextStepToolsBuilder.build_NextStepTools([WebSearchTool, FinalAnswerTool])
+        NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool, ReasoningTool])
+
+        assert set(NextStepToolsBuilder._discriminant_tools) == {WebSearchTool, FinalAnswerTool, ReasoningTool}
+        assert len(NextStepToolsBuilder._tool_unions) == 2
+
+    def test_union_reused_after_model_cache_eviction(self):
+        """Test that unions survive eviction of NextStepTools models."""
+        union = NextStepToolsBuilder._create_tool_types_union([WebSearchTool, FinalAnswerTool])
+        NextStepToolsBuilder._build_NextStepTools.cache_clear()
+
+        assert NextStepToolsBuilder._create_tool_types_union([WebSearchTool, FinalAnswerTool]) is union
+
+    def test_clear_registry(self):
+        """Test that registry can be reset after tools were rebuilt."""
+        first = NextStepToolsBuilder._create_discriminant_tool(WebSearchTool)
+
+        NextStepToolsBuilder.clear_registry()
+
+        assert NextStepToolsBuilder._create_discriminant_tool(WebSearchTool) is not first